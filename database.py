@@ -21,11 +21,17 @@ limitations under the License.
 """
 
 import json
+import logging
 import os
+import queue
+import threading
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
 from models import Task, SubTask, ExplorationNote, ExplorationNoteSearchResult, TaskStatus, TaskMode, TaskKnowledge
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
 
 class Database:
     """JSON文件数据库管理器"""
@@ -33,7 +39,22 @@ class Database:
     def __init__(self, db_path: str = "research_data.json"):
         self.db_path = db_path
         self.tasks: list[Task] = []
+        # 任务 ID 索引：get_task 直接查表，只在任务增删时维护
+        self._tasks_by_id: dict[str, Task] = {}
+        # 数据版本号：每次保存递增，界面可据此判断数据是否变化
+        self.revision = 0
+        # get_other_tasks 的结果缓存：exclude_id -> [(id, 标题)]
+        self._other_tasks_cache: dict[str, list[tuple[str, str]]] = {}
         self._load()
+
+        # 后台写盘线程：快照在调用线程生成，写文件按提交顺序串行执行
+        # 最近一次写盘失败的异常，由界面线程通过 take_write_error / flush / close 取走并提示
+        self.write_error: Optional[Exception] = None
+        # 写盘失败时在写盘线程中调用的回调，界面应通过 after(0, ...) 转回主线程处理
+        self.on_write_error: Optional[Callable[[Exception], None]] = None
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="db-writer", daemon=True)
+        self._writer.start()
     
     def _load(self) -> None:
         """从文件加载数据"""
@@ -46,15 +67,88 @@ class Database:
                 self.tasks = []
         else:
             self.tasks = []
+        self._tasks_by_id = {t.id: t for t in self.tasks}
     
     def _save(self) -> None:
-        """保存数据到文件"""
+        """保存数据到文件（生成快照后交给后台线程写盘，不阻塞界面）"""
+        self.revision += 1
+        self._other_tasks_cache.clear()
         data = {
             'tasks': [self._task_to_dict(t) for t in self.tasks],
             'last_updated': datetime.now().isoformat()
         }
+        self._write_queue.put(data)
+
+    def _write_loop(self) -> None:
+        """后台线程：把快照写入文件，收到 None 时退出
+
+        排队中的多个快照只需写入最新的一个，较早的快照直接丢弃，
+        连续快速的操作因此只产生一次文件写入。
+        """
+        while True:
+            data = self._write_queue.get()
+            taken = 1
+            stop = data is None
+            while not stop:
+                try:
+                    newer = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                taken += 1
+                if newer is None:
+                    stop = True
+                else:
+                    data = newer
+            try:
+                if data is not None:
+                    self._write_file(data)
+            except Exception as e:
+                # 不能让异常结束写盘线程，否则之后的保存只会一直排队
+                logger.exception("写入数据文件失败：%s", self.db_path)
+                self.write_error = e
+                self._notify_write_error(e)
+            finally:
+                for _ in range(taken):
+                    self._write_queue.task_done()
+            if stop:
+                return
+
+    def _write_file(self, data: dict) -> None:
+        """将快照写入文件"""
         with open(self.db_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def _notify_write_error(self, error: Exception) -> None:
+        """在写盘线程中通知写盘失败；回调本身出错不能影响写盘线程"""
+        callback = self.on_write_error
+        if callback is None:
+            return
+        try:
+            callback(error)
+        except Exception:
+            logger.exception("写盘失败回调出错")
+
+    def take_write_error(self) -> Optional[Exception]:
+        """取走尚未提示过的写盘异常；没有时返回 None"""
+        error, self.write_error = self.write_error, None
+        return error
+
+    def _raise_write_error(self) -> None:
+        error = self.take_write_error()
+        if error is not None:
+            raise error
+
+    def flush(self) -> None:
+        """等待所有已提交的写入完成；写盘失败时抛出该异常"""
+        self._write_queue.join()
+        self._raise_write_error()
+
+    def close(self) -> None:
+        """写完剩余数据并停止后台线程；写盘失败时抛出该异常"""
+        if self._writer.is_alive():
+            self._write_queue.put(None)
+            self._writer.join()
+        self._raise_write_error()
     
     def _task_to_dict(self, task: Task) -> dict:
         """将任务对象转换为字典"""
@@ -94,31 +188,15 @@ class Database:
             'updated_at': task.updated_at.isoformat(),
             'completed_at': task.completed_at.isoformat() if task.completed_at else None,
             'priority': task.priority,
-            'tags': task.tags,
+            'tags': list(task.tags),
             'conclusion': task.conclusion
         }
     
     def _dict_to_task(self, data: dict, default_order: int) -> Task:
         """将字典转换为任务对象"""
-        task = Task(
-            id=data['id'],
-            title=data['title'],
-            description=data.get('description', ''),
-            order=data.get('order', default_order),
-            status=TaskStatus[data['status']],
-            mode=TaskMode[data['mode']],
-            knowledge=TaskKnowledge[data['knowledge']],
-            created_at=datetime.fromisoformat(data['created_at']),
-            updated_at=datetime.fromisoformat(data['updated_at']),
-            completed_at=datetime.fromisoformat(data['completed_at']) if data.get('completed_at') else None,
-            priority=data.get('priority', 0),
-            tags=data.get('tags', []),
-            conclusion=data.get('conclusion', '')
-        )
-        
-        # 加载子任务
-        for st_data in data.get('subtasks', []):
-            subtask = SubTask(
+        # 加载子任务（随构造传入，由 Task 建立子任务索引）
+        subtasks = [
+            SubTask(
                 id=st_data['id'],
                 title=st_data['title'],
                 description=st_data.get('description', ''),
@@ -128,11 +206,16 @@ class Database:
                 completed_at=datetime.fromisoformat(st_data['completed_at']) if st_data.get('completed_at') else None,
                 notes=st_data.get('notes', '')
             )
-            task.subtasks.append(subtask)
-        
-        # 加载探索笔记
-        for note_data in data.get('exploration_notes', []):
-            note = ExplorationNote(
+            for st_data in data.get('subtasks', [])
+        ]
+
+        # 加载探索笔记；兼容旧数据：将exploration_history合并到exploration_notes
+        notes_data = data.get('exploration_notes', [])
+        history_data = data.get('exploration_history')
+        if history_data:
+            notes_data = notes_data + history_data
+        exploration_notes = [
+            ExplorationNote(
                 id=note_data['id'],
                 content=note_data['content'],
                 insight=note_data.get('insight', ''),
@@ -140,23 +223,26 @@ class Database:
                 updated_at=datetime.fromisoformat(note_data.get('updated_at', note_data['created_at'])),
                 is_breakthrough=note_data.get('is_breakthrough', False)
             )
-            task.exploration_notes.append(note)
+            for note_data in notes_data
+        ]
 
-        # 兼容旧数据：将exploration_history合并到exploration_notes
-        history_data = data.get('exploration_history')
-        if history_data:
-            for note_data in history_data:
-                note = ExplorationNote(
-                    id=note_data['id'],
-                    content=note_data['content'],
-                    insight=note_data.get('insight', ''),
-                    created_at=datetime.fromisoformat(note_data['created_at']),
-                    updated_at=datetime.fromisoformat(note_data.get('updated_at', note_data['created_at'])),
-                    is_breakthrough=note_data.get('is_breakthrough', False)
-                )
-                task.exploration_notes.append(note)
-        
-        return task
+        return Task(
+            id=data['id'],
+            title=data['title'],
+            description=data.get('description', ''),
+            order=data.get('order', default_order),
+            status=TaskStatus[data['status']],
+            mode=TaskMode[data['mode']],
+            knowledge=TaskKnowledge[data['knowledge']],
+            created_at=datetime.fromisoformat(data['created_at']),
+            updated_at=datetime.fromisoformat(data['updated_at']),
+            completed_at=datetime.fromisoformat(data['completed_at']) if data.get('completed_at') else None,
+            priority=data.get('priority', 0),
+            subtasks=subtasks,
+            exploration_notes=exploration_notes,
+            tags=data.get('tags', []),
+            conclusion=data.get('conclusion', '')
+        )
     
     # ==================== CRUD 操作 ====================
     
@@ -172,23 +258,32 @@ class Database:
             mode=mode,
             knowledge=knowledge,
             priority=priority,
-            status=TaskStatus.EXPLORING if mode == TaskMode.EXPLORING else TaskStatus.PENDING
+            status=TaskStatus.EXPLORING if mode is TaskMode.EXPLORING else TaskStatus.PENDING
         )
         self.tasks.append(task)
+        self._tasks_by_id[task.id] = task
         self._save()
         return task
     
     def get_task(self, task_id: str) -> Optional[Task]:
         """根据ID获取任务"""
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._tasks_by_id.get(task_id)
     
     def get_all_tasks(self) -> list[Task]:
         """获取所有任务"""
         return self.tasks.copy()
     
+    def get_other_tasks(self, exclude_id: str) -> list[tuple[str, str]]:
+        """获取除指定任务外的所有任务 (id, 标题)，用于目标任务选择列表
+
+        结果按 exclude_id 缓存，任何保存都会使缓存失效；返回的列表为共享缓存，调用方不应修改。
+        """
+        cached = self._other_tasks_cache.get(exclude_id)
+        if cached is None:
+            cached = [(t.id, t.title) for t in self.tasks if t.id != exclude_id]
+            self._other_tasks_cache[exclude_id] = cached
+        return cached
+    
     def get_tasks_by_status(self, status: TaskStatus) -> list[Task]:
         """根据状态筛选任务"""
         return [t for t in self.tasks if t.status == status]
@@ -213,6 +308,7 @@ class Database:
         for i, task in enumerate(self.tasks):
             if task.id == task_id:
                 self.tasks.pop(i)
+                del self._tasks_by_id[task_id]
                 self._save()
                 return True
         return False
@@ -224,7 +320,7 @@ class Database:
         task = self.get_task(task_id)
         if task:
             subtask = task.add_subtask(title, description)
-            if task.status == TaskStatus.COMPLETED:
+            if task.status is TaskStatus.COMPLETED:
                 task.status = TaskStatus.IN_PROGRESS
                 task.completed_at = None
             self._save()
@@ -235,33 +331,29 @@ class Database:
         """更新子任务"""
         task = self.get_task(task_id)
         if task:
-            for st in task.subtasks:
-                if st.id == subtask_id:
-                    for key, value in kwargs.items():
-                        if hasattr(st, key):
-                            setattr(st, key, value)
-                    task.updated_at = datetime.now()
-                    if task.status == TaskStatus.COMPLETED:
-                        has_incomplete = any(s.status != TaskStatus.COMPLETED for s in task.subtasks)
-                        if has_incomplete:
-                            task.status = TaskStatus.IN_PROGRESS
-                            task.completed_at = None
-                    self._save()
-                    return st
+            st = task.get_subtask(subtask_id)
+            if st:
+                for key, value in kwargs.items():
+                    if hasattr(st, key):
+                        setattr(st, key, value)
+                if 'status' in kwargs:
+                    task.reindex_subtasks()
+                task.updated_at = datetime.now()
+                if task.status is TaskStatus.COMPLETED:
+                    has_incomplete = task.get_completed_count() < len(task.subtasks)
+                    if has_incomplete:
+                        task.status = TaskStatus.IN_PROGRESS
+                        task.completed_at = None
+                self._save()
+                return st
         return None
     
     def delete_subtask(self, task_id: str, subtask_id: str) -> bool:
         """删除子任务"""
         task = self.get_task(task_id)
-        if task:
-            for i, st in enumerate(task.subtasks):
-                if st.id == subtask_id:
-                    task.subtasks.pop(i)
-                    for j, remaining in enumerate(task.subtasks):
-                        remaining.order = j
-                    task.updated_at = datetime.now()
-                    self._save()
-                    return True
+        if task and task.remove_subtask(subtask_id):
+            self._save()
+            return True
         return False
 
     def move_subtask(self, task_id: str, subtask_id: str, direction: int) -> bool:
@@ -304,6 +396,43 @@ class Database:
             return True
         return False
     
+    def reorder_task(self, task_id: str, offset: int) -> bool:
+        """将任务移动 offset 个位置（负数向前），超出范围时停在首尾，只保存一次"""
+        for current_index, t in enumerate(self.tasks):
+            if t.id == task_id:
+                break
+        else:
+            return False
+        new_index = min(max(current_index + offset, 0), len(self.tasks) - 1)
+        if new_index == current_index:
+            return False
+        self.tasks.insert(new_index, self.tasks.pop(current_index))
+        for i, t in enumerate(self.tasks):
+            t.order = i
+        self._save()
+        return True
+
+    def reorder_subtask(self, task_id: str, subtask_id: str, offset: int) -> bool:
+        """将子任务移动 offset 个位置（负数向前），超出范围时停在首尾，只保存一次"""
+        task = self.get_task(task_id)
+        if not task:
+            return False
+        ordered = sorted(task.subtasks, key=lambda x: x.order)
+        for current_index, st in enumerate(ordered):
+            if st.id == subtask_id:
+                break
+        else:
+            return False
+        new_index = min(max(current_index + offset, 0), len(ordered) - 1)
+        if new_index == current_index:
+            return False
+        ordered.insert(new_index, ordered.pop(current_index))
+        for i, st in enumerate(ordered):
+            st.order = i
+        task.updated_at = datetime.now()
+        self._save()
+        return True
+    
     def complete_subtask(self, task_id: str, subtask_id: str) -> bool:
         """完成子任务"""
         task = self.get_task(task_id)
@@ -329,42 +458,33 @@ class Database:
     def delete_exploration_note(self, task_id: str, note_id: str) -> bool:
         """删除探索笔记"""
         task = self.get_task(task_id)
-        if task:
-            for i, note in enumerate(task.exploration_notes):
-                if note.id == note_id:
-                    task.exploration_notes.pop(i)
-                    task.updated_at = datetime.now()
-                    self._save()
-                    return True
+        if task and task.remove_exploration_note(note_id):
+            self._save()
+            return True
         return False
 
     def update_exploration_note(self, task_id: str, note_id: str, **kwargs) -> Optional[ExplorationNote]:
         """更新探索笔记"""
         task = self.get_task(task_id)
-        if task:
-            for note in task.exploration_notes:
-                if note.id == note_id:
-                    for key, value in kwargs.items():
-                        if hasattr(note, key):
-                            setattr(note, key, value)
-                    note.updated_at = datetime.now()  # 更新修改时间
-                    task.updated_at = datetime.now()
-                    self._save()
-                    return note
+        note = task.get_exploration_note(note_id) if task else None
+        if note:
+            for key, value in kwargs.items():
+                if hasattr(note, key):
+                    setattr(note, key, value)
+            now = datetime.now()
+            note.updated_at = now  # 更新修改时间
+            task.updated_at = now
+            self._save()
+            return note
         return None
 
     def move_exploration_note_order(self, task_id: str, note_id: str, direction: int) -> bool:
         """移动探索笔记顺序 (direction: -1向上, 1向下)"""
         task = self.get_task(task_id)
-        if not task:
-            return False
-        current_index = None
-        for i, note in enumerate(task.exploration_notes):
-            if note.id == note_id:
-                current_index = i
-                break
-        if current_index is None:
+        note = task.get_exploration_note(note_id) if task else None
+        if not note:
             return False
+        current_index = task.exploration_notes.index(note)
         new_index = current_index + direction
         if 0 <= new_index < len(task.exploration_notes):
             task.exploration_notes[current_index], task.exploration_notes[new_index] = (
@@ -376,6 +496,22 @@ class Database:
             return True
         return False
     
+    def set_exploration_note_order(self, task_id: str, note_id: str, new_index: int) -> bool:
+        """将探索笔记直接移到 new_index 位置（超出范围时停在首尾），只保存一次"""
+        task = self.get_task(task_id)
+        note = task.get_exploration_note(note_id) if task else None
+        if not note:
+            return False
+        notes = task.exploration_notes
+        current_index = notes.index(note)
+        new_index = min(max(new_index, 0), len(notes) - 1)
+        if new_index == current_index:
+            return False
+        notes.insert(new_index, notes.pop(current_index))
+        task.updated_at = datetime.now()
+        self._save()
+        return True
+
     # ==================== 模式切换 ====================
     
     def switch_task_mode(self, task_id: str, to_exploring: bool = True) -> Optional[Task]:
@@ -398,6 +534,15 @@ class Database:
             self._save()
         return task
 
+    def finish_exploration(self, task_id: str, solution: str) -> Optional[Task]:
+        """记录解决方案并切换到规划模式（一次写盘）"""
+        task = self.get_task(task_id)
+        if task:
+            task.conclusion = solution
+            task.switch_to_planning()
+            self._save()
+        return task
+
     def clear_task_conclusion(self, task_id: str) -> Optional[Task]:
         """清除任务结论"""
         task = self.get_task(task_id)
@@ -461,21 +606,17 @@ class Database:
             return False
 
         # 查找并移除笔记
-        note_to_move = None
-        for i, note in enumerate(source_task.exploration_notes):
-            if note.id == note_id:
-                note_to_move = source_task.exploration_notes.pop(i)
-                break
-
+        note_to_move = source_task.remove_exploration_note(note_id)
         if not note_to_move:
             return False
 
         # 添加到目标任务
-        target_task.exploration_notes.append(note_to_move)
+        target_task.append_exploration_note(note_to_move)
 
         # 更新时间戳
-        source_task.updated_at = datetime.now()
-        target_task.updated_at = datetime.now()
+        now = datetime.now()
+        source_task.updated_at = now
+        target_task.updated_at = now
 
         self._save()
         return True
@@ -491,6 +632,7 @@ class Database:
         task.exploration_notes = [note for note in task.exploration_notes if note.id not in note_ids_set]
         if len(task.exploration_notes) == before:
             return False
+        task.reindex_notes()
 
         task.updated_at = datetime.now()
         self._save()
@@ -513,16 +655,23 @@ class Database:
         source_task.exploration_notes = [
             note for note in source_task.exploration_notes if note.id not in note_ids_set
         ]
-        target_task.exploration_notes.extend(notes_to_move)
+        source_task.reindex_notes()
+        for note in notes_to_move:
+            target_task.append_exploration_note(note)
 
-        source_task.updated_at = datetime.now()
-        target_task.updated_at = datetime.now()
+        now = datetime.now()
+        source_task.updated_at = now
+        target_task.updated_at = now
 
         self._save()
         return True
 
-    def copy_exploration_note(self, source_task_id: str, target_task_id: str, note_id: str) -> Optional[ExplorationNote]:
-        """将探索笔记复制到另一个任务"""
+    def copy_exploration_note(self, source_task_id: str, target_task_id: str,
+                              note_id: str) -> Optional[tuple[ExplorationNote, Task]]:
+        """将探索笔记复制到另一个任务
+
+        返回 (新笔记, 来源任务)，调用方无需再查询一次来源任务；失败时返回 None。
+        """
         source_task = self.get_task(source_task_id)
         target_task = self.get_task(target_task_id)
 
@@ -530,28 +679,26 @@ class Database:
             return None
 
         # 查找笔记
-        source_note = None
-        for note in source_task.exploration_notes:
-            if note.id == note_id:
-                source_note = note
-                break
-
+        source_note = source_task.get_exploration_note(note_id)
         if not source_note:
             return None
 
         # 创建新笔记（使用新ID）
+        now = datetime.now()
         new_note = ExplorationNote(
             content=source_note.content,
             insight=source_note.insight,
+            created_at=now,
+            updated_at=now,
             is_breakthrough=source_note.is_breakthrough
         )
 
         # 添加到目标任务
-        target_task.exploration_notes.append(new_note)
-        target_task.updated_at = datetime.now()
+        target_task.append_exploration_note(new_note)
+        target_task.updated_at = now
 
         self._save()
-        return new_note
+        return new_note, source_task
 
     def merge_tasks_exploration_notes(self, source_task_ids: list[str], target_task_id: str,
                                     new_task_title: str = "") -> bool:
@@ -586,11 +733,10 @@ class Database:
         # 按创建时间排序，确保合并后时间顺序正确
         all_notes.sort(key=lambda note: note.created_at)
 
-        # 添加所有笔记到目标任务（过滤重复的）
-        existing_note_ids = {note.id for note in target_task.exploration_notes}
+        # 添加所有笔记到目标任务（按笔记索引过滤重复的）
         for note in all_notes:
-            if note.id not in existing_note_ids:
-                target_task.exploration_notes.append(note)
+            if target_task.get_exploration_note(note.id) is None:
+                target_task.append_exploration_note(note)
 
         target_task.updated_at = datetime.now()
         self._save()
@@ -22,8 +22,14 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import bisect
+import functools
+import logging
+import time
+from operator import attrgetter, itemgetter
+
 import customtkinter as ctk
-from tkinter import messagebox, filedialog
+from tkinter import messagebox, filedialog, font as tkfont
 from datetime import datetime
 from typing import Optional, Callable
 
@@ -32,6 +38,70 @@ from database import Database
 import tkinter as tk
 
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+@functools.lru_cache(maxsize=64)
+def _font(family: Optional[str] = None, size: Optional[int] = None,
+          weight: str = "normal", overstrike: bool = False) -> ctk.CTkFont:
+    """获取共享的字体对象
+
+    相同参数的字体只创建一次，避免每个标签都新建一个 Tcl 字体句柄。
+    family 为 None 时使用主题默认字体。
+    """
+    return ctk.CTkFont(family=family, size=size, weight=weight, overstrike=overstrike)
+
+
+@functools.lru_cache(maxsize=16)
+def _char_px(size: int, weight: str = "normal") -> int:
+    """测量一个全角汉字的像素宽度（同字号下字符宽度的上限），每种字号只测一次"""
+    return tkfont.Font(family="Microsoft YaHei", size=-size, weight=weight).measure("汉")
+
+
+def _wraplength(text: str, width: int, size: int, weight: str = "normal") -> int:
+    """计算标签的 wraplength
+
+    单行且按最宽字符估算也放得下的文本返回 0（不换行），
+    让 Tk 走单行绘制路径；否则返回原来的换行宽度。
+    """
+    if "\n" not in text and len(text) * _char_px(size, weight) <= width:
+        return 0
+    return width
+
+
+def _drag_shift(index: int, current: int, dragged: int) -> int:
+    """拖拽项从 dragged 移到 current 时，第 index 项需要让位的格数（+1 下移，-1 上移，0 不动）"""
+    if current <= index < dragged:
+        return 1
+    if dragged < index <= current:
+        return -1
+    return 0
+
+
+# 笔记头部操作按钮：(图标, 悬停颜色在 ThemeConfig 中的属性名, 处理方法名)，从左到右排列
+NOTE_ACTIONS = (
+    ("📋", "ACCENT_PLANNING", "_show_copy_note_dialog"),
+    ("➡️", "ACCENT_SUCCESS", "_show_move_note_dialog"),
+    ("✏️", "ACCENT_PLANNING", "_edit_note_dialog"),
+    ("✕", "ACCENT_DANGER", "_delete_note"),
+)
+
+# 可拖拽笔记控件共用的绑定标签
+NOTE_DRAG_TAG = "NoteDraggable"
+ROOT_GEOMETRY_TAG = "RootGeometry"
+
+# 长列表分批渲染：每批创建的条目数，以及触发追加渲染的滚动位置
+LAZY_RENDER_BATCH = 30
+LAZY_RENDER_THRESHOLD = 0.9
+
+# 拖拽让位动画：缓动步数与统一定时器的间隔（毫秒，约 60Hz）
+DRAG_ANIM_STEPS = 4
+DRAG_ANIM_INTERVAL = 16
+# 拖拽移动事件的最小处理间隔（秒）：更密集的事件只保留最新一个，延后处理
+DRAG_MOTION_INTERVAL = 0.016
+
+
 # ==================== 悬浮任务追踪窗口 ====================
 class TaskTrackerWindow(ctk.CTkToplevel):
     """悬浮任务追踪窗口 - 类似游戏任务提醒"""
@@ -52,6 +122,7 @@ class TaskTrackerWindow(ctk.CTkToplevel):
 
         self.configure(fg_color=ThemeConfig.BG_PRIMARY)
 
+        self._rendered_revision = None
         self._create_ui()
         self._refresh_tracker()
 
@@ -79,7 +150,7 @@ class TaskTrackerWindow(ctk.CTkToplevel):
             font=ctk.CTkFont(size=12),
             fg_color="transparent",
             hover_color=ThemeConfig.BG_HOVER,
-            command=self._refresh_tracker
+            command=functools.partial(self._refresh_tracker, force=True)
         )
         refresh_btn.pack(side="right", padx=4)
 
@@ -116,8 +187,14 @@ class TaskTrackerWindow(ctk.CTkToplevel):
             self.geometry(f"320x45+{self.winfo_x()}+{self.winfo_y()}")
             self._is_minimized = True
 
-    def _refresh_tracker(self):
-        """刷新追踪内容"""
+    def _refresh_tracker(self, force: bool = False):
+        """刷新追踪内容
+
+        数据版本号与上次渲染时相同则跳过重建，force 为 True 时强制刷新。
+        """
+        if not force and self._rendered_revision == self.db.revision:
+            return
+
         for widget in self.content_frame.winfo_children():
             widget.destroy()
 
@@ -126,8 +203,8 @@ class TaskTrackerWindow(ctk.CTkToplevel):
         for t in tasks:
             if t.status in [TaskStatus.IN_PROGRESS, TaskStatus.EXPLORING, TaskStatus.PENDING]:
                 active_tasks.append(t)
-            elif t.status == TaskStatus.COMPLETED:
-                has_incomplete = any(st.status != TaskStatus.COMPLETED for st in t.subtasks)
+            elif t.status is TaskStatus.COMPLETED:
+                has_incomplete = t.get_completed_count() < len(t.subtasks)
                 if has_incomplete:
                     t.status = TaskStatus.IN_PROGRESS
                     t.completed_at = None
@@ -136,6 +213,7 @@ class TaskTrackerWindow(ctk.CTkToplevel):
 
         status_order = {TaskStatus.IN_PROGRESS: 0, TaskStatus.EXPLORING: 1, TaskStatus.PENDING: 2}
         active_tasks.sort(key=lambda t: status_order.get(t.status, 3))
+        self._rendered_revision = self.db.revision
 
         if not active_tasks:
             empty_label = ctk.CTkLabel(
@@ -153,7 +231,7 @@ class TaskTrackerWindow(ctk.CTkToplevel):
 
     def _create_task_tracker_item(self, task: Task):
         """创建任务追踪项"""
-        if task.mode == TaskMode.EXPLORING:
+        if task.mode is TaskMode.EXPLORING:
             accent_color = ThemeConfig.ACCENT_EXPLORING
             mode_icon = "🔍"
         else:
@@ -188,7 +266,7 @@ class TaskTrackerWindow(ctk.CTkToplevel):
         )
         title_label.pack(side="left", fill="x", expand=True)
 
-        if task.mode == TaskMode.PLANNING:
+        if task.mode is TaskMode.PLANNING:
             if not task.subtasks:
                 hint_frame = ctk.CTkFrame(card, fg_color=ThemeConfig.BG_TERTIARY, corner_radius=6)
                 hint_frame.pack(fill="x", padx=10, pady=(0, 10))
@@ -201,11 +279,7 @@ class TaskTrackerWindow(ctk.CTkToplevel):
                 )
                 hint_label.pack(anchor="w", padx=8, pady=8)
             else:
-                next_subtask = None
-                for st in sorted(task.subtasks, key=lambda x: x.order):
-                    if st.status != TaskStatus.COMPLETED:
-                        next_subtask = st
-                        break
+                next_subtask = task.get_next_subtask()
 
                 if next_subtask:
                     next_frame = ctk.CTkFrame(card, fg_color=ThemeConfig.BG_TERTIARY, corner_radius=6)
@@ -273,7 +347,7 @@ class TaskTrackerWindow(ctk.CTkToplevel):
                 )
                 progress_text.pack(side="right", padx=(8, 0))
 
-        elif task.mode == TaskMode.EXPLORING:
+        elif task.mode is TaskMode.EXPLORING:
             explore_frame = ctk.CTkFrame(card, fg_color=ThemeConfig.BG_TERTIARY, corner_radius=6)
             explore_frame.pack(fill="x", padx=10, pady=(0, 10))
 
@@ -341,6 +415,28 @@ class ThemeConfig:
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+# 对话框底部按钮的公共样式（字体、高度随对话框不同，由调用处传入）
+_BTN_PRIMARY_KW = dict(
+    fg_color=ThemeConfig.ACCENT_PLANNING,
+    hover_color="#4A90D9",
+    corner_radius=10
+)
+_BTN_CANCEL_KW = dict(
+    fg_color=ThemeConfig.BG_TERTIARY,
+    hover_color=ThemeConfig.BG_HOVER,
+    text_color=ThemeConfig.TEXT_SECONDARY,
+    corner_radius=10
+)
+
+# 任务状态对应的文字颜色
+TASK_STATUS_COLORS = {
+    TaskStatus.PENDING: ThemeConfig.TEXT_MUTED,
+    TaskStatus.IN_PROGRESS: ThemeConfig.ACCENT_PLANNING,
+    TaskStatus.EXPLORING: ThemeConfig.ACCENT_EXPLORING,
+    TaskStatus.COMPLETED: ThemeConfig.ACCENT_SUCCESS,
+    TaskStatus.PAUSED: ThemeConfig.ACCENT_WARNING
+}
+
 
 class ResearchTerminal(ctk.CTk):
     """科研工作者终端主窗口"""
@@ -349,6 +445,8 @@ class ResearchTerminal(ctk.CTk):
         super().__init__()
 
         self.db = Database()
+        # 写盘线程发现写入失败时，把提示转回界面线程
+        self.db.on_write_error = lambda error: self.after(0, self._on_write_error)
         self.selected_task: Optional[Task] = None
         self.batch_mode = False
         self.selected_note_ids: set[str] = set()
@@ -369,17 +467,62 @@ class ResearchTerminal(ctk.CTk):
             "drag_threshold": 5,
             "card_positions": [],
             "subtask_positions": [],
-            "animating": False,
+            "centers": [],
             "is_subtask": False,
         }
         self._task_cards = []
+        self._selected_card_widget = None
         self._subtask_items = []
+        self._subtask_header = None
         self._note_items = []
+        self._notes_container = None
+        self._sorted_notes_cache = None
+        self._time_str_cache = {}
+        self._refresh_after_id = None
+        self._batch_btn = None
+        self._batch_frame = None
+        self._hint_frame = None
+        # 复用的对话框外壳：kind -> (dialog, widgets)
+        self._dialog_pool = {}
+        self._tracker_refresh_after_id = None
+        self._pending_post_save = None
+        # 拖拽让位动画：widget -> 动画参数，由同一个定时器统一推进
+        self._anim_jobs = {}
+        self._anim_after_id = None
+        # 本次拖拽中做过让位动画的控件，拖拽结束时只复位这些控件
+        self._anim_touched = set()
+        # 拖拽移动事件节流：上次处理时间、被推迟的最新事件及其定时器
+        self._last_motion_ts = 0.0
+        self._pending_motion = None
+        self._motion_after_id = None
+
+        # 探索笔记排序设置（每次显示详情都会用到，启动时统一创建）
+        self._note_sort_mode_var = ctk.StringVar(value="auto")
+        self._sort_field_var = ctk.StringVar(value="created_at")
+        self._sort_order_var = ctk.StringVar(value="desc")
+        self.note_sort_order_btn = None
+        self._note_items_task_id = None
+        # 笔记列表的分批渲染状态（_lazy_render 的返回值），排序变化时据此调整未渲染部分的顺序
+        self._note_render_state = None
+        self._widget_to_note = {}
+        # 笔记 ID -> 笔记条目；条目在列表中的位置记录在其控件的 _index 上，重新排序时无需更新
+        self._note_item_by_id = {}
+
+        # 笔记拖拽统一通过绑定标签分发，避免为每个控件单独创建回调
+        self.bind_class(NOTE_DRAG_TAG, "<Button-1>", self._on_note_drag_start_dispatch)
+        self.bind_class(NOTE_DRAG_TAG, "<B1-Motion>", self._on_note_drag_motion_dispatch)
+        self.bind_class(NOTE_DRAG_TAG, "<ButtonRelease-1>", self._on_note_drag_end_dispatch)
         
         # 窗口配置
         self.title("🔬 科研工作者终端 - Researcher Terminal")
         self.geometry("1400x900")
         self.minsize(1200, 700)
+
+        # 缓存主窗口几何信息，对话框居中时无需再强制刷新布局；
+        # 使用独立绑定标签，只响应主窗口自身（而非子控件）的 <Configure>
+        self._main_geometry = None
+        self.bind_class(ROOT_GEOMETRY_TAG, "<Configure>", self._on_root_configure)
+        self.bindtags((ROOT_GEOMETRY_TAG,) + self.bindtags())
         
         # 配置颜色
         self.configure(fg_color=ThemeConfig.BG_PRIMARY)
@@ -387,6 +530,12 @@ class ResearchTerminal(ctk.CTk):
         # 创建主布局
         self._create_layout()
         self._refresh_task_list()
+
+    def _on_write_error(self):
+        """后台写盘失败后在界面线程提示用户（连续失败只提示一次尚未取走的错误）"""
+        error = self.db.take_write_error()
+        if error is not None:
+            messagebox.showerror("保存失败", f"数据未能写入文件，最近的修改可能没有保存：\n{error}")
     
     def _create_layout(self):
         """创建主布局"""
@@ -723,7 +872,7 @@ class ResearchTerminal(ctk.CTk):
             self.task_sort_order_btn.configure(state=state)
 
     def _is_note_manual_sort_mode(self) -> bool:
-        return getattr(self, "_note_sort_mode_var", None) is not None and self._note_sort_mode_var.get() == "manual"
+        return self._note_sort_mode_var.get() == "manual"
 
     def _on_note_sort_mode_change(self):
         if self.selected_task:
@@ -732,8 +881,7 @@ class ResearchTerminal(ctk.CTk):
                 self._show_task_detail(updated_task)
 
     def _set_note_sort_mode(self, mode: str):
-        if hasattr(self, "_note_sort_mode_var"):
-            self._note_sort_mode_var.set(mode)
+        self._note_sort_mode_var.set(mode)
         self._on_note_sort_mode_change()
     
     def _create_main_area(self):
@@ -851,44 +999,41 @@ class ResearchTerminal(ctk.CTk):
             text=tip,
             font=ctk.CTkFont(family="Microsoft YaHei", size=11),
             text_color=ThemeConfig.TEXT_MUTED,
-            wraplength=240
+            wraplength=_wraplength(tip, 240, 11)
         )
         tip_label.pack(pady=(0, 16))
         
         return card
     
-    def _create_task_card(self, task: Task, index: int) -> ctk.CTkFrame:
-        """创建任务卡片"""
+    def _create_task_card(self, task: Task, index: int, manual: bool = False) -> ctk.CTkFrame:
+        """创建任务卡片
+
+        manual 为任务列表是否处于手动排序（可拖拽）模式，由调用方统一计算后传入。
+        """
         # 根据模式选择颜色
-        accent_color = ThemeConfig.ACCENT_EXPLORING if task.mode == TaskMode.EXPLORING else ThemeConfig.ACCENT_PLANNING
-        
-        # 状态颜色
-        status_colors = {
-            TaskStatus.PENDING: ThemeConfig.TEXT_MUTED,
-            TaskStatus.IN_PROGRESS: ThemeConfig.ACCENT_PLANNING,
-            TaskStatus.EXPLORING: ThemeConfig.ACCENT_EXPLORING,
-            TaskStatus.COMPLETED: ThemeConfig.ACCENT_SUCCESS,
-            TaskStatus.PAUSED: ThemeConfig.ACCENT_WARNING
-        }
+        accent_color = ThemeConfig.ACCENT_EXPLORING if task.mode is TaskMode.EXPLORING else ThemeConfig.ACCENT_PLANNING
         
-        drag_cursor = "hand2" if self._is_manual_sort_mode() else "arrow"
+        drag_cursor = "hand2" if manual else "arrow"
+        is_selected = self.selected_task is not None and self.selected_task.id == task.id
         card = ctk.CTkFrame(
             self.task_list_frame,
             fg_color=ThemeConfig.BG_TERTIARY,
             corner_radius=12,
             border_width=2,
-            border_color=accent_color if self.selected_task and self.selected_task.id == task.id else ThemeConfig.BORDER_DEFAULT,
+            border_color=accent_color if is_selected else ThemeConfig.BORDER_DEFAULT,
             cursor=drag_cursor
         )
         card.pack(fill="x", pady=6, padx=4)
         card._task = task
         card._index = index
         card._accent_color = accent_color
-        card._is_selected = self.selected_task and self.selected_task.id == task.id
+        card._is_selected = is_selected
         self._task_cards.append(card)
+        if is_selected:
+            self._selected_card_widget = card
 
-        if self._is_manual_sort_mode():
-            card.bind("<Button-1>", lambda e, c=card, t=task, i=index: self._on_task_drag_start(e, c, t, i))
+        if manual:
+            card.bind("<Button-1>", lambda e, c=card, t=task: self._on_task_drag_start(e, c, t))
             card.bind("<B1-Motion>", lambda e, c=card: self._on_task_drag_motion(e, c))
             card.bind("<ButtonRelease-1>", lambda e, t=task: self._on_task_drag_end(e, t))
         else:
@@ -897,36 +1042,36 @@ class ResearchTerminal(ctk.CTk):
         # 内容区域
         content = ctk.CTkFrame(card, fg_color="transparent", cursor=drag_cursor)
         content.pack(fill="x", padx=16, pady=12)
-        if self._is_manual_sort_mode():
-            content.bind("<Button-1>", lambda e, c=card, t=task, i=index: self._on_task_drag_start(e, c, t, i))
+        if manual:
+            content.bind("<Button-1>", lambda e, c=card, t=task: self._on_task_drag_start(e, c, t))
             content.bind("<B1-Motion>", lambda e, c=card: self._on_task_drag_motion(e, c))
             content.bind("<ButtonRelease-1>", lambda e, t=task: self._on_task_drag_end(e, t))
         else:
             content.bind("<Button-1>", lambda e, t=task: self._select_task(t))
 
         def bind_drag_events(widget):
-            widget.bind("<Button-1>", lambda e, c=card, t=task, i=index: self._on_task_drag_start(e, c, t, i))
+            widget.bind("<Button-1>", lambda e, c=card, t=task: self._on_task_drag_start(e, c, t))
             widget.bind("<B1-Motion>", lambda e, c=card: self._on_task_drag_motion(e, c))
             widget.bind("<ButtonRelease-1>", lambda e, t=task: self._on_task_drag_end(e, t))
         
         # 第一行：标题和模式标签
         row1 = ctk.CTkFrame(content, fg_color="transparent", cursor=drag_cursor)
         row1.pack(fill="x")
-        if self._is_manual_sort_mode():
+        if manual:
             bind_drag_events(row1)
         else:
             row1.bind("<Button-1>", lambda e, t=task: self._select_task(t))
         
         # 模式标签
-        mode_icon = "🔍" if task.mode == TaskMode.EXPLORING else "📊"
+        mode_icon = "🔍" if task.mode is TaskMode.EXPLORING else "📊"
         mode_label = ctk.CTkLabel(
             row1,
             text=mode_icon,
-            font=ctk.CTkFont(size=14),
+            font=_font(size=14),
             cursor=drag_cursor
         )
         mode_label.pack(side="left", padx=(0, 8))
-        if self._is_manual_sort_mode():
+        if manual:
             bind_drag_events(mode_label)
         else:
             mode_label.bind("<Button-1>", lambda e, t=task: self._select_task(t))
@@ -935,13 +1080,13 @@ class ResearchTerminal(ctk.CTk):
         title_label = ctk.CTkLabel(
             row1,
             text=task.title[:25] + ("..." if len(task.title) > 25 else ""),
-            font=ctk.CTkFont(family="Microsoft YaHei", size=14, weight="bold"),
+            font=_font(family="Microsoft YaHei", size=14, weight="bold"),
             text_color=ThemeConfig.TEXT_PRIMARY,
             anchor="w",
             cursor=drag_cursor
         )
         title_label.pack(side="left", fill="x", expand=True)
-        if self._is_manual_sort_mode():
+        if manual:
             bind_drag_events(title_label)
         else:
             title_label.bind("<Button-1>", lambda e, t=task: self._select_task(t))
@@ -949,7 +1094,7 @@ class ResearchTerminal(ctk.CTk):
         # 第二行：状态和进度
         row2 = ctk.CTkFrame(content, fg_color="transparent", cursor=drag_cursor)
         row2.pack(fill="x", pady=(8, 0))
-        if self._is_manual_sort_mode():
+        if manual:
             bind_drag_events(row2)
         else:
             row2.bind("<Button-1>", lambda e, t=task: self._select_task(t))
@@ -958,18 +1103,20 @@ class ResearchTerminal(ctk.CTk):
         status_label = ctk.CTkLabel(
             row2,
             text=task.status.value,
-            font=ctk.CTkFont(family="Microsoft YaHei", size=11),
-            text_color=status_colors.get(task.status, ThemeConfig.TEXT_SECONDARY),
+            font=_font(family="Microsoft YaHei", size=11),
+            text_color=TASK_STATUS_COLORS.get(task.status, ThemeConfig.TEXT_SECONDARY),
             cursor=drag_cursor
         )
         status_label.pack(side="left")
-        if self._is_manual_sort_mode():
+        card._status_label = status_label
+        card._progress_bar = None
+        if manual:
             bind_drag_events(status_label)
         else:
             status_label.bind("<Button-1>", lambda e, t=task: self._select_task(t))
         
         # 进度条（规划模式显示）
-        if task.mode == TaskMode.PLANNING and task.subtasks:
+        if task.mode is TaskMode.PLANNING and task.subtasks:
             progress = task.get_progress()
             progress_bar = ctk.CTkProgressBar(
                 row2,
@@ -980,18 +1127,19 @@ class ResearchTerminal(ctk.CTk):
             )
             progress_bar.pack(side="right")
             progress_bar.set(progress)
+            card._progress_bar = progress_bar
         
         # 探索模式显示笔记数量
-        if task.mode == TaskMode.EXPLORING and task.exploration_notes:
+        if task.mode is TaskMode.EXPLORING and task.exploration_notes:
             notes_label = ctk.CTkLabel(
                 row2,
                 text=f"📝 {len(task.exploration_notes)}条笔记",
-                font=ctk.CTkFont(family="Microsoft YaHei", size=11),
+                font=_font(family="Microsoft YaHei", size=11),
                 text_color=ThemeConfig.TEXT_MUTED,
                 cursor=drag_cursor
             )
             notes_label.pack(side="right")
-            if self._is_manual_sort_mode():
+            if manual:
                 bind_drag_events(notes_label)
             else:
                 notes_label.bind("<Button-1>", lambda e, t=task: self._select_task(t))
@@ -1002,6 +1150,7 @@ class ResearchTerminal(ctk.CTk):
         """刷新任务列表"""
         # 清空现有列表
         self._task_cards = []
+        self._selected_card_widget = None
         for widget in self.task_list_frame.winfo_children():
             widget.destroy()
         
@@ -1011,11 +1160,11 @@ class ResearchTerminal(ctk.CTk):
         # 应用筛选
         filter_value = self.filter_var.get()
         if filter_value == "planning":
-            tasks = [t for t in tasks if t.mode == TaskMode.PLANNING and t.status != TaskStatus.COMPLETED]
+            tasks = [t for t in tasks if t.mode is TaskMode.PLANNING and t.status is not TaskStatus.COMPLETED]
         elif filter_value == "exploring":
-            tasks = [t for t in tasks if t.mode == TaskMode.EXPLORING]
+            tasks = [t for t in tasks if t.mode is TaskMode.EXPLORING]
         elif filter_value == "completed":
-            tasks = [t for t in tasks if t.status == TaskStatus.COMPLETED]
+            tasks = [t for t in tasks if t.status is TaskStatus.COMPLETED]
         
         # 应用搜索（仅任务模式）
         search_text = self.search_entry.get().strip().lower()
@@ -1024,22 +1173,23 @@ class ResearchTerminal(ctk.CTk):
                 tasks = [t for t in tasks if search_text in t.title.lower() or search_text in t.description.lower()]
         
         # 按排序设置排序
-        if self._is_manual_sort_mode():
-            tasks.sort(key=lambda t: t.order)
+        manual = self._is_manual_sort_mode()
+        if manual:
+            tasks.sort(key=attrgetter('order'))
         else:
             sort_field = self._task_sort_field_var.get()
             sort_order = self._task_sort_order_var.get()
             is_reverse = (sort_order == "desc")
 
             if sort_field == "created_at":
-                tasks.sort(key=lambda t: t.created_at, reverse=is_reverse)
+                tasks.sort(key=attrgetter('created_at'), reverse=is_reverse)
             else:
-                tasks.sort(key=lambda t: t.updated_at, reverse=is_reverse)
+                tasks.sort(key=attrgetter('updated_at'), reverse=is_reverse)
         
         # 创建任务卡片
         if tasks:
             for index, task in enumerate(tasks):
-                self._create_task_card(task, index)
+                self._create_task_card(task, index, manual)
         else:
             # 空状态
             empty_label = ctk.CTkLabel(
@@ -1105,13 +1255,13 @@ class ResearchTerminal(ctk.CTk):
             empty = ctk.CTkLabel(
                 container,
                 text="无匹配探索笔记",
-                font=ctk.CTkFont(family="Microsoft YaHei", size=14),
+                font=_font(family="Microsoft YaHei", size=14),
                 text_color=ThemeConfig.TEXT_MUTED
             )
             empty.pack(pady=30)
             return
 
-        results = sorted(results, key=lambda r: r.note.created_at, reverse=True)
+        results = sorted(results, key=attrgetter('note.created_at'), reverse=True)
 
         def bind_click(widget, task_id, note_id):
             widget.bind("<Button-1>", lambda e: self._open_note_result(task_id, note_id))
@@ -1129,16 +1279,16 @@ class ResearchTerminal(ctk.CTk):
             title_label = ctk.CTkLabel(
                 header,
                 text=f"📝 {res.task_title}",
-                font=ctk.CTkFont(family="Microsoft YaHei", size=13, weight="bold"),
+                font=_font(family="Microsoft YaHei", size=13, weight="bold"),
                 text_color=ThemeConfig.TEXT_PRIMARY
             )
             title_label.pack(side="left")
 
-            time_str = res.note.created_at.strftime("%m-%d %H:%M")
+            time_str = self._note_time_str(res.note)
             time_label = ctk.CTkLabel(
                 header,
                 text=time_str,
-                font=ctk.CTkFont(family="Microsoft YaHei", size=11),
+                font=_font(family="Microsoft YaHei", size=11),
                 text_color=ThemeConfig.TEXT_MUTED
             )
             time_label.pack(side="right")
@@ -1149,10 +1299,10 @@ class ResearchTerminal(ctk.CTk):
             snippet_label = ctk.CTkLabel(
                 content,
                 text=snippet,
-                font=ctk.CTkFont(family="Microsoft YaHei", size=12),
+                font=_font(family="Microsoft YaHei", size=12),
                 text_color=ThemeConfig.TEXT_SECONDARY,
                 justify="left",
-                wraplength=680
+                wraplength=_wraplength(snippet, 680, 12)
             )
             snippet_label.pack(fill="x", pady=(8, 0))
 
@@ -1160,7 +1310,7 @@ class ResearchTerminal(ctk.CTk):
                 history_label = ctk.CTkLabel(
                     content,
                     text="📖 历史",
-                    font=ctk.CTkFont(family="Microsoft YaHei", size=11),
+                    font=_font(family="Microsoft YaHei", size=11),
                     text_color=ThemeConfig.TEXT_MUTED
                 )
                 history_label.pack(anchor="w", pady=(6, 0))
@@ -1173,16 +1323,65 @@ class ResearchTerminal(ctk.CTk):
         if task:
             self._select_task(task, highlight_note_id=note_id)
     
-    def _select_task(self, task: Task, highlight_note_id: Optional[str] = None):
-        """选择任务"""
+    def _remove_task_card(self, task_id: str):
+        """从任务列表中移除单张卡片；卡片不在列表中（被筛选掉）时无需任何刷新"""
+        for index, card in enumerate(self._task_cards):
+            if card._task.id == task_id:
+                break
+        else:
+            return
+        if len(self._task_cards) == 1:
+            # 最后一张卡片，重建以显示空状态
+            self._refresh_task_list()
+            return
+        del self._task_cards[index]
+        if card is self._selected_card_widget:
+            self._selected_card_widget = None
+        card.destroy()
+        for i in range(index, len(self._task_cards)):
+            self._task_cards[i]._index = i
+
+    def _update_selected_card(self, task: Task):
+        """只更新新旧两张卡片的高亮边框，不重建任务列表"""
+        previous = self._selected_card_widget
+        if previous is not None:
+            if previous._task.id == task.id:
+                return
+            if previous.winfo_exists():
+                previous.configure(border_color=ThemeConfig.BORDER_DEFAULT)
+                previous._is_selected = False
+            self._selected_card_widget = None
+
+        for card in self._task_cards:
+            if card._task.id == task.id:
+                card.configure(border_color=card._accent_color)
+                card._is_selected = True
+                self._selected_card_widget = card
+                break
+
+    def _select_task(self, task: Task, highlight_note_id: Optional[str] = None, refresh: bool = False):
+        """选择任务
+
+        refresh 为 True 时顺带重建任务列表（新卡片直接带选中高亮），
+        用于数据已变化的场景，调用方无需再单独刷新列表。
+        """
         self.selected_task = task
         self.batch_mode = False
         self.selected_note_ids = set()
-        self._refresh_task_list()  # 刷新高亮状态
+        if refresh:
+            self._refresh_task_list()
+        else:
+            self._update_selected_card(task)
         self._show_task_detail(task, highlight_note_id=highlight_note_id)
     
     def _show_task_detail(self, task: Task, highlight_note_id: Optional[str] = None):
         """显示任务详情"""
+        # 主题颜色在下面的控件参数中反复使用，先绑定为局部变量
+        bg_tertiary = ThemeConfig.BG_TERTIARY
+        bg_hover = ThemeConfig.BG_HOVER
+        text_muted = ThemeConfig.TEXT_MUTED
+        text_secondary = ThemeConfig.TEXT_SECONDARY
+
         # 清空主区域
         for widget in self.main_area.winfo_children():
             widget.destroy()
@@ -1191,8 +1390,8 @@ class ResearchTerminal(ctk.CTk):
         scroll_container = ctk.CTkScrollableFrame(
             self.main_area,
             fg_color="transparent",
-            scrollbar_button_color=ThemeConfig.BG_TERTIARY,
-            scrollbar_button_hover_color=ThemeConfig.BG_HOVER
+            scrollbar_button_color=bg_tertiary,
+            scrollbar_button_hover_color=bg_hover
         )
         scroll_container.pack(fill="both", expand=True, padx=24, pady=24)
         
@@ -1201,15 +1400,15 @@ class ResearchTerminal(ctk.CTk):
         header.pack(fill="x", pady=(0, 20))
         
         # 模式标签
-        mode_color = ThemeConfig.ACCENT_EXPLORING if task.mode == TaskMode.EXPLORING else ThemeConfig.ACCENT_PLANNING
-        mode_text = "🔍 探索模式" if task.mode == TaskMode.EXPLORING else "📊 规划模式"
+        mode_color = ThemeConfig.ACCENT_EXPLORING if task.mode is TaskMode.EXPLORING else ThemeConfig.ACCENT_PLANNING
+        mode_text = "🔍 探索模式" if task.mode is TaskMode.EXPLORING else "📊 规划模式"
         
         mode_badge = ctk.CTkLabel(
             header,
             text=mode_text,
-            font=ctk.CTkFont(family="Microsoft YaHei", size=12, weight="bold"),
+            font=_font(family="Microsoft YaHei", size=12, weight="bold"),
             text_color=mode_color,
-            fg_color=ThemeConfig.BG_TERTIARY,
+            fg_color=bg_tertiary,
             corner_radius=6,
             padx=12,
             pady=4
@@ -1220,8 +1419,8 @@ class ResearchTerminal(ctk.CTk):
         knowledge_label = ctk.CTkLabel(
             header,
             text=task.knowledge.value,
-            font=ctk.CTkFont(family="Microsoft YaHei", size=11),
-            text_color=ThemeConfig.TEXT_MUTED
+            font=_font(family="Microsoft YaHei", size=11),
+            text_color=text_muted
         )
         knowledge_label.pack(side="left", padx=(12, 0))
         
@@ -1229,16 +1428,16 @@ class ResearchTerminal(ctk.CTk):
         actions_frame = ctk.CTkFrame(header, fg_color="transparent")
         actions_frame.pack(side="right")
         
-        if task.status != TaskStatus.COMPLETED:
+        if task.status is not TaskStatus.COMPLETED:
             # 未完成任务显示切换模式按钮
-            switch_text = "切换到规划模式" if task.mode == TaskMode.EXPLORING else "切换到探索模式"
+            switch_text = "切换到规划模式" if task.mode is TaskMode.EXPLORING else "切换到探索模式"
             switch_btn = ctk.CTkButton(
                 actions_frame,
                 text=switch_text,
-                font=ctk.CTkFont(family="Microsoft YaHei", size=12),
-                fg_color=ThemeConfig.BG_TERTIARY,
-                hover_color=ThemeConfig.BG_HOVER,
-                text_color=ThemeConfig.TEXT_SECONDARY,
+                font=_font(family="Microsoft YaHei", size=12),
+                fg_color=bg_tertiary,
+                hover_color=bg_hover,
+                text_color=text_secondary,
                 height=32,
                 corner_radius=8,
                 command=lambda: self._toggle_task_mode(task)
@@ -1249,8 +1448,8 @@ class ResearchTerminal(ctk.CTk):
         delete_btn = ctk.CTkButton(
             actions_frame,
             text="🗑️",
-            font=ctk.CTkFont(size=14),
-            fg_color=ThemeConfig.BG_TERTIARY,
+            font=_font(size=14),
+            fg_color=bg_tertiary,
             hover_color=ThemeConfig.ACCENT_DANGER,
             width=40,
             height=32,
@@ -1266,10 +1465,10 @@ class ResearchTerminal(ctk.CTk):
         title_label = ctk.CTkLabel(
             title_frame,
             text=task.title,
-            font=ctk.CTkFont(family="Microsoft YaHei", size=26, weight="bold"),
+            font=_font(family="Microsoft YaHei", size=26, weight="bold"),
             text_color=ThemeConfig.TEXT_PRIMARY,
             anchor="w",
-            wraplength=700
+            wraplength=_wraplength(task.title, 700, 26, "bold")
         )
         title_label.pack(side="left", fill="x", expand=True)
         
@@ -1277,9 +1476,9 @@ class ResearchTerminal(ctk.CTk):
         edit_menu_btn = ctk.CTkButton(
             title_frame,
             text="📝",
-            font=ctk.CTkFont(size=14),
+            font=_font(size=14),
             fg_color="transparent",
-            hover_color=ThemeConfig.BG_HOVER,
+            hover_color=bg_hover,
             width=32,
             height=32,
             command=lambda: self._edit_task_dialog(task)
@@ -1291,16 +1490,16 @@ class ResearchTerminal(ctk.CTk):
         desc_frame.pack(fill="x", pady=(0, 20))
 
         desc_text = task.description if task.description else "（无描述）"
-        desc_color = ThemeConfig.TEXT_SECONDARY if task.description else ThemeConfig.TEXT_MUTED
+        desc_color = text_secondary if task.description else text_muted
 
         desc_label = ctk.CTkLabel(
             desc_frame,
             text=desc_text,
-            font=ctk.CTkFont(family="Microsoft YaHei", size=14),
+            font=_font(family="Microsoft YaHei", size=14),
             text_color=desc_color,
             anchor="w",
             justify="left",
-            wraplength=700
+            wraplength=_wraplength(desc_text, 700, 14)
         )
         desc_label.pack(side="left", fill="x", expand=True)
 
@@ -1310,11 +1509,49 @@ class ResearchTerminal(ctk.CTk):
         separator.pack(fill="x", pady=(0, 20))
         
         # 根据模式显示不同内容
-        if task.mode == TaskMode.PLANNING:
+        if task.mode is TaskMode.PLANNING:
             self._show_planning_content(scroll_container, task, highlight_note_id=highlight_note_id)
         else:
             self._show_exploring_content(scroll_container, task, highlight_note_id=highlight_note_id)
     
+    def _lazy_render(self, scroll_container, items: list, create_item: Callable, min_count: int = 0):
+        """分批渲染长列表
+
+        先渲染首批列表项（至少 min_count 项，保证需要立即可见的条目已创建），
+        之后每当滚动条接近底部时再追加下一批，避免一次性为成百上千个条目创建控件。
+
+        返回渲染状态：调用方可以替换其中的 items（长度不变）来改变尚未渲染条目的顺序，
+        已渲染的前 rendered 项需由调用方自行按新顺序排好。
+        """
+        total = len(items)
+        state = {"items": items, "rendered": 0, "pending": False, "create": create_item}
+
+        def render_batch(count=LAZY_RENDER_BATCH):
+            state["pending"] = False
+            if not scroll_container.winfo_exists():
+                return
+            start = state["rendered"]
+            end = min(start + count, total)
+            current = state["items"]
+            for index in range(start, end):
+                create_item(index, current[index])
+            state["rendered"] = end
+
+        render_batch(max(LAZY_RENDER_BATCH, min_count))
+        if state["rendered"] >= total:
+            return state
+
+        scrollbar_set = scroll_container._scrollbar.set
+
+        def on_yscroll(first, last):
+            scrollbar_set(first, last)
+            if state["rendered"] < total and not state["pending"] and float(last) >= LAZY_RENDER_THRESHOLD:
+                state["pending"] = True
+                self.after_idle(render_batch)
+
+        scroll_container._parent_canvas.configure(yscrollcommand=on_yscroll)
+        return state
+
     def _show_planning_content(self, parent, task: Task, highlight_note_id: Optional[str] = None):
         """显示规划模式内容"""
         # 子任务区域
@@ -1324,7 +1561,7 @@ class ResearchTerminal(ctk.CTk):
         subtask_title = ctk.CTkLabel(
             subtask_header,
             text="📋 子任务拆解",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=18, weight="bold"),
+            font=_font(family="Microsoft YaHei", size=18, weight="bold"),
             text_color=ThemeConfig.TEXT_PRIMARY
         )
         subtask_title.pack(side="left")
@@ -1332,7 +1569,7 @@ class ResearchTerminal(ctk.CTk):
         subtask_drag_hint = ctk.CTkLabel(
             subtask_header,
             text="(拖拽排序)",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=11),
+            font=_font(family="Microsoft YaHei", size=11),
             text_color=ThemeConfig.TEXT_MUTED
         )
         subtask_drag_hint.pack(side="left", padx=(8, 0))
@@ -1341,7 +1578,7 @@ class ResearchTerminal(ctk.CTk):
         add_subtask_btn = ctk.CTkButton(
             subtask_header,
             text="➕ 添加子任务",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=12),
+            font=_font(family="Microsoft YaHei", size=12),
             fg_color=ThemeConfig.ACCENT_PLANNING,
             hover_color="#4A90D9",
             height=32,
@@ -1350,17 +1587,14 @@ class ResearchTerminal(ctk.CTk):
         )
         add_subtask_btn.pack(side="right")
 
-        next_subtask = None
-        if task.subtasks:
-            for st in sorted(task.subtasks, key=lambda x: x.order):
-                if st.status != TaskStatus.COMPLETED:
-                    next_subtask = st
-                    break
+        quick_complete_btn = None
+        progress_label = None
+        next_subtask = task.get_next_subtask()
         if next_subtask:
             quick_complete_btn = ctk.CTkButton(
                 subtask_header,
                 text="✓ 完成此步骤",
-                font=ctk.CTkFont(family="Microsoft YaHei", size=12),
+                font=_font(family="Microsoft YaHei", size=12),
                 fg_color=ThemeConfig.ACCENT_SUCCESS,
                 hover_color="#2D9142",
                 height=32,
@@ -1371,26 +1605,32 @@ class ResearchTerminal(ctk.CTk):
         
         # 进度信息
         if task.subtasks:
-            completed = sum(1 for st in task.subtasks if st.status == TaskStatus.COMPLETED)
+            completed = task.get_completed_count()
             progress_text = f"已完成 {completed}/{len(task.subtasks)}"
             progress_label = ctk.CTkLabel(
                 subtask_header,
                 text=progress_text,
-                font=ctk.CTkFont(family="Microsoft YaHei", size=12),
+                font=_font(family="Microsoft YaHei", size=12),
                 text_color=ThemeConfig.TEXT_MUTED
             )
             progress_label.pack(side="right", padx=(0, 16))
+        self._subtask_header = {"task_id": task.id, "progress": progress_label, "quick": quick_complete_btn}
         
-        # 子任务列表
+        # 子任务列表（分批渲染，滚动到底部附近时再追加后续子任务）
         self._subtask_items = []
         if task.subtasks:
-            for index, subtask in enumerate(sorted(task.subtasks, key=lambda x: x.order)):
-                self._create_subtask_item(parent, task, subtask, index)
+            subtask_list = ctk.CTkFrame(parent, fg_color="transparent")
+            subtask_list.pack(fill="x")
+            self._lazy_render(
+                parent,
+                sorted(task.subtasks, key=attrgetter('order')),
+                lambda index, subtask: self._create_subtask_item(subtask_list, task, subtask, index)
+            )
         else:
             empty_label = ctk.CTkLabel(
                 parent,
                 text="暂无子任务，点击上方按钮添加",
-                font=ctk.CTkFont(family="Microsoft YaHei", size=14),
+                font=_font(family="Microsoft YaHei", size=14),
                 text_color=ThemeConfig.TEXT_MUTED
             )
             empty_label.pack(pady=30)
@@ -1406,7 +1646,7 @@ class ResearchTerminal(ctk.CTk):
             conclusion_title = ctk.CTkLabel(
                 conclusion_header,
                 text="💡 探索结论",
-                font=ctk.CTkFont(family="Microsoft YaHei", size=14, weight="bold"),
+                font=_font(family="Microsoft YaHei", size=14, weight="bold"),
                 text_color=ThemeConfig.ACCENT_EXPLORING
             )
             conclusion_title.pack(side="left")
@@ -1414,7 +1654,7 @@ class ResearchTerminal(ctk.CTk):
             clear_conclusion_btn = ctk.CTkButton(
                 conclusion_header,
                 text="清除",
-                font=ctk.CTkFont(size=12),
+                font=_font(size=12),
                 fg_color=ThemeConfig.BG_TERTIARY,
                 hover_color=ThemeConfig.BG_HOVER,
                 text_color=ThemeConfig.TEXT_SECONDARY,
@@ -1427,7 +1667,7 @@ class ResearchTerminal(ctk.CTk):
             edit_conclusion_btn = ctk.CTkButton(
                 conclusion_header,
                 text="✏️",
-                font=ctk.CTkFont(size=12),
+                font=_font(size=12),
                 fg_color="transparent",
                 hover_color=ThemeConfig.BG_HOVER,
                 width=28,
@@ -1439,17 +1679,17 @@ class ResearchTerminal(ctk.CTk):
             conclusion_text = ctk.CTkLabel(
                 conclusion_frame,
                 text=task.conclusion,
-                font=ctk.CTkFont(family="Microsoft YaHei", size=13),
+                font=_font(family="Microsoft YaHei", size=13),
                 text_color=ThemeConfig.TEXT_PRIMARY,
                 anchor="w",
                 justify="left",
-                wraplength=660
+                wraplength=_wraplength(task.conclusion, 660, 13)
             )
             conclusion_text.pack(anchor="w", padx=16, pady=(0, 12))
 
     def _create_subtask_item(self, parent, task: Task, subtask: SubTask, index: int):
         """创建子任务项"""
-        is_completed = subtask.status == TaskStatus.COMPLETED
+        is_completed = subtask.status is TaskStatus.COMPLETED
         drag_cursor = "hand2"
         
         item = ctk.CTkFrame(
@@ -1461,15 +1701,17 @@ class ResearchTerminal(ctk.CTk):
             cursor=drag_cursor
         )
         item.pack(fill="x", pady=4)
-        self._subtask_items.append({"widget": item, "subtask": subtask})
+        item._index = index
+        entry = {"widget": item, "subtask": subtask}
+        self._subtask_items.append(entry)
 
-        item.bind("<Button-1>", lambda e, it=item, t=task, s=subtask, i=index: self._on_subtask_drag_start(e, it, t, s, i))
+        item.bind("<Button-1>", lambda e, it=item, t=task, s=subtask: self._on_subtask_drag_start(e, it, t, s))
         item.bind("<B1-Motion>", lambda e, it=item, p=parent: self._on_subtask_drag_motion(e, it, p))
         item.bind("<ButtonRelease-1>", lambda e, s=subtask: self._on_subtask_drag_end(e, s))
         
         content = ctk.CTkFrame(item, fg_color="transparent", cursor=drag_cursor)
         content.pack(fill="x", padx=12, pady=10)
-        content.bind("<Button-1>", lambda e, it=item, t=task, s=subtask, i=index: self._on_subtask_drag_start(e, it, t, s, i))
+        content.bind("<Button-1>", lambda e, it=item, t=task, s=subtask: self._on_subtask_drag_start(e, it, t, s))
         content.bind("<B1-Motion>", lambda e, it=item, p=parent: self._on_subtask_drag_motion(e, it, p))
         content.bind("<ButtonRelease-1>", lambda e, s=subtask: self._on_subtask_drag_end(e, s))
         
@@ -1486,12 +1728,13 @@ class ResearchTerminal(ctk.CTk):
             command=lambda: self._toggle_subtask(task, subtask, checkbox_var.get())
         )
         checkbox.pack(side="left", padx=(0, 12))
+        entry["checkbox"] = checkbox
         
         # 标题
         title_label = ctk.CTkLabel(
             content,
             text=subtask.title,
-            font=ctk.CTkFont(
+            font=_font(
                 family="Microsoft YaHei", 
                 size=14,
                 overstrike=is_completed
@@ -1501,14 +1744,15 @@ class ResearchTerminal(ctk.CTk):
             cursor=drag_cursor
         )
         title_label.pack(side="left", fill="x", expand=True)
-        title_label.bind("<Button-1>", lambda e, it=item, t=task, s=subtask, i=index: self._on_subtask_drag_start(e, it, t, s, i))
+        entry["title"] = title_label
+        title_label.bind("<Button-1>", lambda e, it=item, t=task, s=subtask: self._on_subtask_drag_start(e, it, t, s))
         title_label.bind("<B1-Motion>", lambda e, it=item, p=parent: self._on_subtask_drag_motion(e, it, p))
         title_label.bind("<ButtonRelease-1>", lambda e, s=subtask: self._on_subtask_drag_end(e, s))
 
         edit_btn = ctk.CTkButton(
             content,
             text="✏️",
-            font=ctk.CTkFont(size=12),
+            font=_font(size=12),
             fg_color="transparent",
             hover_color=ThemeConfig.BG_HOVER,
             text_color=ThemeConfig.TEXT_MUTED,
@@ -1522,7 +1766,7 @@ class ResearchTerminal(ctk.CTk):
         delete_btn = ctk.CTkButton(
             content,
             text="✕",
-            font=ctk.CTkFont(size=12),
+            font=_font(size=12),
             fg_color="transparent",
             hover_color=ThemeConfig.ACCENT_DANGER,
             text_color=ThemeConfig.TEXT_MUTED,
@@ -1541,22 +1785,19 @@ class ResearchTerminal(ctk.CTk):
         notes_title = ctk.CTkLabel(
             notes_header,
             text="📝 探索笔记",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=18, weight="bold"),
+            font=_font(family="Microsoft YaHei", size=18, weight="bold"),
             text_color=ThemeConfig.TEXT_PRIMARY
         )
         notes_title.pack(side="left", padx=(0, 10))
 
         # 笔记排序模式（放在标题栏右侧）
-        if not hasattr(self, "_note_sort_mode_var"):
-            self._note_sort_mode_var = ctk.StringVar(value="auto")
-
         note_mode_frame = ctk.CTkFrame(notes_header, fg_color="transparent")
         note_mode_frame.pack(side="right", padx=(20, 0))
 
         note_mode_label = ctk.CTkLabel(
             note_mode_frame,
             text="笔记排序:",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=11),
+            font=_font(family="Microsoft YaHei", size=11),
             text_color=ThemeConfig.TEXT_SECONDARY
         )
         note_mode_label.pack(side="left", padx=(0, 8))
@@ -1566,7 +1807,7 @@ class ResearchTerminal(ctk.CTk):
             text="自动",
             variable=self._note_sort_mode_var,
             value="auto",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=11),
+            font=_font(family="Microsoft YaHei", size=11),
             text_color=ThemeConfig.TEXT_SECONDARY,
             fg_color=ThemeConfig.ACCENT_EXPLORING,
             command=self._on_note_sort_mode_change
@@ -1578,7 +1819,7 @@ class ResearchTerminal(ctk.CTk):
             text="手动",
             variable=self._note_sort_mode_var,
             value="manual",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=11),
+            font=_font(family="Microsoft YaHei", size=11),
             text_color=ThemeConfig.TEXT_SECONDARY,
             fg_color=ThemeConfig.ACCENT_EXPLORING,
             command=self._on_note_sort_mode_change
@@ -1589,7 +1830,7 @@ class ResearchTerminal(ctk.CTk):
             note_drag_hint = ctk.CTkLabel(
                 note_mode_frame,
                 text="(拖拽排序)",
-                font=ctk.CTkFont(family="Microsoft YaHei", size=11),
+                font=_font(family="Microsoft YaHei", size=11),
                 text_color=ThemeConfig.TEXT_MUTED
             )
             note_drag_hint.pack(side="left", padx=(8, 0))
@@ -1605,17 +1846,11 @@ class ResearchTerminal(ctk.CTk):
             sort_label = ctk.CTkLabel(
                 sort_frame,
                 text="排序:",
-                font=ctk.CTkFont(family="Microsoft YaHei", size=11),
+                font=_font(family="Microsoft YaHei", size=11),
                 text_color=ThemeConfig.TEXT_SECONDARY
             )
             sort_label.pack(side="left", padx=(0, 8))
 
-            # 初始化排序变量（如果不存在）
-            if not hasattr(self, '_sort_field_var'):
-                self._sort_field_var = ctk.StringVar(value="created_at")
-            if not hasattr(self, '_sort_order_var'):
-                self._sort_order_var = ctk.StringVar(value="desc")
-
             # 排序字段选择
             sort_field_options = [
                 ("⏱️ 创建时间", "created_at"),
@@ -1628,10 +1863,10 @@ class ResearchTerminal(ctk.CTk):
                     text=text,
                     variable=self._sort_field_var,
                     value=value,
-                    font=ctk.CTkFont(family="Microsoft YaHei", size=11),
+                    font=_font(family="Microsoft YaHei", size=11),
                     text_color=ThemeConfig.TEXT_SECONDARY,
                     fg_color=ThemeConfig.ACCENT_EXPLORING,
-                    command=lambda: self._refresh_task_detail(task)
+                    command=lambda: self._schedule_refresh(task)
                 )
                 radio.pack(side="left", padx=(0, 16))
 
@@ -1639,7 +1874,7 @@ class ResearchTerminal(ctk.CTk):
             self.note_sort_order_btn = ctk.CTkButton(
                 sort_frame,
                 text="🔽 降序" if self._sort_order_var.get() == "desc" else "🔼 升序",
-                font=ctk.CTkFont(family="Microsoft YaHei", size=11),
+                font=_font(family="Microsoft YaHei", size=11),
                 fg_color=ThemeConfig.BG_TERTIARY,
                 hover_color=ThemeConfig.ACCENT_EXPLORING,
                 text_color=ThemeConfig.TEXT_SECONDARY,
@@ -1654,7 +1889,7 @@ class ResearchTerminal(ctk.CTk):
         batch_btn = ctk.CTkButton(
             notes_header,
             text="📦 批量管理" if not self.batch_mode else "✅ 完成批量",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=12),
+            font=_font(family="Microsoft YaHei", size=12),
             fg_color=ThemeConfig.BG_TERTIARY,
             hover_color=ThemeConfig.ACCENT_EXPLORING,
             text_color=ThemeConfig.TEXT_SECONDARY,
@@ -1663,14 +1898,15 @@ class ResearchTerminal(ctk.CTk):
             command=lambda: self._toggle_batch_mode(task)
         )
         batch_btn.pack(side="right", padx=(0, 12))
+        self._batch_btn = batch_btn
 
         # 以下按钮仅在未完成状态显示
-        if task.status != TaskStatus.COMPLETED:
+        if task.status is not TaskStatus.COMPLETED:
             # 找到解决方案按钮
             found_solution_btn = ctk.CTkButton(
                 notes_header,
                 text="💡 找到解决方案",
-                font=ctk.CTkFont(family="Microsoft YaHei", size=12),
+                font=_font(family="Microsoft YaHei", size=12),
                 fg_color=ThemeConfig.ACCENT_SUCCESS,
                 hover_color="#2D9142",
                 height=32,
@@ -1683,7 +1919,7 @@ class ResearchTerminal(ctk.CTk):
             add_note_btn = ctk.CTkButton(
                 notes_header,
                 text="➕ 记录探索",
-                font=ctk.CTkFont(family="Microsoft YaHei", size=12),
+                font=_font(family="Microsoft YaHei", size=12),
                 fg_color=ThemeConfig.ACCENT_EXPLORING,
                 hover_color="#D97A35",
                 height=32,
@@ -1694,105 +1930,233 @@ class ResearchTerminal(ctk.CTk):
 
         # 批量操作框（在进入批量模式时显示）
         batch_frame = ctk.CTkFrame(parent, fg_color=ThemeConfig.BG_TERTIARY, corner_radius=10)
+        batch_frame._filled = False
+        self._batch_frame = batch_frame
         
         if self.batch_mode:
+            self._fill_batch_frame(batch_frame, task)
+            # 按钮都创建好后再挂到界面上，只触发一次布局
             batch_frame.pack(fill="x", pady=(0, 16))
-
-            delete_btn = ctk.CTkButton(
-                batch_frame,
-                text="🗑️ 批量删除",
-                font=ctk.CTkFont(family="Microsoft YaHei", size=12),
-                fg_color=ThemeConfig.ACCENT_DANGER,
-                hover_color="#E5534B",
-                height=32,
-                corner_radius=8,
-                command=lambda: self._batch_delete_notes(task)
-            )
-            delete_btn.pack(side="left", padx=12, pady=8)
-
-            move_btn = ctk.CTkButton(
-                batch_frame,
-                text="➡️ 批量移动",
-                font=ctk.CTkFont(family="Microsoft YaHei", size=12),
-                fg_color=ThemeConfig.ACCENT_SUCCESS,
-                hover_color="#2D9142",
-                height=32,
-                corner_radius=8,
-                command=lambda: self._show_batch_move_dialog(task)
-            )
-            move_btn.pack(side="left", padx=12, pady=8)
-
-            export_btn = ctk.CTkButton(
-                batch_frame,
-                text="📤 导出 Markdown",
-                font=ctk.CTkFont(family="Microsoft YaHei", size=12),
-                fg_color=ThemeConfig.ACCENT_PLANNING,
-                hover_color="#4A90D9",
-                height=32,
-                corner_radius=8,
-                command=lambda: self._export_selected_notes(task)
-            )
-            export_btn.pack(side="left", padx=12, pady=8)
         
         # 探索说明
         hint_frame = ctk.CTkFrame(parent, fg_color=ThemeConfig.BG_TERTIARY, corner_radius=10)
         hint_frame.pack(fill="x", pady=(0, 16))
+        self._hint_frame = hint_frame
         
         hint_text = ctk.CTkLabel(
             hint_frame,
             text="💭 在探索模式下，记录你的尝试、发现和思考。当找到解决方案后，可以切换到规划模式进行任务拆解。",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=12),
+            font=_font(family="Microsoft YaHei", size=12),
             text_color=ThemeConfig.TEXT_SECONDARY,
             wraplength=660,
             justify="left"
         )
         hint_text.pack(padx=16, pady=12)
         
-        # 笔记列表
+        # 笔记列表（放在独立容器中，仅排序变化时可以直接调整顺序）
         self._note_items = []
+        self._widget_to_note = {}
+        self._note_item_by_id = {}
+        self._note_items_task_id = task.id
+        self._note_render_state = None
         if task.exploration_notes:
-            if self._is_note_manual_sort_mode():
-                sorted_notes = list(task.exploration_notes)
-            else:
-                # 根据排序选项排序笔记
-                sort_field = self._sort_field_var.get()
-                sort_order = self._sort_order_var.get()
-                is_reverse = (sort_order == "desc")
-
-                if sort_field == "updated_at":
-                    # 按修改时间排序（如果没有updated_at，使用created_at）
-                    sorted_notes = sorted(
-                        task.exploration_notes,
-                        key=lambda n: getattr(n, 'updated_at', n.created_at),
-                        reverse=is_reverse
-                    )
-                else:
-                    # 按创建时间排序
-                    sorted_notes = sorted(
-                        task.exploration_notes,
-                        key=lambda n: n.created_at,
-                        reverse=is_reverse
-                    )
-            
-            for index, note in enumerate(sorted_notes):
-                self._create_note_item(
-                    parent,
+            notes_container = ctk.CTkFrame(parent, fg_color="transparent")
+            self._notes_container = notes_container
+
+            # 首批笔记在未挂载的容器中建好后一次性放入滚动区域，
+            # 避免每添加一条笔记都让滚动区域重新计算布局；
+            # 其余笔记在滚动接近底部时再分批创建
+            manual = self._is_note_manual_sort_mode()
+            selected_ids = self.selected_note_ids
+            sorted_notes = self._sort_notes(task)
+            # 从搜索结果打开时，首批至少渲染到被高亮的笔记
+            highlight_count = 0
+            if highlight_note_id:
+                highlight_count = next(
+                    (i + 1 for i, n in enumerate(sorted_notes) if n.id == highlight_note_id), 0
+                )
+            self._note_render_state = self._lazy_render(
+                parent,
+                sorted_notes,
+                lambda index, note: self._create_note_item(
+                    notes_container,
                     task,
                     note,
                     index,
                     highlight_note_id=highlight_note_id,
-                    selectable=self.batch_mode
-                )
+                    selectable=self.batch_mode,
+                    manual=manual,
+                    is_selected=note.id in selected_ids
+                ),
+                min_count=highlight_count
+            )
+            notes_container.pack(fill="x")
         else:
             empty_label = ctk.CTkLabel(
                 parent,
                 text="暂无探索笔记\n记录你的尝试和发现",
-                font=ctk.CTkFont(family="Microsoft YaHei", size=14),
+                font=_font(family="Microsoft YaHei", size=14),
                 text_color=ThemeConfig.TEXT_MUTED,
                 justify="center"
             )
             empty_label.pack(pady=30)
     
+    def _note_time_str(self, note: ExplorationNote, fmt: str = "%m-%d %H:%M") -> str:
+        """格式化笔记创建时间并缓存
+
+        created_at 在笔记创建后不会再改变（编辑只更新 updated_at），
+        因此按笔记 ID 和格式缓存即可，无需在编辑时失效。
+        """
+        key = (note.id, fmt)
+        time_str = self._time_str_cache.get(key)
+        if time_str is None:
+            time_str = note.created_at.strftime(fmt)
+            self._time_str_cache[key] = time_str
+        return time_str
+
+    def _fill_batch_frame(self, batch_frame, task: Task):
+        """创建批量操作按钮"""
+        delete_btn = ctk.CTkButton(
+            batch_frame,
+            text="🗑️ 批量删除",
+            font=_font(family="Microsoft YaHei", size=12),
+            fg_color=ThemeConfig.ACCENT_DANGER,
+            hover_color="#E5534B",
+            height=32,
+            corner_radius=8,
+            command=lambda: self._batch_delete_notes(task)
+        )
+        delete_btn.pack(side="left", padx=12, pady=8)
+
+        move_btn = ctk.CTkButton(
+            batch_frame,
+            text="➡️ 批量移动",
+            font=_font(family="Microsoft YaHei", size=12),
+            fg_color=ThemeConfig.ACCENT_SUCCESS,
+            hover_color="#2D9142",
+            height=32,
+            corner_radius=8,
+            command=lambda: self._show_batch_move_dialog(task)
+        )
+        move_btn.pack(side="left", padx=12, pady=8)
+
+        export_btn = ctk.CTkButton(
+            batch_frame,
+            text="📤 导出 Markdown",
+            font=_font(family="Microsoft YaHei", size=12),
+            fg_color=ThemeConfig.ACCENT_PLANNING,
+            hover_color="#4A90D9",
+            height=32,
+            corner_radius=8,
+            command=lambda: self._export_selected_notes(task)
+        )
+        export_btn.pack(side="left", padx=12, pady=8)
+        batch_frame._filled = True
+
+    def _sort_notes(self, task: Task) -> list:
+        """按当前排序设置返回笔记列表（手动模式下保持存储顺序）"""
+        if self._is_note_manual_sort_mode():
+            return list(task.exploration_notes)
+
+        # 根据排序选项排序笔记
+        sort_field = self._sort_field_var.get()
+        sort_order = self._sort_order_var.get()
+
+        # 任务的笔记增删改都会更新 task.updated_at，据此复用上一次的排序结果。
+        # 缓存只保存升序结果，降序由它反转得到，切换排序方向时无需重新排序。
+        cache_key = (task.id, sort_field, len(task.exploration_notes), task.updated_at)
+        cache = self._sorted_notes_cache
+        if cache is None or cache["key"] != cache_key:
+            cache = {
+                "key": cache_key,
+                "asc": sorted(task.exploration_notes, key=attrgetter(sort_field)),
+                "desc": None,
+            }
+            self._sorted_notes_cache = cache
+
+        if sort_order != "desc":
+            return cache["asc"]
+        if cache["desc"] is None:
+            cache["desc"] = cache["asc"][::-1]
+        return cache["desc"]
+
+    def _rebind_note_items(self, task: Task) -> bool:
+        """仅排序变化时复用已有的笔记控件，按新顺序重新排列
+
+        列表只渲染了前一部分时，保持已渲染条数不变：新顺序前列中已有的控件直接复用，
+        缺少的补建，移出前列的销毁；其余笔记交给分批渲染按新顺序继续追加。
+        笔记集合与渲染时不一致时返回 False，表示需要完整重建。
+        """
+        state = self._note_render_state
+        if self._note_items_task_id != task.id or not self._note_items or state is None:
+            return False
+        if not self._notes_container.winfo_exists():
+            return False
+
+        sorted_notes = self._sort_notes(task)
+        if (len(sorted_notes) != len(state["items"])
+                or {n.id for n in sorted_notes} != {n.id for n in state["items"]}):
+            return False
+
+        items_by_id = self._note_item_by_id
+        head = sorted_notes[:state["rendered"]]
+        head_ids = {n.id for n in head}
+        for note_id in [note_id for note_id in items_by_id if note_id not in head_ids]:
+            widget = items_by_id.pop(note_id)["widget"]
+            del self._widget_to_note[str(widget)]
+            widget.destroy()
+
+        for item_data in self._note_items:
+            if item_data["note"].id in items_by_id:
+                item_data["widget"].pack_forget()
+        self._note_items = []
+        create_item = state["create"]
+        for index, note in enumerate(head):
+            item_data = items_by_id.get(note.id)
+            if item_data is None:
+                # 新建的条目由 _create_note_item 追加并放在末尾，正好是当前位置
+                create_item(index, note)
+                continue
+            self._note_items.append(item_data)
+            item_data["widget"].pack(fill="x", pady=6)
+            item_data["widget"]._index = index
+        state["items"] = sorted_notes
+        return True
+
+    def _replace_note_item(self, task: Task, note: ExplorationNote) -> bool:
+        """笔记编辑后只重建这一条笔记的控件并放回原位置
+
+        笔记不在当前列表中、或编辑会改变它的排序位置时返回 False，由调用方完整重建。
+        """
+        if self._note_items_task_id != task.id or not self._note_items:
+            return False
+        if not self._notes_container.winfo_exists():
+            return False
+        if not self._is_note_manual_sort_mode() and self._sort_field_var.get() == "updated_at":
+            return False
+        old_entry = self._note_item_by_id.get(note.id)
+        if old_entry is None:
+            return False
+
+        old_widget = old_entry["widget"]
+        position = old_widget._index
+        entry = self._create_note_item(
+            self._notes_container,
+            task,
+            note,
+            position,
+            selectable=self.batch_mode,
+            manual=self._is_note_manual_sort_mode(),
+            is_selected=note.id in self.selected_note_ids
+        )
+        # 新条目被追加在末尾，移回原位置
+        self._note_items.pop()
+        self._note_items[position] = entry
+        entry["widget"].pack_configure(before=old_widget)
+        del self._widget_to_note[str(old_widget)]
+        old_widget.destroy()
+        return True
+
     def _create_note_item(
         self,
         parent,
@@ -1800,144 +2164,139 @@ class ResearchTerminal(ctk.CTk):
         note: ExplorationNote,
         index: int,
         highlight_note_id: Optional[str] = None,
-        selectable: bool = False
+        selectable: bool = False,
+        manual: bool = False,
+        is_selected: bool = False
     ):
-        """创建笔记项"""
+        """创建笔记项
+
+        manual 为笔记是否处于手动排序模式，is_selected 为批量模式下是否已选中，
+        均由调用方统一计算后传入。
+        """
+        # 主题颜色在下面的控件参数中反复使用，先绑定为局部变量
+        accent_warning = ThemeConfig.ACCENT_WARNING
+        bg_tertiary = ThemeConfig.BG_TERTIARY
+        text_muted = ThemeConfig.TEXT_MUTED
+
         if highlight_note_id and note.id == highlight_note_id:
             border_color = ThemeConfig.ACCENT_SUCCESS
         else:
-            border_color = ThemeConfig.ACCENT_WARNING if note.is_breakthrough else ThemeConfig.BORDER_DEFAULT
-        drag_cursor = "hand2" if self._is_note_manual_sort_mode() else "arrow"
+            border_color = accent_warning if note.is_breakthrough else ThemeConfig.BORDER_DEFAULT
+        drag_cursor = "hand2" if manual else "arrow"
         
         item = ctk.CTkFrame(
             parent,
-            fg_color=ThemeConfig.BG_TERTIARY,
+            fg_color=bg_tertiary,
             corner_radius=12,
             border_width=2 if note.is_breakthrough else 1,
             border_color=border_color,
             cursor=drag_cursor
         )
         item.pack(fill="x", pady=6)
-        self._note_items.append({"widget": item, "note": note})
-        def bind_note_drag(widget):
-            widget.bind("<Button-1>", lambda e, it=item, t=task, n=note, i=index: self._on_note_drag_start(e, it, t, n, i))
-            widget.bind("<B1-Motion>", lambda e, it=item: self._on_note_drag_motion(e, it))
-            widget.bind("<ButtonRelease-1>", lambda e, n=note: self._on_note_drag_end(e, n))
-        if self._is_note_manual_sort_mode():
-            bind_note_drag(item)
+        item._index = index
+        note_entry = {"widget": item, "note": note, "header": None, "checkbox": None, "checkbox_before": None}
+        self._note_items.append(note_entry)
+        self._note_item_by_id[note.id] = note_entry
+        self._widget_to_note[str(item)] = (task, note, item)
+        if manual:
+            self._tag_note_draggable(item)
         
         content = ctk.CTkFrame(item, fg_color="transparent", cursor=drag_cursor)
         content.pack(fill="x", padx=16, pady=12)
-        if self._is_note_manual_sort_mode():
-            bind_note_drag(content)
+        if manual:
+            self._tag_note_draggable(content)
         
         # 头部
         header = ctk.CTkFrame(content, fg_color="transparent")
         header.pack(fill="x")
-        if self._is_note_manual_sort_mode():
-            bind_note_drag(header)
+        if manual:
+            self._tag_note_draggable(header)
 
+        note_entry["header"] = header
         if selectable:
-            checkbox_var = ctk.BooleanVar(value=note.id in self.selected_note_ids)
-            checkbox = ctk.CTkCheckBox(
-                header,
-                text="",
-                variable=checkbox_var,
-                width=24,
-                fg_color=ThemeConfig.ACCENT_SUCCESS,
-                hover_color=ThemeConfig.ACCENT_SUCCESS,
-                border_color=ThemeConfig.BORDER_DEFAULT,
-                command=lambda: self._toggle_note_selection(note.id, checkbox_var.get())
-            )
+            checkbox = self._create_note_checkbox(header, note, is_selected)
             checkbox.pack(side="left", padx=(0, 8))
+            note_entry["checkbox"] = checkbox
         
         # 突破标记
         if note.is_breakthrough:
             breakthrough_label = ctk.CTkLabel(
                 header,
                 text="⭐ 突破性发现",
-                font=ctk.CTkFont(family="Microsoft YaHei", size=11, weight="bold"),
-                text_color=ThemeConfig.ACCENT_WARNING,
+                font=_font(family="Microsoft YaHei", size=11, weight="bold"),
+                text_color=accent_warning,
                 cursor=drag_cursor
             )
             breakthrough_label.pack(side="left", padx=(0, 8))
-            if self._is_note_manual_sort_mode():
-                bind_note_drag(breakthrough_label)
+            note_entry["checkbox_before"] = breakthrough_label
+            if manual:
+                self._tag_note_draggable(breakthrough_label)
         
         # 时间
-        time_str = note.created_at.strftime("%m-%d %H:%M")
+        time_str = self._note_time_str(note)
         time_label = ctk.CTkLabel(
             header,
             text=time_str,
-            font=ctk.CTkFont(family="Microsoft YaHei", size=11),
-            text_color=ThemeConfig.TEXT_MUTED,
+            font=_font(family="Microsoft YaHei", size=11),
+            text_color=text_muted,
             cursor=drag_cursor
         )
         time_label.pack(side="left")
-        if self._is_note_manual_sort_mode():
-            bind_note_drag(time_label)
-        
-        # 删除按钮
-        delete_btn = ctk.CTkButton(
-            header,
-            text="✕",
-            font=ctk.CTkFont(size=12),
-            fg_color="transparent",
-            hover_color=ThemeConfig.ACCENT_DANGER,
-            text_color=ThemeConfig.TEXT_MUTED,
-            width=28,
-            height=28,
-            command=lambda: self._delete_note(task, note)
-        )
-        delete_btn.pack(side="right")
-
-        # 编辑按钮
-        edit_btn = ctk.CTkButton(
-            header,
-            text="✏️",
-            font=ctk.CTkFont(size=12),
-            fg_color="transparent",
-            hover_color=ThemeConfig.ACCENT_PLANNING,
-            text_color=ThemeConfig.TEXT_MUTED,
-            width=28,
-            height=28,
-            command=lambda: self._edit_note_dialog(task, note)
-        )
-        edit_btn.pack(side="right", padx=(0, 8))
-
-        # 移动按钮
-        move_btn = ctk.CTkButton(
-            header,
-            text="➡️",
-            font=ctk.CTkFont(size=12),
-            fg_color="transparent",
-            hover_color=ThemeConfig.ACCENT_SUCCESS,
-            text_color=ThemeConfig.TEXT_MUTED,
-            width=28,
-            height=28,
-            command=lambda: self._show_move_note_dialog(task, note)
-        )
-        move_btn.pack(side="right", padx=(0, 8))
-
-        # 复制按钮
-        copy_btn = ctk.CTkButton(
+        if note_entry["checkbox_before"] is None:
+            note_entry["checkbox_before"] = time_label
+        if manual:
+            self._tag_note_draggable(time_label)
+        
+        # 操作按钮：四个图标画在同一个 Canvas 上，按点击位置分发，
+        # 代替四个各自带圆角画布的 CTkButton
+        actions = [
+            (glyph, getattr(ThemeConfig, hover_attr), functools.partial(getattr(self, method_name), task, note))
+            for glyph, hover_attr, method_name in NOTE_ACTIONS
+        ]
+        slot = 36
+        action_canvas = tk.Canvas(
             header,
-            text="📋",
-            font=ctk.CTkFont(size=12),
-            fg_color="transparent",
-            hover_color=ThemeConfig.ACCENT_PLANNING,
-            text_color=ThemeConfig.TEXT_MUTED,
-            width=28,
+            width=slot * len(actions) - 8,
             height=28,
-            command=lambda: self._show_copy_note_dialog(task, note)
-        )
-        copy_btn.pack(side="right", padx=(0, 8))
+            bg=bg_tertiary,
+            highlightthickness=0,
+            bd=0,
+            cursor="hand2"
+        )
+        action_canvas.pack(side="right")
+        # 每个图标下方有一块悬停时才填色的背景
+        hover_ids = []
+        for i, (icon, _, _) in enumerate(actions):
+            hover_ids.append(action_canvas.create_rectangle(slot * i, 0, slot * i + 28, 28, fill="", outline=""))
+            action_canvas.create_text(slot * i + 14, 14, text=icon, font=_font(size=12), fill=text_muted)
+
+        def action_at(x):
+            i = int(x) // slot
+            return i if 0 <= i < len(actions) and x - i * slot < 28 else None
+
+        def on_action_click(event):
+            i = action_at(event.x)
+            if i is not None:
+                actions[i][2]()
+
+        def on_action_hover(event):
+            i = action_at(event.x)
+            for j, hover_id in enumerate(hover_ids):
+                action_canvas.itemconfigure(hover_id, fill=actions[j][1] if j == i else "")
+
+        def on_action_leave(event):
+            for hover_id in hover_ids:
+                action_canvas.itemconfigure(hover_id, fill="")
+
+        action_canvas.bind("<Button-1>", on_action_click)
+        action_canvas.bind("<Motion>", on_action_hover)
+        action_canvas.bind("<Leave>", on_action_leave)
         
         # 内容
         content_label = ctk.CTkLabel(
             content,
             text=note.content,
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
+            font=_font(family="Microsoft YaHei", size=13),
             text_color=ThemeConfig.TEXT_PRIMARY,
             anchor="w",
             justify="left",
@@ -1945,8 +2304,8 @@ class ResearchTerminal(ctk.CTk):
             wraplength=640
         )
         content_label.pack(fill="x", pady=(10, 0), anchor="w")
-        if self._is_note_manual_sort_mode():
-            bind_note_drag(content_label)
+        if manual:
+            self._tag_note_draggable(content_label)
         
         # 洞察
         if note.insight:
@@ -1956,7 +2315,7 @@ class ResearchTerminal(ctk.CTk):
             insight_label = ctk.CTkLabel(
                 insight_frame,
                 text=f"💡 {note.insight}",
-                font=ctk.CTkFont(family="Microsoft YaHei", size=12),
+                font=_font(family="Microsoft YaHei", size=12),
                 text_color=ThemeConfig.ACCENT_PLANNING,
                 anchor="w",
                 justify="left",
@@ -1964,15 +2323,55 @@ class ResearchTerminal(ctk.CTk):
                 wraplength=620
             )
             insight_label.pack(padx=12, pady=8, anchor="w")
-            if self._is_note_manual_sort_mode():
-                bind_note_drag(insight_frame)
-                bind_note_drag(insight_label)
+            if manual:
+                self._tag_note_draggable(insight_frame)
+                self._tag_note_draggable(insight_label)
+        return note_entry
+
+    def _create_note_checkbox(self, header, note: ExplorationNote, is_selected: bool = False):
+        """创建批量选择复选框（未放置）"""
+        # 选中状态由 selected_note_ids 维护，复选框不再绑定 Tcl 变量
+        checkbox = ctk.CTkCheckBox(
+            header,
+            text="",
+            width=24,
+            fg_color=ThemeConfig.ACCENT_SUCCESS,
+            hover_color=ThemeConfig.ACCENT_SUCCESS,
+            border_color=ThemeConfig.BORDER_DEFAULT,
+            command=lambda: self._toggle_note_selection(note.id, bool(checkbox.get()))
+        )
+        if is_selected:
+            checkbox.select()
+        return checkbox
 
     def _toggle_batch_mode(self, task: Task):
+        """切换批量模式：只显示/隐藏复选框和批量操作框，不重建详情页"""
         self.batch_mode = not self.batch_mode
         if not self.batch_mode:
             self.selected_note_ids = set()
-        self._show_task_detail(task)
+
+        if self._batch_frame is None or not self._batch_frame.winfo_exists():
+            self._show_task_detail(task)
+            return
+
+        self._batch_btn.configure(text="✅ 完成批量" if self.batch_mode else "📦 批量管理")
+        if self.batch_mode:
+            if not self._batch_frame._filled:
+                self._fill_batch_frame(self._batch_frame, task)
+            self._batch_frame.pack(fill="x", pady=(0, 16), before=self._hint_frame)
+            for entry in self._note_items:
+                checkbox = entry["checkbox"]
+                if checkbox is None:
+                    checkbox = self._create_note_checkbox(entry["header"], entry["note"])
+                    entry["checkbox"] = checkbox
+                else:
+                    checkbox.deselect()
+                checkbox.pack(side="left", padx=(0, 8), before=entry["checkbox_before"])
+        else:
+            self._batch_frame.pack_forget()
+            for entry in self._note_items:
+                if entry["checkbox"] is not None:
+                    entry["checkbox"].pack_forget()
 
     def _toggle_sort_order(self, task: Task):
         """切换探索笔记排序方向"""
@@ -1980,11 +2379,11 @@ class ResearchTerminal(ctk.CTk):
         new_order = "asc" if current_order == "desc" else "desc"
         self._sort_order_var.set(new_order)
         # 更新按钮文字
-        if hasattr(self, 'note_sort_order_btn') and self.note_sort_order_btn.winfo_exists():
+        if self.note_sort_order_btn is not None and self.note_sort_order_btn.winfo_exists():
             self.note_sort_order_btn.configure(
                 text="🔽 降序" if new_order == "desc" else "🔼 升序"
             )
-        self._refresh_task_detail(task)
+        self._schedule_refresh(task)
     
     def _toggle_task_sort_order(self):
         """切换任务列表排序方向"""
@@ -1997,8 +2396,23 @@ class ResearchTerminal(ctk.CTk):
         )
         self._refresh_task_list()
     
+    def _schedule_refresh(self, task: Task):
+        """延迟刷新任务详情，连续快速切换排序时只刷新一次"""
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.after(16, lambda: self._run_scheduled_refresh(task))
+
+    def _run_scheduled_refresh(self, task: Task):
+        self._refresh_after_id = None
+        # 等待期间用户可能已切换到其他任务
+        if self.selected_task is None or self.selected_task.id != task.id:
+            return
+        self._refresh_task_detail(task)
+
     def _refresh_task_detail(self, task: Task):
         """刷新任务详情显示（保持批量模式状态）"""
+        if self._rebind_note_items(task):
+            return
         self._show_task_detail(task)
 
     def _toggle_note_selection(self, note_id: str, selected: bool):
@@ -2024,20 +2438,20 @@ class ResearchTerminal(ctk.CTk):
             messagebox.showwarning("提示", "请选择要移动的笔记")
             return
 
+        bg_tertiary = ThemeConfig.BG_TERTIARY
+        text_primary = ThemeConfig.TEXT_PRIMARY
+        text_secondary = ThemeConfig.TEXT_SECONDARY
+        text_muted = ThemeConfig.TEXT_MUTED
+
         dialog = ctk.CTkToplevel(self)
         dialog.title("批量移动探索笔记")
         dialog_width, dialog_height = 520, 480
-        dialog.geometry(f"{dialog_width}x{dialog_height}")
+        dialog.geometry(self._center_geometry(dialog_width, dialog_height))
         dialog.minsize(dialog_width, 420)
         dialog.transient(self)
         dialog.grab_set()
         dialog.configure(fg_color=ThemeConfig.BG_SECONDARY)
 
-        dialog.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() - dialog_width) // 2
-        y = self.winfo_y() + (self.winfo_height() - dialog_height) // 2
-        dialog.geometry(f"+{x}+{y}")
-
         content = ctk.CTkFrame(dialog, fg_color="transparent")
         content.pack(fill="both", expand=True, padx=24, pady=24)
         content.grid_columnconfigure(0, weight=1)
@@ -2046,8 +2460,8 @@ class ResearchTerminal(ctk.CTk):
         title_label = ctk.CTkLabel(
             content,
             text="➡️ 批量移动探索笔记",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=18, weight="bold"),
-            text_color=ThemeConfig.TEXT_PRIMARY
+            font=_font(family="Microsoft YaHei", size=18, weight="bold"),
+            text_color=text_primary
         )
         title_label.grid(row=0, column=0, sticky="w", pady=(0, 16))
 
@@ -2057,59 +2471,65 @@ class ResearchTerminal(ctk.CTk):
         target_label = ctk.CTkLabel(
             target_frame,
             text="选择目标任务",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            text_color=ThemeConfig.TEXT_SECONDARY
+            font=_font(family="Microsoft YaHei", size=13),
+            text_color=text_secondary
         )
         target_label.pack(anchor="w", pady=(0, 12))
 
-        tasks = [t for t in self.db.get_all_tasks() if t.id != current_task.id]
+        # 只需要 (id, 标题)，使用按来源任务缓存的目标列表
+        tasks = self.db.get_other_tasks(current_task.id)
 
         list_frame = ctk.CTkFrame(content, fg_color="transparent")
         list_frame.grid(row=2, column=0, sticky="nsew")
 
-        scrollable = ctk.CTkScrollableFrame(
-            list_frame,
-            fg_color=ThemeConfig.BG_TERTIARY,
-            corner_radius=10,
-            height=160,
-            width=460
-        )
-        scrollable.pack(fill="both", expand=True, pady=(0, 8))
-
         self._batch_target_task_id = ctk.StringVar(value="")
 
         selected_label = ctk.CTkLabel(
             content,
             text="已选择：无",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=12),
-            text_color=ThemeConfig.TEXT_MUTED
+            font=_font(family="Microsoft YaHei", size=12),
+            text_color=text_muted
         )
         selected_label.grid(row=3, column=0, sticky="w", pady=(4, 0))
 
-        def select_target(task: Task):
-            self._batch_target_task_id.set(task.id)
-            selected_label.configure(text=f"已选择：{task.title}")
+        def select_target(task_id: str, title: str):
+            self._batch_target_task_id.set(task_id)
+            selected_label.configure(text=f"已选择：{title}")
 
         if tasks:
-            for task in tasks:
-                btn = ctk.CTkButton(
-                    scrollable,
-                    text=f"📝 {task.title}",
-                    font=ctk.CTkFont(family="Microsoft YaHei", size=12),
-                    text_color=ThemeConfig.TEXT_PRIMARY,
-                    fg_color=ThemeConfig.BG_HOVER,
-                    hover_color=ThemeConfig.ACCENT_PLANNING,
-                    height=32,
-                    corner_radius=8,
-                    command=lambda t=task: select_target(t)
-                )
-                btn.pack(fill="x", padx=12, pady=6)
+            # 原生 Listbox 一次绘制全部条目，不为每个任务创建控件
+            listbox = tk.Listbox(
+                list_frame,
+                height=8,
+                bg=bg_tertiary,
+                fg=text_primary,
+                selectbackground=ThemeConfig.ACCENT_PLANNING,
+                selectforeground=text_primary,
+                highlightthickness=0,
+                bd=0,
+                font=("Microsoft YaHei", 12),
+                activestyle="none",
+                exportselection=False
+            )
+            scrollbar = tk.Scrollbar(list_frame, command=listbox.yview)
+            listbox.configure(yscrollcommand=scrollbar.set)
+            scrollbar.pack(side="right", fill="y", pady=(0, 8))
+            listbox.pack(side="left", fill="both", expand=True, pady=(0, 8))
+
+            listbox.insert("end", *(f"📝 {title}" for _, title in tasks))
+
+            def on_listbox_select(event):
+                selection = listbox.curselection()
+                if selection:
+                    select_target(*tasks[selection[0]])
+
+            listbox.bind("<<ListboxSelect>>", on_listbox_select)
         else:
             empty_label = ctk.CTkLabel(
-                scrollable,
+                list_frame,
                 text="暂无可移动的目标任务",
-                font=ctk.CTkFont(family="Microsoft YaHei", size=14),
-                text_color=ThemeConfig.TEXT_MUTED
+                font=_font(family="Microsoft YaHei", size=14),
+                text_color=text_muted
             )
             empty_label.pack(pady=30)
 
@@ -2119,10 +2539,10 @@ class ResearchTerminal(ctk.CTk):
         cancel_btn = ctk.CTkButton(
             btn_frame,
             text="取消",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
+            font=_font(family="Microsoft YaHei", size=13),
+            fg_color=bg_tertiary,
             hover_color=ThemeConfig.BG_HOVER,
-            text_color=ThemeConfig.TEXT_SECONDARY,
+            text_color=text_secondary,
             height=38,
             corner_radius=10,
             command=dialog.destroy
@@ -2130,10 +2550,8 @@ class ResearchTerminal(ctk.CTk):
         cancel_btn.pack(side="left", fill="x", expand=True, padx=(0, 8))
 
         def move():
-            print("DEBUG: move() 函数被调用")  # 调试信息
             target_id = self._batch_target_task_id.get()
-            print(f"DEBUG: target_id = {target_id}")  # 调试信息
-            print(f"DEBUG: selected_note_ids = {self.selected_note_ids}")  # 调试信息
+            logger.debug("批量移动笔记：target_id=%s, selected_note_ids=%s", target_id, self.selected_note_ids)
             
             if not target_id:
                 messagebox.showwarning("提示", "请选择目标任务")
@@ -2143,42 +2561,38 @@ class ResearchTerminal(ctk.CTk):
                 moved_count = len(self.selected_note_ids)
                 note_ids_list = list(self.selected_note_ids)
                 
-                print(f"DEBUG: 准备移动 {moved_count} 条笔记")  # 调试信息
-                
+                logger.debug("准备移动 %d 条笔记", moved_count)
+
                 success = self.db.batch_move_exploration_notes(
                     current_task.id,
                     target_id,
                     note_ids_list
                 )
-                
-                print(f"DEBUG: 移动结果 = {success}")  # 调试信息
+                logger.debug("移动结果 = %s", success)
                 
                 if success:
                     self.selected_note_ids = set()
                     self.batch_mode = False
                     dialog.destroy()
                     
-                    # 刷新任务列表
-                    self._refresh_task_list()
-                    
-                    # 跳转到目标任务
+                    # 跳转到目标任务（同时刷新任务列表）
                     target_task = self.db.get_task(target_id)
                     if target_task:
-                        self._select_task(target_task)
+                        self._select_task(target_task, refresh=True)
+                    else:
+                        self._refresh_task_list()
                     
                     messagebox.showinfo("成功", f"已移动 {moved_count} 条笔记")
                 else:
                     messagebox.showerror("失败", "移动笔记失败")
             except Exception as e:
-                print(f"DEBUG: 异常 = {e}")  # 调试信息
-                import traceback
-                traceback.print_exc()
+                logger.exception("批量移动笔记出错")
                 messagebox.showerror("错误", f"移动过程中出错：{str(e)}")
 
         move_btn = ctk.CTkButton(
             btn_frame,
             text="移动",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13, weight="bold"),
+            font=_font(family="Microsoft YaHei", size=13, weight="bold"),
             fg_color=ThemeConfig.ACCENT_SUCCESS,
             hover_color="#2D9142",
             height=38,
@@ -2186,7 +2600,6 @@ class ResearchTerminal(ctk.CTk):
             command=move
         )
         move_btn.pack(side="right", fill="x", expand=True)
-        print(f"DEBUG: 移动按钮已创建")  # 调试信息
 
     def _export_selected_notes(self, task: Task):
         if not self.selected_note_ids:
@@ -2201,104 +2614,252 @@ class ResearchTerminal(ctk.CTk):
         if not path:
             return
 
-        selected_notes = [n for n in task.exploration_notes if n.id in self.selected_note_ids]
-        selected_notes.sort(key=lambda n: n.created_at)
-
-        lines = [f"# 任务：{task.title}", ""]
-        for note in selected_notes:
-            time_str = note.created_at.strftime("%Y-%m-%d %H:%M")
-            lines.append(f"- {time_str} {note.content}")
-            if note.insight:
-                lines.append(f"  - 洞察：{note.insight}")
-            lines.append(f"  - 突破：{'是' if note.is_breakthrough else '否'}")
+        selected_notes = sorted(
+            filter(None, map(task.get_exploration_note, self.selected_note_ids)),
+            key=attrgetter('created_at')
+        )
 
+        # 逐条写入文件，不在内存中拼接整份文档
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write("\n".join(lines))
+            with open(path, "w", encoding="utf-8", buffering=1 << 16) as f:
+                write = f.write
+                write(f"# 任务：{task.title}\n")
+                for note in selected_notes:
+                    time_str = self._note_time_str(note, "%Y-%m-%d %H:%M")
+                    write(f"\n- {time_str} {note.content}")
+                    if note.insight:
+                        write(f"\n  - 洞察：{note.insight}")
+                    write(f"\n  - 突破：{'是' if note.is_breakthrough else '否'}")
         except OSError:
             messagebox.showwarning("提示", "保存失败，请检查路径权限")
     
     # ==================== 对话框 ====================
     
+    def _schedule_post_save(self, task_id: str, refresh_list: bool = True, select: bool = False):
+        """在空闲时统一刷新保存后的界面
+
+        对话框先关闭，刷新推迟到 after_idle；同一任务的连续多次保存只合并为一次刷新。
+        refresh_list 表示需要重建任务列表，select 表示以选中方式重新显示任务。
+        """
+        pending = self._pending_post_save
+        if pending is not None:
+            if pending["task_id"] == task_id:
+                pending["refresh_list"] |= refresh_list
+                pending["select"] |= select
+                return
+            # 换了任务：先完成上一个任务的刷新，避免它被覆盖丢失；已排队的空闲回调留给本次刷新
+            self._do_post_save()
+            self._pending_post_save = {"task_id": task_id, "refresh_list": refresh_list, "select": select}
+            return
+        self._pending_post_save = {"task_id": task_id, "refresh_list": refresh_list, "select": select}
+        self.after_idle(self._do_post_save)
+
+    def _do_post_save(self):
+        """执行合并后的保存后刷新"""
+        pending, self._pending_post_save = self._pending_post_save, None
+        task = self.db.get_task(pending["task_id"])
+        if not task:
+            return
+        if pending["select"]:
+            self._select_task(task, refresh=pending["refresh_list"])
+        else:
+            if pending["refresh_list"]:
+                self._refresh_task_list()
+            self._show_task_detail(task)
+        self._refresh_tracker_if_visible()
+
+    def _confirm(self, title: str, message: str) -> bool:
+        """复用的确认对话框，返回用户是否确认"""
+        def build(dialog):
+            result = tk.IntVar(dialog, value=0)
+            dialog.resizable(False, False)
+            dialog.protocol("WM_DELETE_WINDOW", lambda: result.set(0))
+
+            message_label = ctk.CTkLabel(
+                dialog,
+                font=_font(family="Microsoft YaHei", size=14),
+                text_color=ThemeConfig.TEXT_PRIMARY,
+                wraplength=340,
+                justify="left"
+            )
+            message_label.pack(anchor="w", fill="x", expand=True, padx=24, pady=(24, 20))
+
+            btn_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+            btn_frame.pack(fill="x", padx=24, pady=(0, 24))
+
+            cancel_btn = ctk.CTkButton(
+                btn_frame,
+                text="取消",
+                font=_font(family="Microsoft YaHei", size=13),
+                height=38,
+                command=lambda: result.set(0),
+                **_BTN_CANCEL_KW
+            )
+            cancel_btn.pack(side="left", fill="x", expand=True, padx=(0, 8))
+
+            ok_btn = ctk.CTkButton(
+                btn_frame,
+                text="确定",
+                font=_font(family="Microsoft YaHei", size=13, weight="bold"),
+                height=38,
+                command=lambda: result.set(1),
+                **_BTN_PRIMARY_KW
+            )
+            ok_btn.pack(side="right", fill="x", expand=True)
+            return {"message": message_label, "result": result}
+
+        dialog, widgets = self._get_or_build_dialog("confirm", title, 400, 180, build)
+        dialog.title(title)
+        widgets["message"].configure(text=message)
+        result = widgets["result"]
+        dialog.wait_variable(result)
+        self._close_pooled_dialog(dialog)
+        return bool(result.get())
+
+    def _on_root_configure(self, event):
+        """主窗口移动或缩放时更新几何缓存"""
+        self._main_geometry = (self.winfo_x(), self.winfo_y(), event.width, event.height)
+
+    def _center_geometry(self, width: int, height: int) -> str:
+        """返回在主窗口中居中的对话框几何字符串（WxH+X+Y）"""
+        if self._main_geometry is None:
+            self._main_geometry = (self.winfo_x(), self.winfo_y(), self.winfo_width(), self.winfo_height())
+        main_x, main_y, main_w, main_h = self._main_geometry
+        x = main_x + (main_w - width) // 2
+        y = main_y + (main_h - height) // 2
+        return f"{width}x{height}+{x}+{y}"
+
+    def _get_or_build_dialog(self, kind: str, title: str, width: int, height: int,
+                             build: Callable) -> tuple:
+        """获取可复用的对话框外壳
+
+        首次打开时创建窗口并调用 build(dialog) 构建控件（返回控件字典），
+        之后关闭只是隐藏，再次打开直接复用，调用方只需重置内容并重新绑定保存回调。
+        返回 (dialog, widgets)。
+        """
+        pooled = self._dialog_pool.get(kind)
+        if pooled is None or not pooled[0].winfo_exists():
+            dialog = ctk.CTkToplevel(self)
+            dialog.withdraw()
+            dialog.title(title)
+            dialog.transient(self)
+            dialog.configure(fg_color=ThemeConfig.BG_SECONDARY)
+            dialog.protocol("WM_DELETE_WINDOW", lambda: self._close_pooled_dialog(dialog))
+            pooled = self._dialog_pool[kind] = (dialog, build(dialog))
+
+        dialog = pooled[0]
+        dialog.geometry(self._center_geometry(width, height))
+        dialog.deiconify()
+        dialog.grab_set()
+        return pooled
+
+    def _close_pooled_dialog(self, dialog):
+        """关闭复用对话框：释放输入抓取并隐藏，而不是销毁"""
+        dialog.grab_release()
+        dialog.withdraw()
+
+    def _build_dialog_buttons(self, dialog, save_text: str, fg_color: str, hover_color: str):
+        """构建复用对话框底部的取消/保存按钮，返回保存按钮（回调在每次打开时绑定）"""
+        btn_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        btn_frame.pack(fill="x", padx=24, pady=(0, 24))
+
+        cancel_btn = ctk.CTkButton(
+            btn_frame,
+            text="取消",
+            font=_font(family="Microsoft YaHei", size=13),
+            height=38,
+            command=lambda: self._close_pooled_dialog(dialog),
+            **_BTN_CANCEL_KW
+        )
+        cancel_btn.pack(side="left", fill="x", expand=True, padx=(0, 8))
+
+        save_btn = ctk.CTkButton(
+            btn_frame,
+            text=save_text,
+            font=_font(family="Microsoft YaHei", size=13, weight="bold"),
+            fg_color=fg_color,
+            hover_color=hover_color,
+            height=38,
+            corner_radius=10
+        )
+        save_btn.pack(side="right", fill="x", expand=True)
+        return save_btn
+
     def _show_new_task_dialog(self):
         """显示新建任务对话框"""
+        bg_tertiary = ThemeConfig.BG_TERTIARY
+        text_primary = ThemeConfig.TEXT_PRIMARY
+        text_secondary = ThemeConfig.TEXT_SECONDARY
+        border_default = ThemeConfig.BORDER_DEFAULT
+
         dialog = ctk.CTkToplevel(self)
         dialog.title("新建任务")
-        dialog.geometry("520x480")
+        dialog.geometry(self._center_geometry(520, 480))
         dialog.transient(self)
         dialog.grab_set()
         dialog.configure(fg_color=ThemeConfig.BG_SECONDARY)
         
-        # 居中显示
-        dialog.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() - 520) // 2
-        y = self.winfo_y() + (self.winfo_height() - 480) // 2
-        dialog.geometry(f"+{x}+{y}")
-        
-        content = ctk.CTkFrame(dialog, fg_color="transparent")
-        content.pack(fill="both", expand=True, padx=24, pady=24)
-        
         # 标题
         title_label = ctk.CTkLabel(
-            content,
+            dialog,
             text="📋 创建新任务",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=20, weight="bold"),
-            text_color=ThemeConfig.TEXT_PRIMARY
+            font=_font(family="Microsoft YaHei", size=20, weight="bold"),
+            text_color=text_primary
         )
-        title_label.pack(anchor="w", pady=(0, 20))
+        title_label.pack(anchor="w", padx=24, pady=(24, 20))
         
         # 任务标题
         name_label = ctk.CTkLabel(
-            content,
+            dialog,
             text="任务标题",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            text_color=ThemeConfig.TEXT_SECONDARY
+            font=_font(family="Microsoft YaHei", size=13),
+            text_color=text_secondary
         )
-        name_label.pack(anchor="w", pady=(0, 6))
+        name_label.pack(anchor="w", padx=24, pady=(0, 6))
         
         title_entry = ctk.CTkEntry(
-            content,
+            dialog,
             placeholder_text="输入任务标题...",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=14),
-            fg_color=ThemeConfig.BG_TERTIARY,
-            border_color=ThemeConfig.BORDER_DEFAULT,
+            font=_font(family="Microsoft YaHei", size=14),
+            fg_color=bg_tertiary,
+            border_color=border_default,
             height=42,
             corner_radius=10
         )
-        title_entry.pack(fill="x", pady=(0, 16))
+        title_entry.pack(fill="x", padx=24, pady=(0, 16))
         
         # 任务描述
         desc_label = ctk.CTkLabel(
-            content,
+            dialog,
             text="任务描述（可选）",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            text_color=ThemeConfig.TEXT_SECONDARY
+            font=_font(family="Microsoft YaHei", size=13),
+            text_color=text_secondary
         )
-        desc_label.pack(anchor="w", pady=(0, 6))
+        desc_label.pack(anchor="w", padx=24, pady=(0, 6))
         
         desc_entry = ctk.CTkTextbox(
-            content,
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
-            border_color=ThemeConfig.BORDER_DEFAULT,
+            dialog,
+            font=_font(family="Microsoft YaHei", size=13),
+            fg_color=bg_tertiary,
+            border_color=border_default,
             height=80,
             corner_radius=10
         )
-        desc_entry.pack(fill="x", pady=(0, 16))
+        desc_entry.pack(fill="x", padx=24, pady=(0, 16))
         
         # 工作模式选择
         mode_label = ctk.CTkLabel(
-            content,
+            dialog,
             text="选择工作模式",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            text_color=ThemeConfig.TEXT_SECONDARY
+            font=_font(family="Microsoft YaHei", size=13),
+            text_color=text_secondary
         )
-        mode_label.pack(anchor="w", pady=(0, 10))
+        mode_label.pack(anchor="w", padx=24, pady=(0, 10))
         
         mode_var = ctk.StringVar(value="planning")
         
-        mode_frame = ctk.CTkFrame(content, fg_color="transparent")
-        mode_frame.pack(fill="x", pady=(0, 16))
+        mode_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        mode_frame.pack(fill="x", padx=24, pady=(0, 16))
         
         # 规划模式
         planning_radio = ctk.CTkRadioButton(
@@ -2306,8 +2867,8 @@ class ResearchTerminal(ctk.CTk):
             text="📊 规划模式 - 我知道怎么做",
             variable=mode_var,
             value="planning",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            text_color=ThemeConfig.TEXT_PRIMARY,
+            font=_font(family="Microsoft YaHei", size=13),
+            text_color=text_primary,
             fg_color=ThemeConfig.ACCENT_PLANNING
         )
         planning_radio.pack(anchor="w", pady=(0, 8))
@@ -2318,26 +2879,23 @@ class ResearchTerminal(ctk.CTk):
             text="🔍 探索模式 - 我需要探索方法",
             variable=mode_var,
             value="exploring",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            text_color=ThemeConfig.TEXT_PRIMARY,
+            font=_font(family="Microsoft YaHei", size=13),
+            text_color=text_primary,
             fg_color=ThemeConfig.ACCENT_EXPLORING
         )
         exploring_radio.pack(anchor="w")
         
         # 按钮
-        btn_frame = ctk.CTkFrame(content, fg_color="transparent")
-        btn_frame.pack(fill="x", pady=(16, 0))
+        btn_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        btn_frame.pack(fill="x", padx=24, pady=(16, 24))
         
         cancel_btn = ctk.CTkButton(
             btn_frame,
             text="取消",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=14),
-            fg_color=ThemeConfig.BG_TERTIARY,
-            hover_color=ThemeConfig.BG_HOVER,
-            text_color=ThemeConfig.TEXT_SECONDARY,
+            font=_font(family="Microsoft YaHei", size=14),
             height=40,
-            corner_radius=10,
-            command=dialog.destroy
+            command=dialog.destroy,
+            **_BTN_CANCEL_KW
         )
         cancel_btn.pack(side="left", fill="x", expand=True, padx=(0, 8))
         
@@ -2348,7 +2906,7 @@ class ResearchTerminal(ctk.CTk):
                 return
             
             mode = TaskMode.EXPLORING if mode_var.get() == "exploring" else TaskMode.PLANNING
-            knowledge = TaskKnowledge.KNOWN_WHAT_UNKNOWN_HOW if mode == TaskMode.EXPLORING else TaskKnowledge.KNOWN_WHAT_KNOWN_HOW
+            knowledge = TaskKnowledge.KNOWN_WHAT_UNKNOWN_HOW if mode is TaskMode.EXPLORING else TaskKnowledge.KNOWN_WHAT_KNOWN_HOW
             
             task = self.db.create_task(
                 title=title,
@@ -2358,18 +2916,15 @@ class ResearchTerminal(ctk.CTk):
             )
             
             dialog.destroy()
-            self._refresh_task_list()
-            self._select_task(task)
+            self._select_task(task, refresh=True)
         
         create_btn = ctk.CTkButton(
             btn_frame,
             text="创建任务",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=14, weight="bold"),
-            fg_color=ThemeConfig.ACCENT_PLANNING,
-            hover_color="#4A90D9",
+            font=_font(family="Microsoft YaHei", size=14, weight="bold"),
             height=40,
-            corner_radius=10,
-            command=create_task
+            command=create_task,
+            **_BTN_PRIMARY_KW
         )
         create_btn.pack(side="right", fill="x", expand=True)
     
@@ -2377,53 +2932,41 @@ class ResearchTerminal(ctk.CTk):
         """添加子任务对话框"""
         dialog = ctk.CTkToplevel(self)
         dialog.title("添加子任务")
-        dialog.geometry("450x240")
+        dialog.geometry(self._center_geometry(450, 240))
         dialog.transient(self)
         dialog.grab_set()
         dialog.configure(fg_color=ThemeConfig.BG_SECONDARY)
         
-        # 居中
-        dialog.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() - 450) // 2
-        y = self.winfo_y() + (self.winfo_height() - 240) // 2
-        dialog.geometry(f"+{x}+{y}")
-        
-        content = ctk.CTkFrame(dialog, fg_color="transparent")
-        content.pack(fill="both", expand=True, padx=24, pady=24)
-        
         title_label = ctk.CTkLabel(
-            content,
+            dialog,
             text="📋 添加子任务",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=18, weight="bold"),
+            font=_font(family="Microsoft YaHei", size=18, weight="bold"),
             text_color=ThemeConfig.TEXT_PRIMARY
         )
-        title_label.pack(anchor="w", pady=(0, 16))
+        title_label.pack(anchor="w", padx=24, pady=(24, 16))
         
         entry = ctk.CTkEntry(
-            content,
+            dialog,
             placeholder_text="输入子任务内容...",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=14),
+            font=_font(family="Microsoft YaHei", size=14),
             fg_color=ThemeConfig.BG_TERTIARY,
             border_color=ThemeConfig.BORDER_DEFAULT,
             height=42,
             corner_radius=10
         )
-        entry.pack(fill="x", pady=(0, 20))
+        entry.pack(fill="x", padx=24, pady=(0, 20))
         entry.focus()
         
-        btn_frame = ctk.CTkFrame(content, fg_color="transparent")
-        btn_frame.pack(fill="x")
+        btn_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        btn_frame.pack(fill="x", padx=24, pady=(0, 24))
         
         cancel_btn = ctk.CTkButton(
             btn_frame,
             text="取消",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
-            hover_color=ThemeConfig.BG_HOVER,
-            text_color=ThemeConfig.TEXT_SECONDARY,
+            font=_font(family="Microsoft YaHei", size=13),
             height=38,
-            corner_radius=10,
-            command=dialog.destroy
+            command=dialog.destroy,
+            **_BTN_CANCEL_KW
         )
         cancel_btn.pack(side="left", fill="x", expand=True, padx=(0, 8))
         
@@ -2438,12 +2981,10 @@ class ResearchTerminal(ctk.CTk):
         add_btn = ctk.CTkButton(
             btn_frame,
             text="添加",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13, weight="bold"),
-            fg_color=ThemeConfig.ACCENT_PLANNING,
-            hover_color="#4A90D9",
+            font=_font(family="Microsoft YaHei", size=13, weight="bold"),
             height=38,
-            corner_radius=10,
-            command=add
+            command=add,
+            **_BTN_PRIMARY_KW
         )
         add_btn.pack(side="right", fill="x", expand=True)
         
@@ -2451,102 +2992,87 @@ class ResearchTerminal(ctk.CTk):
     
     def _add_note_dialog(self, task: Task):
         """添加探索笔记对话框"""
-        dialog = ctk.CTkToplevel(self)
-        dialog.title("记录探索")
-        dialog.geometry("520x420")
-        dialog.resizable(False, False)
-        dialog.transient(self)
-        dialog.grab_set()
-        dialog.configure(fg_color=ThemeConfig.BG_SECONDARY)
+        def build(dialog):
+            dialog.resizable(False, False)
 
-        # 居中
-        dialog.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() - 520) // 2
-        y = self.winfo_y() + (self.winfo_height() - 420) // 2
-        dialog.geometry(f"+{x}+{y}")
+            title_label = ctk.CTkLabel(
+                dialog,
+                text="📝 记录探索",
+                font=_font(family="Microsoft YaHei", size=18, weight="bold"),
+                text_color=ThemeConfig.TEXT_PRIMARY
+            )
+            title_label.pack(anchor="w", padx=24, pady=(24, 16))
 
-        # 绑定窗口事件
-        dialog.bind("<Configure>", lambda e: self._on_dialog_configure(dialog))
+            # 探索内容
+            content_label = ctk.CTkLabel(
+                dialog,
+                text="你尝试了什么？发现了什么？",
+                font=_font(family="Microsoft YaHei", size=13),
+                text_color=ThemeConfig.TEXT_SECONDARY
+            )
+            content_label.pack(anchor="w", padx=24, pady=(0, 6))
 
-        content = ctk.CTkFrame(dialog, fg_color="transparent")
-        content.pack(fill="both", expand=True, padx=24, pady=24)
-        
-        title_label = ctk.CTkLabel(
-            content,
-            text="📝 记录探索",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=18, weight="bold"),
-            text_color=ThemeConfig.TEXT_PRIMARY
-        )
-        title_label.pack(anchor="w", pady=(0, 16))
-        
-        # 探索内容
-        content_label = ctk.CTkLabel(
-            content,
-            text="你尝试了什么？发现了什么？",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            text_color=ThemeConfig.TEXT_SECONDARY
-        )
-        content_label.pack(anchor="w", pady=(0, 6))
-        
-        content_entry = ctk.CTkTextbox(
-            content,
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
-            height=100,
-            corner_radius=10
-        )
-        content_entry.pack(fill="x", pady=(0, 16))
+            content_entry = ctk.CTkTextbox(
+                dialog,
+                font=_font(family="Microsoft YaHei", size=13),
+                fg_color=ThemeConfig.BG_TERTIARY,
+                height=100,
+                corner_radius=10
+            )
+            content_entry.pack(fill="x", padx=24, pady=(0, 16))
+
+            # 洞察
+            insight_label = ctk.CTkLabel(
+                dialog,
+                text="获得的洞察/启发（可选）",
+                font=_font(family="Microsoft YaHei", size=13),
+                text_color=ThemeConfig.TEXT_SECONDARY
+            )
+            insight_label.pack(anchor="w", padx=24, pady=(0, 6))
+
+            insight_entry = ctk.CTkEntry(
+                dialog,
+                placeholder_text="这次尝试给你带来了什么启发？",
+                font=_font(family="Microsoft YaHei", size=13),
+                fg_color=ThemeConfig.BG_TERTIARY,
+                border_color=ThemeConfig.BORDER_DEFAULT,
+                height=40,
+                corner_radius=10
+            )
+            insight_entry.pack(fill="x", padx=24, pady=(0, 12))
+
+            # 突破性发现
+            breakthrough_var = ctk.BooleanVar(value=False)
+            breakthrough_cb = ctk.CTkCheckBox(
+                dialog,
+                text="⭐ 这是一个突破性发现！",
+                variable=breakthrough_var,
+                font=_font(family="Microsoft YaHei", size=13),
+                text_color=ThemeConfig.ACCENT_WARNING,
+                fg_color=ThemeConfig.ACCENT_WARNING,
+                hover_color=ThemeConfig.ACCENT_WARNING
+            )
+            breakthrough_cb.pack(anchor="w", padx=24, pady=(0, 20))
+
+            save_btn = self._build_dialog_buttons(
+                dialog, "记录", ThemeConfig.ACCENT_EXPLORING, "#D97A35"
+            )
+            return {
+                "content": content_entry,
+                "insight": insight_entry,
+                "breakthrough": breakthrough_var,
+                "save": save_btn,
+            }
+
+        dialog, widgets = self._get_or_build_dialog("add_note", "记录探索", 520, 420, build)
+        content_entry = widgets["content"]
+        insight_entry = widgets["insight"]
+        breakthrough_var = widgets["breakthrough"]
+        content_entry.delete("1.0", "end")
+        insight_entry.delete(0, "end")
+        breakthrough_var.set(False)
         content_entry.focus()
-        
-        # 洞察
-        insight_label = ctk.CTkLabel(
-            content,
-            text="获得的洞察/启发（可选）",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            text_color=ThemeConfig.TEXT_SECONDARY
-        )
-        insight_label.pack(anchor="w", pady=(0, 6))
-        
-        insight_entry = ctk.CTkEntry(
-            content,
-            placeholder_text="这次尝试给你带来了什么启发？",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
-            border_color=ThemeConfig.BORDER_DEFAULT,
-            height=40,
-            corner_radius=10
-        )
-        insight_entry.pack(fill="x", pady=(0, 12))
-        
-        # 突破性发现
-        breakthrough_var = ctk.BooleanVar(value=False)
-        breakthrough_cb = ctk.CTkCheckBox(
-            content,
-            text="⭐ 这是一个突破性发现！",
-            variable=breakthrough_var,
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            text_color=ThemeConfig.ACCENT_WARNING,
-            fg_color=ThemeConfig.ACCENT_WARNING,
-            hover_color=ThemeConfig.ACCENT_WARNING
-        )
-        breakthrough_cb.pack(anchor="w", pady=(0, 20))
-        
-        btn_frame = ctk.CTkFrame(content, fg_color="transparent")
-        btn_frame.pack(fill="x")
-        
-        cancel_btn = ctk.CTkButton(
-            btn_frame,
-            text="取消",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
-            hover_color=ThemeConfig.BG_HOVER,
-            text_color=ThemeConfig.TEXT_SECONDARY,
-            height=38,
-            corner_radius=10,
-            command=dialog.destroy
-        )
-        cancel_btn.pack(side="left", fill="x", expand=True, padx=(0, 8))
-        
+
         def add():
             text = content_entry.get("1.0", "end-1c").strip()
             if text:
@@ -2556,421 +3082,227 @@ class ResearchTerminal(ctk.CTk):
                     insight_entry.get().strip(),
                     breakthrough_var.get()
                 )
-                dialog.destroy()
+                self._close_pooled_dialog(dialog)
                 self._show_task_detail(task)
-        
-        add_btn = ctk.CTkButton(
-            btn_frame,
-            text="记录",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13, weight="bold"),
-            fg_color=ThemeConfig.ACCENT_EXPLORING,
-            hover_color="#D97A35",
-            height=38,
-            corner_radius=10,
-            command=add
-        )
-        add_btn.pack(side="right", fill="x", expand=True)
-    
+
+        widgets["save"].configure(command=add)
+
     def _found_solution_dialog(self, task: Task):
         """找到解决方案对话框"""
-        dialog = ctk.CTkToplevel(self)
-        dialog.title("找到解决方案")
-        dialog.geometry("520x320")
-        dialog.transient(self)
-        dialog.grab_set()
-        dialog.configure(fg_color=ThemeConfig.BG_SECONDARY)
-        
-        # 居中
-        dialog.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() - 520) // 2
-        y = self.winfo_y() + (self.winfo_height() - 320) // 2
-        dialog.geometry(f"+{x}+{y}")
-        
-        content = ctk.CTkFrame(dialog, fg_color="transparent")
-        content.pack(fill="both", expand=True, padx=24, pady=24)
-        
-        title_label = ctk.CTkLabel(
-            content,
-            text="💡 找到解决方案",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=18, weight="bold"),
-            text_color=ThemeConfig.ACCENT_SUCCESS
-        )
-        title_label.pack(anchor="w", pady=(0, 8))
-        
-        hint_label = ctk.CTkLabel(
-            content,
-            text="记录你的解决方案，然后可以切换到规划模式进行任务拆解",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=12),
-            text_color=ThemeConfig.TEXT_MUTED
-        )
-        hint_label.pack(anchor="w", pady=(0, 16))
-        
-        solution_entry = ctk.CTkTextbox(
-            content,
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
-            height=120,
-            corner_radius=10
-        )
-        solution_entry.pack(fill="x", pady=(0, 20))
+        def build(dialog):
+            title_label = ctk.CTkLabel(
+                dialog,
+                text="💡 找到解决方案",
+                font=_font(family="Microsoft YaHei", size=18, weight="bold"),
+                text_color=ThemeConfig.ACCENT_SUCCESS
+            )
+            title_label.pack(anchor="w", padx=24, pady=(24, 8))
+
+            hint_label = ctk.CTkLabel(
+                dialog,
+                text="记录你的解决方案，然后可以切换到规划模式进行任务拆解",
+                font=_font(family="Microsoft YaHei", size=12),
+                text_color=ThemeConfig.TEXT_MUTED
+            )
+            hint_label.pack(anchor="w", padx=24, pady=(0, 16))
+
+            solution_entry = ctk.CTkTextbox(
+                dialog,
+                font=_font(family="Microsoft YaHei", size=13),
+                fg_color=ThemeConfig.BG_TERTIARY,
+                height=120,
+                corner_radius=10
+            )
+            solution_entry.pack(fill="x", padx=24, pady=(0, 20))
+
+            save_btn = self._build_dialog_buttons(
+                dialog, "保存并切换到规划模式", ThemeConfig.ACCENT_SUCCESS, "#2D9142"
+            )
+            return {"solution": solution_entry, "save": save_btn}
+
+        dialog, widgets = self._get_or_build_dialog("found_solution", "找到解决方案", 520, 320, build)
+        solution_entry = widgets["solution"]
+        solution_entry.delete("1.0", "end")
         solution_entry.focus()
-        
-        btn_frame = ctk.CTkFrame(content, fg_color="transparent")
-        btn_frame.pack(fill="x")
-        
-        cancel_btn = ctk.CTkButton(
-            btn_frame,
-            text="取消",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
-            hover_color=ThemeConfig.BG_HOVER,
-            text_color=ThemeConfig.TEXT_SECONDARY,
-            height=38,
-            corner_radius=10,
-            command=dialog.destroy
-        )
-        cancel_btn.pack(side="left", fill="x", expand=True, padx=(0, 8))
-        
+
         def save():
             solution = solution_entry.get("1.0", "end-1c").strip()
             if solution:
-                self.db.set_task_conclusion(task.id, solution)
-                self.db.switch_task_mode(task.id, to_exploring=False)
-                dialog.destroy()
-                # 重新获取更新后的任务
-                updated_task = self.db.get_task(task.id)
-                if updated_task:
-                    self._refresh_task_list()
-                    self._select_task(updated_task)
-                    self._refresh_tracker_if_visible()
-        
-        save_btn = ctk.CTkButton(
-            btn_frame,
-            text="保存并切换到规划模式",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13, weight="bold"),
-            fg_color=ThemeConfig.ACCENT_SUCCESS,
-            hover_color="#2D9142",
-            height=38,
-            corner_radius=10,
-            command=save
-        )
-        save_btn.pack(side="right", fill="x", expand=True)
-    
-    def _edit_task_title(self, task: Task):
-        """编辑任务标题"""
-        dialog = ctk.CTkToplevel(self)
-        dialog.title("编辑任务")
-        dialog.geometry("450x200")
-        dialog.transient(self)
-        dialog.grab_set()
-        dialog.configure(fg_color=ThemeConfig.BG_SECONDARY)
-        
-        # 居中
-        dialog.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() - 450) // 2
-        y = self.winfo_y() + (self.winfo_height() - 200) // 2
-        dialog.geometry(f"+{x}+{y}")
-        
-        content = ctk.CTkFrame(dialog, fg_color="transparent")
-        content.pack(fill="both", expand=True, padx=24, pady=24)
-        
-        title_label = ctk.CTkLabel(
-            content,
-            text="✏️ 编辑任务标题",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=18, weight="bold"),
-            text_color=ThemeConfig.TEXT_PRIMARY
-        )
-        title_label.pack(anchor="w", pady=(0, 16))
-        
-        entry = ctk.CTkEntry(
-            content,
-            font=ctk.CTkFont(family="Microsoft YaHei", size=14),
-            fg_color=ThemeConfig.BG_TERTIARY,
-            border_color=ThemeConfig.BORDER_DEFAULT,
-            height=42,
-            corner_radius=10
-        )
-        entry.pack(fill="x", pady=(0, 20))
-        entry.insert(0, task.title)
-        entry.focus()
-        entry.select_range(0, "end")
-        
-        btn_frame = ctk.CTkFrame(content, fg_color="transparent")
-        btn_frame.pack(fill="x")
-        
-        cancel_btn = ctk.CTkButton(
-            btn_frame,
-            text="取消",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
-            hover_color=ThemeConfig.BG_HOVER,
-            text_color=ThemeConfig.TEXT_SECONDARY,
-            height=38,
-            corner_radius=10,
-            command=dialog.destroy
-        )
-        cancel_btn.pack(side="left", fill="x", expand=True, padx=(0, 8))
-        
-        def save():
-            new_title = entry.get().strip()
-            if new_title:
-                self.db.update_task(task.id, title=new_title)
-                dialog.destroy()
-                updated_task = self.db.get_task(task.id)
-                if updated_task:
-                    self._refresh_task_list()
-                    self._show_task_detail(updated_task)
-                    self._refresh_tracker_if_visible()
-        
-        save_btn = ctk.CTkButton(
-            btn_frame,
-            text="保存",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13, weight="bold"),
-            fg_color=ThemeConfig.ACCENT_PLANNING,
-            hover_color="#4A90D9",
-            height=38,
-            corner_radius=10,
-            command=save
-        )
-        save_btn.pack(side="right", fill="x", expand=True)
-
-    def _edit_task_dialog(self, task: Task):
-        """编辑任务标题与描述"""
-        dialog = ctk.CTkToplevel(self)
-        dialog.title("编辑任务")
-        dialog.geometry("520x420")
-        dialog.transient(self)
-        dialog.grab_set()
-        dialog.configure(fg_color=ThemeConfig.BG_SECONDARY)
+                self.db.finish_exploration(task.id, solution)
+                self._close_pooled_dialog(dialog)
+                self._schedule_post_save(task.id, select=True)
 
-        dialog.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() - 520) // 2
-        y = self.winfo_y() + (self.winfo_height() - 420) // 2
-        dialog.geometry(f"+{x}+{y}")
+        widgets["save"].configure(command=save)
 
-        content = ctk.CTkFrame(dialog, fg_color="transparent")
-        content.pack(fill="both", expand=True, padx=24, pady=24)
-
-        title_label = ctk.CTkLabel(
-            content,
-            text="📝 编辑任务",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=18, weight="bold"),
-            text_color=ThemeConfig.TEXT_PRIMARY
-        )
-        title_label.pack(anchor="w", pady=(0, 16))
-
-        title_entry = ctk.CTkEntry(
-            content,
-            font=ctk.CTkFont(family="Microsoft YaHei", size=14),
-            fg_color=ThemeConfig.BG_TERTIARY,
-            border_color=ThemeConfig.BORDER_DEFAULT,
-            height=40,
-            corner_radius=10
-        )
-        title_entry.pack(fill="x", pady=(0, 12))
-        title_entry.insert(0, task.title)
+    def _edit_text_dialog(self, window_title: str, title_text: str, width: int, height: int,
+                          fields: list, on_save: Callable):
+        """通用编辑对话框
 
-        desc_entry = ctk.CTkTextbox(
-            content,
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
-            height=180,
-            corner_radius=10
-        )
-        desc_entry.pack(fill="x", pady=(0, 20))
-        if task.description:
-            desc_entry.insert("1.0", task.description)
+        fields 为 [(kind, initial, height)]，kind 为 "entry" 或 "textbox"，字段布局相同的对话框共用一个复用外壳。
+        保存时按顺序把各字段内容（已去除首尾空白）传给 on_save，on_save 返回 False 时保持对话框打开。
+        """
+        layout = tuple((kind, field_height) for kind, _, field_height in fields)
 
-        btn_frame = ctk.CTkFrame(content, fg_color="transparent")
-        btn_frame.pack(fill="x")
+        def build(dialog):
+            title_label = ctk.CTkLabel(
+                dialog,
+                font=_font(family="Microsoft YaHei", size=18, weight="bold"),
+                text_color=ThemeConfig.TEXT_PRIMARY
+            )
+            title_label.pack(anchor="w", padx=24, pady=(24, 16))
+
+            inputs = []
+            for index, (kind, field_height) in enumerate(layout):
+                if kind == "entry":
+                    widget = ctk.CTkEntry(
+                        dialog,
+                        font=_font(family="Microsoft YaHei", size=14),
+                        fg_color=ThemeConfig.BG_TERTIARY,
+                        border_color=ThemeConfig.BORDER_DEFAULT,
+                        height=field_height,
+                        corner_radius=10
+                    )
+                else:
+                    widget = ctk.CTkTextbox(
+                        dialog,
+                        font=_font(family="Microsoft YaHei", size=13),
+                        fg_color=ThemeConfig.BG_TERTIARY,
+                        height=field_height,
+                        corner_radius=10
+                    )
+                widget.pack(fill="x", padx=24, pady=(0, 20 if index == len(layout) - 1 else 12))
+                inputs.append(widget)
 
-        cancel_btn = ctk.CTkButton(
-            btn_frame,
-            text="取消",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
-            hover_color=ThemeConfig.BG_HOVER,
-            text_color=ThemeConfig.TEXT_SECONDARY,
-            height=38,
-            corner_radius=10,
-            command=dialog.destroy
-        )
-        cancel_btn.pack(side="left", fill="x", expand=True, padx=(0, 8))
+            save_btn = self._build_dialog_buttons(
+                dialog, "保存", ThemeConfig.ACCENT_PLANNING, "#4A90D9"
+            )
+            return {"title": title_label, "inputs": inputs, "save": save_btn}
+
+        kind_key = "edit_text:" + ",".join(f"{kind}{field_height}" for kind, field_height in layout)
+        dialog, widgets = self._get_or_build_dialog(kind_key, window_title, width, height, build)
+        dialog.title(window_title)
+        widgets["title"].configure(text=title_text)
+
+        inputs = widgets["inputs"]
+        for widget, (kind, initial, _) in zip(inputs, fields):
+            if kind == "entry":
+                widget.delete(0, "end")
+                widget.insert(0, initial)
+            else:
+                widget.delete("1.0", "end")
+                widget.insert("1.0", initial)
+        inputs[0].focus()
+        if fields[0][0] == "entry":
+            inputs[0].select_range(0, "end")
 
         def save():
-            new_title = title_entry.get().strip()
-            new_desc = desc_entry.get("1.0", "end-1c").strip()
-            if new_title:
-                self.db.update_task(task.id, title=new_title, description=new_desc)
-                dialog.destroy()
-                updated_task = self.db.get_task(task.id)
-                if updated_task:
-                    self._refresh_task_list()
-                    self._show_task_detail(updated_task)
-                    self._refresh_tracker_if_visible()
-
-        save_btn = ctk.CTkButton(
-            btn_frame,
-            text="保存",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13, weight="bold"),
-            fg_color=ThemeConfig.ACCENT_PLANNING,
-            hover_color="#4A90D9",
-            height=38,
-            corner_radius=10,
-            command=save
-        )
-        save_btn.pack(side="right", fill="x", expand=True)
-
-    def _edit_task_description(self, task: Task):
-        """编辑任务描述"""
-        dialog = ctk.CTkToplevel(self)
-        dialog.title("编辑任务描述")
-        dialog.geometry("520x360")
-        dialog.transient(self)
-        dialog.grab_set()
-        dialog.configure(fg_color=ThemeConfig.BG_SECONDARY)
+            values = [
+                widget.get().strip() if kind == "entry" else widget.get("1.0", "end-1c").strip()
+                for widget, (kind, _) in zip(inputs, layout)
+            ]
+            if on_save(*values) is not False:
+                self._close_pooled_dialog(dialog)
 
-        dialog.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() - 520) // 2
-        y = self.winfo_y() + (self.winfo_height() - 360) // 2
-        dialog.geometry(f"+{x}+{y}")
+        widgets["save"].configure(command=save)
 
-        content = ctk.CTkFrame(dialog, fg_color="transparent")
-        content.pack(fill="both", expand=True, padx=24, pady=24)
-
-        title_label = ctk.CTkLabel(
-            content,
-            text="✏️ 编辑任务描述",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=18, weight="bold"),
-            text_color=ThemeConfig.TEXT_PRIMARY
-        )
-        title_label.pack(anchor="w", pady=(0, 16))
+    def _edit_task_title(self, task: Task):
+        """编辑任务标题"""
+        def on_save(new_title):
+            if not new_title:
+                return False
+            self.db.update_task(task.id, title=new_title)
+            self._schedule_post_save(task.id)
 
-        desc_entry = ctk.CTkTextbox(
-            content,
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
-            height=160,
-            corner_radius=10
+        self._edit_text_dialog(
+            "编辑任务", "✏️ 编辑任务标题", 450, 200, [("entry", task.title, 42)], on_save
         )
-        desc_entry.pack(fill="x", pady=(0, 20))
-        if task.description:
-            desc_entry.insert("1.0", task.description)
-        desc_entry.focus()
 
-        btn_frame = ctk.CTkFrame(content, fg_color="transparent")
-        btn_frame.pack(fill="x")
+    def _edit_task_dialog(self, task: Task):
+        """编辑任务标题与描述"""
+        def on_save(new_title, new_desc):
+            if not new_title:
+                return False
+            self.db.update_task(task.id, title=new_title, description=new_desc)
+            self._schedule_post_save(task.id)
 
-        cancel_btn = ctk.CTkButton(
-            btn_frame,
-            text="取消",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
-            hover_color=ThemeConfig.BG_HOVER,
-            text_color=ThemeConfig.TEXT_SECONDARY,
-            height=38,
-            corner_radius=10,
-            command=dialog.destroy
+        self._edit_text_dialog(
+            "编辑任务", "📝 编辑任务", 520, 420,
+            [("entry", task.title, 40), ("textbox", task.description, 180)],
+            on_save
         )
-        cancel_btn.pack(side="left", fill="x", expand=True, padx=(0, 8))
 
-        def save():
-            new_desc = desc_entry.get("1.0", "end-1c").strip()
+    def _edit_task_description(self, task: Task):
+        """编辑任务描述"""
+        def on_save(new_desc):
             self.db.update_task(task.id, description=new_desc)
-            dialog.destroy()
-            updated_task = self.db.get_task(task.id)
-            if updated_task:
-                self._refresh_task_list()
-                self._show_task_detail(updated_task)
-                self._refresh_tracker_if_visible()
+            self._schedule_post_save(task.id)
 
-        save_btn = ctk.CTkButton(
-            btn_frame,
-            text="保存",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13, weight="bold"),
-            fg_color=ThemeConfig.ACCENT_PLANNING,
-            hover_color="#4A90D9",
-            height=38,
-            corner_radius=10,
-            command=save
+        self._edit_text_dialog(
+            "编辑任务描述", "✏️ 编辑任务描述", 520, 360, [("textbox", task.description, 160)], on_save
         )
-        save_btn.pack(side="right", fill="x", expand=True)
 
     def _edit_subtask_dialog(self, task: Task, subtask: SubTask):
         """编辑子任务对话框"""
-        dialog = ctk.CTkToplevel(self)
-        dialog.title("编辑子任务")
-        dialog.geometry("520x420")
-        dialog.transient(self)
-        dialog.grab_set()
-        dialog.configure(fg_color=ThemeConfig.BG_SECONDARY)
+        def build(dialog):
+            bg_tertiary = ThemeConfig.BG_TERTIARY
+            border_default = ThemeConfig.BORDER_DEFAULT
 
-        dialog.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() - 520) // 2
-        y = self.winfo_y() + (self.winfo_height() - 420) // 2
-        dialog.geometry(f"+{x}+{y}")
-
-        content = ctk.CTkFrame(dialog, fg_color="transparent")
-        content.pack(fill="both", expand=True, padx=24, pady=24)
+            title_label = ctk.CTkLabel(
+                dialog,
+                text="✏️ 编辑子任务",
+                font=_font(family="Microsoft YaHei", size=18, weight="bold"),
+                text_color=ThemeConfig.TEXT_PRIMARY
+            )
+            title_label.pack(anchor="w", padx=24, pady=(24, 16))
+
+            title_entry = ctk.CTkEntry(
+                dialog,
+                font=_font(family="Microsoft YaHei", size=14),
+                fg_color=bg_tertiary,
+                border_color=border_default,
+                height=40,
+                corner_radius=10
+            )
+            title_entry.pack(fill="x", padx=24, pady=(0, 12))
+
+            desc_entry = ctk.CTkTextbox(
+                dialog,
+                font=_font(family="Microsoft YaHei", size=13),
+                fg_color=bg_tertiary,
+                height=120,
+                corner_radius=10
+            )
+            desc_entry.pack(fill="x", padx=24, pady=(0, 12))
+
+            notes_entry = ctk.CTkEntry(
+                dialog,
+                placeholder_text="备注（可选）",
+                font=_font(family="Microsoft YaHei", size=13),
+                fg_color=bg_tertiary,
+                border_color=border_default,
+                height=36,
+                corner_radius=10
+            )
+            notes_entry.pack(fill="x", padx=24, pady=(0, 20))
 
-        title_label = ctk.CTkLabel(
-            content,
-            text="✏️ 编辑子任务",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=18, weight="bold"),
-            text_color=ThemeConfig.TEXT_PRIMARY
-        )
-        title_label.pack(anchor="w", pady=(0, 16))
+            save_btn = self._build_dialog_buttons(
+                dialog, "保存", ThemeConfig.ACCENT_PLANNING, "#4A90D9"
+            )
+            return {"title": title_entry, "description": desc_entry, "notes": notes_entry, "save": save_btn}
 
-        title_entry = ctk.CTkEntry(
-            content,
-            font=ctk.CTkFont(family="Microsoft YaHei", size=14),
-            fg_color=ThemeConfig.BG_TERTIARY,
-            border_color=ThemeConfig.BORDER_DEFAULT,
-            height=40,
-            corner_radius=10
-        )
-        title_entry.pack(fill="x", pady=(0, 12))
+        dialog, widgets = self._get_or_build_dialog("edit_subtask", "编辑子任务", 520, 420, build)
+        title_entry = widgets["title"]
+        desc_entry = widgets["description"]
+        notes_entry = widgets["notes"]
+        title_entry.delete(0, "end")
         title_entry.insert(0, subtask.title)
-
-        desc_entry = ctk.CTkTextbox(
-            content,
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
-            height=120,
-            corner_radius=10
-        )
-        desc_entry.pack(fill="x", pady=(0, 12))
+        desc_entry.delete("1.0", "end")
         if subtask.description:
             desc_entry.insert("1.0", subtask.description)
-
-        notes_entry = ctk.CTkEntry(
-            content,
-            placeholder_text="备注（可选）",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
-            border_color=ThemeConfig.BORDER_DEFAULT,
-            height=36,
-            corner_radius=10
-        )
-        notes_entry.pack(fill="x", pady=(0, 20))
+        notes_entry.delete(0, "end")
         if subtask.notes:
             notes_entry.insert(0, subtask.notes)
-
-        btn_frame = ctk.CTkFrame(content, fg_color="transparent")
-        btn_frame.pack(fill="x")
-
-        cancel_btn = ctk.CTkButton(
-            btn_frame,
-            text="取消",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
-            hover_color=ThemeConfig.BG_HOVER,
-            text_color=ThemeConfig.TEXT_SECONDARY,
-            height=38,
-            corner_radius=10,
-            command=dialog.destroy
-        )
-        cancel_btn.pack(side="left", fill="x", expand=True, padx=(0, 8))
+        title_entry.focus()
 
         def save():
             new_title = title_entry.get().strip()
@@ -2984,107 +3316,29 @@ class ResearchTerminal(ctk.CTk):
                     description=new_desc,
                     notes=new_notes
                 )
-                dialog.destroy()
-                updated_task = self.db.get_task(task.id)
-                if updated_task:
-                    self._show_task_detail(updated_task)
-                    self._refresh_tracker_if_visible()
-                    self._refresh_tracker_if_visible()
+                self._close_pooled_dialog(dialog)
+                self._schedule_post_save(task.id, refresh_list=False)
 
-        save_btn = ctk.CTkButton(
-            btn_frame,
-            text="保存",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13, weight="bold"),
-            fg_color=ThemeConfig.ACCENT_PLANNING,
-            hover_color="#4A90D9",
-            height=38,
-            corner_radius=10,
-            command=save
-        )
-        save_btn.pack(side="right", fill="x", expand=True)
+        widgets["save"].configure(command=save)
 
     def _edit_conclusion_dialog(self, task: Task):
         """编辑探索结论对话框"""
-        dialog = ctk.CTkToplevel(self)
-        dialog.title("编辑探索结论")
-        dialog.geometry("520x360")
-        dialog.transient(self)
-        dialog.grab_set()
-        dialog.configure(fg_color=ThemeConfig.BG_SECONDARY)
-
-        dialog.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() - 520) // 2
-        y = self.winfo_y() + (self.winfo_height() - 360) // 2
-        dialog.geometry(f"+{x}+{y}")
-
-        content = ctk.CTkFrame(dialog, fg_color="transparent")
-        content.pack(fill="both", expand=True, padx=24, pady=24)
-
-        title_label = ctk.CTkLabel(
-            content,
-            text="✏️ 编辑探索结论",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=18, weight="bold"),
-            text_color=ThemeConfig.TEXT_PRIMARY
-        )
-        title_label.pack(anchor="w", pady=(0, 16))
-
-        entry = ctk.CTkTextbox(
-            content,
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
-            height=160,
-            corner_radius=10
-        )
-        entry.pack(fill="x", pady=(0, 20))
-        if task.conclusion:
-            entry.insert("1.0", task.conclusion)
-        entry.focus()
-
-        btn_frame = ctk.CTkFrame(content, fg_color="transparent")
-        btn_frame.pack(fill="x")
-
-        cancel_btn = ctk.CTkButton(
-            btn_frame,
-            text="取消",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
-            hover_color=ThemeConfig.BG_HOVER,
-            text_color=ThemeConfig.TEXT_SECONDARY,
-            height=38,
-            corner_radius=10,
-            command=dialog.destroy
-        )
-        cancel_btn.pack(side="left", fill="x", expand=True, padx=(0, 8))
+        def on_save(new_text):
+            if not new_text:
+                return False
+            self.db.set_task_conclusion(task.id, new_text)
+            self._schedule_post_save(task.id, refresh_list=False)
 
-        def save():
-            new_text = entry.get("1.0", "end-1c").strip()
-            if new_text:
-                self.db.set_task_conclusion(task.id, new_text)
-                dialog.destroy()
-                updated_task = self.db.get_task(task.id)
-                if updated_task:
-                    self._show_task_detail(updated_task)
-                    self._refresh_tracker_if_visible()
-
-        save_btn = ctk.CTkButton(
-            btn_frame,
-            text="保存",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13, weight="bold"),
-            fg_color=ThemeConfig.ACCENT_PLANNING,
-            hover_color="#4A90D9",
-            height=38,
-            corner_radius=10,
-            command=save
+        self._edit_text_dialog(
+            "编辑探索结论", "✏️ 编辑探索结论", 520, 360, [("textbox", task.conclusion, 160)], on_save
         )
-        save_btn.pack(side="right", fill="x", expand=True)
 
     def _clear_conclusion(self, task: Task):
         """清除探索结论"""
-        confirm = messagebox.askyesno("确认清除", "确定要清除当前结论吗？")
+        confirm = self._confirm("确认清除", "确定要清除当前结论吗？")
         if not confirm:
             return
-        self.db.clear_task_conclusion(task.id)
-        updated_task = self.db.get_task(task.id)
+        updated_task = self.db.clear_task_conclusion(task.id)
         if updated_task:
             self._show_task_detail(updated_task)
             self._refresh_tracker_if_visible()
@@ -3105,25 +3359,32 @@ class ResearchTerminal(ctk.CTk):
             self.tracker_window_visible = True
 
     def _refresh_tracker_if_visible(self):
-        """如果追踪窗口可见，刷新它"""
+        """如果追踪窗口可见，刷新它（50ms 内的多次请求合并为一次）"""
+        if self._tracker_refresh_after_id is not None:
+            return
+        self._tracker_refresh_after_id = self.after(50, self._run_tracker_refresh)
+
+    def _run_tracker_refresh(self):
+        """执行合并后的追踪窗口刷新"""
+        self._tracker_refresh_after_id = None
         if self.tracker_window and self.tracker_window_visible:
             self.tracker_window._refresh_tracker()
 
     def _show_move_note_dialog(self, current_task: Task, note: ExplorationNote):
         """显示移动笔记对话框"""
+        bg_tertiary = ThemeConfig.BG_TERTIARY
+        bg_hover = ThemeConfig.BG_HOVER
+        text_primary = ThemeConfig.TEXT_PRIMARY
+        text_secondary = ThemeConfig.TEXT_SECONDARY
+        text_muted = ThemeConfig.TEXT_MUTED
+
         dialog = ctk.CTkToplevel(self)
         dialog.title("移动探索笔记")
-        dialog.geometry("520x480")  # 增加高度
+        dialog.geometry(self._center_geometry(520, 480))
         dialog.transient(self)
         dialog.grab_set()
         dialog.configure(fg_color=ThemeConfig.BG_SECONDARY)
 
-        # 居中
-        dialog.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() - 520) // 2
-        y = self.winfo_y() + (self.winfo_height() - 480) // 2
-        dialog.geometry(f"+{x}+{y}")
-
         content = ctk.CTkFrame(dialog, fg_color="transparent")
         content.pack(fill="both", expand=True, padx=24, pady=24)
         content.grid_columnconfigure(0, weight=1)
@@ -3132,20 +3393,20 @@ class ResearchTerminal(ctk.CTk):
         title_label = ctk.CTkLabel(
             content,
             text="➡️ 移动探索笔记",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=20, weight="bold"),
-            text_color=ThemeConfig.TEXT_PRIMARY
+            font=_font(family="Microsoft YaHei", size=20, weight="bold"),
+            text_color=text_primary
         )
         title_label.grid(row=0, column=0, sticky="w", pady=(0, 16))
 
         # 笔记预览
-        preview_frame = ctk.CTkFrame(content, fg_color=ThemeConfig.BG_TERTIARY, corner_radius=10)
+        preview_frame = ctk.CTkFrame(content, fg_color=bg_tertiary, corner_radius=10)
         preview_frame.grid(row=1, column=0, sticky="ew", pady=(0, 16))
 
         preview_label = ctk.CTkLabel(
             preview_frame,
-            text=f"'{note.content[:100]}{'...' if len(note.content) > 100 else ''}'",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=12),
-            text_color=ThemeConfig.TEXT_MUTED,
+            text=note.preview,
+            font=_font(family="Microsoft YaHei", size=12),
+            text_color=text_muted,
             wraplength=460,
             justify="left"
         )
@@ -3158,8 +3419,8 @@ class ResearchTerminal(ctk.CTk):
         target_label = ctk.CTkLabel(
             target_frame,
             text="选择目标任务",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            text_color=ThemeConfig.TEXT_SECONDARY
+            font=_font(family="Microsoft YaHei", size=13),
+            text_color=text_secondary
         )
         target_label.pack(anchor="w", pady=(0, 12))
 
@@ -3167,13 +3428,12 @@ class ResearchTerminal(ctk.CTk):
         target_task_id = ctk.StringVar(value="")
 
         # 任务列表（排除当前任务）
-        all_tasks = self.db.get_all_tasks()
-        tasks = [t for t in all_tasks if t.id != current_task.id]
+        tasks = self.db.get_other_tasks(current_task.id)
 
         # 任务列表滚动容器
         scrollable = ctk.CTkScrollableFrame(
             target_frame,
-            fg_color=ThemeConfig.BG_TERTIARY,
+            fg_color=bg_tertiary,
             corner_radius=10,
             height=140,
             width=460
@@ -3184,35 +3444,38 @@ class ResearchTerminal(ctk.CTk):
         selected_label = ctk.CTkLabel(
             content,
             text="已选择：无",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=12),
-            text_color=ThemeConfig.TEXT_MUTED
+            font=_font(family="Microsoft YaHei", size=12),
+            text_color=text_muted
         )
         selected_label.grid(row=3, column=0, sticky="w", pady=(4, 0))
 
-        def select_target(task: Task):
-            target_task_id.set(task.id)
-            selected_label.configure(text=f"已选择：{task.title}")
+        def select_target(task_id: str, title: str):
+            target_task_id.set(task_id)
+            selected_label.configure(text=f"已选择：{title}")
+
+        def create_target_button(index: int, item: tuple):
+            task_id, title = item
+            btn = ctk.CTkButton(
+                scrollable,
+                text=f"📝 {title}",
+                font=_font(family="Microsoft YaHei", size=12),
+                text_color=text_primary,
+                fg_color=bg_hover,
+                hover_color=ThemeConfig.ACCENT_PLANNING,
+                height=32,
+                corner_radius=8,
+                command=lambda: select_target(task_id, title)
+            )
+            btn.pack(fill="x", padx=12, pady=6)
 
         if tasks:
-            for task in tasks:
-                btn = ctk.CTkButton(
-                    scrollable,
-                    text=f"📝 {task.title}",
-                    font=ctk.CTkFont(family="Microsoft YaHei", size=12),
-                    text_color=ThemeConfig.TEXT_PRIMARY,
-                    fg_color=ThemeConfig.BG_HOVER,
-                    hover_color=ThemeConfig.ACCENT_PLANNING,
-                    height=32,
-                    corner_radius=8,
-                    command=lambda t=task: select_target(t)
-                )
-                btn.pack(fill="x", padx=12, pady=6)
+            self._lazy_render(scrollable, tasks, create_target_button)
         else:
             empty_label = ctk.CTkLabel(
                 scrollable,
                 text="暂无可移动的目标任务",
-                font=ctk.CTkFont(family="Microsoft YaHei", size=14),
-                text_color=ThemeConfig.TEXT_MUTED
+                font=_font(family="Microsoft YaHei", size=14),
+                text_color=text_muted
             )
             empty_label.pack(pady=30)
 
@@ -3223,10 +3486,10 @@ class ResearchTerminal(ctk.CTk):
         cancel_btn = ctk.CTkButton(
             btn_frame,
             text="取消",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
-            hover_color=ThemeConfig.BG_HOVER,
-            text_color=ThemeConfig.TEXT_SECONDARY,
+            font=_font(family="Microsoft YaHei", size=13),
+            fg_color=bg_tertiary,
+            hover_color=bg_hover,
+            text_color=text_secondary,
             height=38,
             corner_radius=10,
             command=dialog.destroy
@@ -3244,12 +3507,13 @@ class ResearchTerminal(ctk.CTk):
 
                 if success:
                     dialog.destroy()
-                    self._refresh_task_list()
 
-                    # 跳转到目标任务
+                    # 跳转到目标任务（同时刷新任务列表）
                     target_task = self.db.get_task(target_id)
                     if target_task:
-                        self._select_task(target_task)
+                        self._select_task(target_task, refresh=True)
+                    else:
+                        self._refresh_task_list()
                     
                     messagebox.showinfo("成功", "笔记已移动")
                 else:
@@ -3260,7 +3524,7 @@ class ResearchTerminal(ctk.CTk):
         move_btn = ctk.CTkButton(
             btn_frame,
             text="移动",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13, weight="bold"),
+            font=_font(family="Microsoft YaHei", size=13, weight="bold"),
             fg_color=ThemeConfig.ACCENT_SUCCESS,
             hover_color="#2D9142",
             height=38,
@@ -3271,88 +3535,83 @@ class ResearchTerminal(ctk.CTk):
 
     def _show_edit_history_note_dialog(self, task: Task, note: ExplorationNote):
         """编辑探索记录笔记对话框"""
+        bg_tertiary = ThemeConfig.BG_TERTIARY
+        text_secondary = ThemeConfig.TEXT_SECONDARY
+        accent_warning = ThemeConfig.ACCENT_WARNING
+
         dialog = ctk.CTkToplevel(self)
         dialog.title("编辑探索记录笔记")
-        dialog.geometry("520x480")
+        dialog.geometry(self._center_geometry(520, 480))
         dialog.resizable(False, False)
         dialog.transient(self)
         dialog.grab_set()
         dialog.configure(fg_color=ThemeConfig.BG_SECONDARY)
 
-        # 居中
-        dialog.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() - 520) // 2
-        y = self.winfo_y() + (self.winfo_height() - 480) // 2
-        dialog.geometry(f"+{x}+{y}")
-
-        content = ctk.CTkFrame(dialog, fg_color="transparent")
-        content.pack(fill="both", expand=True, padx=24, pady=24)
-
         title_label = ctk.CTkLabel(
-            content,
+            dialog,
             text="✏️ 编辑探索笔记",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=18, weight="bold"),
+            font=_font(family="Microsoft YaHei", size=18, weight="bold"),
             text_color=ThemeConfig.TEXT_PRIMARY
         )
-        title_label.pack(anchor="w", pady=(0, 16))
+        title_label.pack(anchor="w", padx=24, pady=(24, 16))
 
         # 探索内容
         content_label = ctk.CTkLabel(
-            content,
+            dialog,
             text="笔记内容",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            text_color=ThemeConfig.TEXT_SECONDARY
+            font=_font(family="Microsoft YaHei", size=13),
+            text_color=text_secondary
         )
-        content_label.pack(anchor="w", pady=(0, 6))
+        content_label.pack(anchor="w", padx=24, pady=(0, 6))
 
         content_entry = ctk.CTkTextbox(
-            content,
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
+            dialog,
+            font=_font(family="Microsoft YaHei", size=13),
+            fg_color=bg_tertiary,
             height=100,
             corner_radius=10
         )
-        content_entry.pack(fill="x", pady=(0, 16))
+        content_entry.pack(fill="x", padx=24, pady=(0, 16))
         content_entry.insert("1.0", note.content)
         content_entry.focus()
 
         # 洞察
         insight_label = ctk.CTkLabel(
-            content,
+            dialog,
             text="获得的洞察/启发（可选）",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            text_color=ThemeConfig.TEXT_SECONDARY
+            font=_font(family="Microsoft YaHei", size=13),
+            text_color=text_secondary
         )
-        insight_label.pack(anchor="w", pady=(0, 6))
+        insight_label.pack(anchor="w", padx=24, pady=(0, 6))
 
         insight_entry = ctk.CTkEntry(
-            content,
+            dialog,
             placeholder_text="这次尝试给你带来了什么启发？",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
+            font=_font(family="Microsoft YaHei", size=13),
+            fg_color=bg_tertiary,
             border_color=ThemeConfig.BORDER_DEFAULT,
             height=40,
             corner_radius=10
         )
-        insight_entry.pack(fill="x", pady=(0, 12))
+        insight_entry.pack(fill="x", padx=24, pady=(0, 12))
         if note.insight:
             insight_entry.insert(0, note.insight)
 
         # 突破性发现
         breakthrough_var = ctk.BooleanVar(value=note.is_breakthrough)
         breakthrough_cb = ctk.CTkCheckBox(
-            content,
+            dialog,
             text="⭐ 这是一个突破性发现！",
             variable=breakthrough_var,
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            text_color=ThemeConfig.ACCENT_WARNING,
-            fg_color=ThemeConfig.ACCENT_WARNING,
-            hover_color=ThemeConfig.ACCENT_WARNING
+            font=_font(family="Microsoft YaHei", size=13),
+            text_color=accent_warning,
+            fg_color=accent_warning,
+            hover_color=accent_warning
         )
-        breakthrough_cb.pack(anchor="w", pady=(0, 20))
+        breakthrough_cb.pack(anchor="w", padx=24, pady=(0, 20))
 
-        btn_frame = ctk.CTkFrame(content, fg_color="transparent")
-        btn_frame.pack(fill="x")
+        btn_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        btn_frame.pack(fill="x", padx=24, pady=(0, 24))
 
         def save():
             new_content = content_entry.get("1.0", "end").strip()
@@ -3382,7 +3641,7 @@ class ResearchTerminal(ctk.CTk):
         save_btn = ctk.CTkButton(
             btn_frame,
             text="💾 保存修改",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
+            font=_font(family="Microsoft YaHei", size=13),
             fg_color=ThemeConfig.ACCENT_SUCCESS,
             hover_color="#2D9142",
             height=38,
@@ -3394,10 +3653,10 @@ class ResearchTerminal(ctk.CTk):
         cancel_btn = ctk.CTkButton(
             btn_frame,
             text="取消",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
+            font=_font(family="Microsoft YaHei", size=13),
+            fg_color=bg_tertiary,
             hover_color=ThemeConfig.BG_HOVER,
-            text_color=ThemeConfig.TEXT_SECONDARY,
+            text_color=text_secondary,
             height=38,
             corner_radius=10,
             command=dialog.destroy
@@ -3406,196 +3665,255 @@ class ResearchTerminal(ctk.CTk):
 
     def _show_copy_note_dialog(self, current_task: Task, note: ExplorationNote):
         """显示复制笔记对话框"""
-        dialog = ctk.CTkToplevel(self)
-        dialog.title("复制探索笔记")
-        dialog.geometry("520x480")  # 增加高度
-        dialog.transient(self)
-        dialog.grab_set()
-        dialog.configure(fg_color=ThemeConfig.BG_SECONDARY)
-
-        # 居中
-        dialog.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() - 520) // 2
-        y = self.winfo_y() + (self.winfo_height() - 480) // 2
-        dialog.geometry(f"+{x}+{y}")
-
-        content = ctk.CTkFrame(dialog, fg_color="transparent")
-        content.pack(fill="both", expand=True, padx=24, pady=24)
-        content.grid_columnconfigure(0, weight=1)
-        content.grid_rowconfigure(2, weight=1)
-
-        title_label = ctk.CTkLabel(
-            content,
-            text="📋 复制探索笔记",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=20, weight="bold"),
-            text_color=ThemeConfig.TEXT_PRIMARY
-        )
-        title_label.grid(row=0, column=0, sticky="w", pady=(0, 16))
-
-        # 笔记预览
-        preview_frame = ctk.CTkFrame(content, fg_color=ThemeConfig.BG_TERTIARY, corner_radius=10)
-        preview_frame.grid(row=1, column=0, sticky="ew", pady=(0, 16))
-
-        preview_label = ctk.CTkLabel(
-            preview_frame,
-            text=f"'{note.content[:100]}{'...' if len(note.content) > 100 else ''}'",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=12),
-            text_color=ThemeConfig.TEXT_MUTED,
-            wraplength=460,
-            justify="left"
-        )
-        preview_label.pack(padx=16, pady=12)
+        def build(dialog):
+            content = ctk.CTkFrame(dialog, fg_color="transparent")
+            content.pack(fill="both", expand=True, padx=24, pady=24)
+            content.grid_columnconfigure(0, weight=1)
+            content.grid_rowconfigure(2, weight=1)
 
-        # 目标选择
-        target_frame = ctk.CTkFrame(content, fg_color="transparent")
-        target_frame.grid(row=2, column=0, sticky="nsew")
+            title_label = ctk.CTkLabel(
+                content,
+                text="📋 复制探索笔记",
+                font=_font(family="Microsoft YaHei", size=20, weight="bold"),
+                text_color=ThemeConfig.TEXT_PRIMARY
+            )
+            title_label.grid(row=0, column=0, sticky="w", pady=(0, 16))
 
-        target_label = ctk.CTkLabel(
-            target_frame,
-            text="选择目标任务",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            text_color=ThemeConfig.TEXT_SECONDARY
-        )
-        target_label.pack(anchor="w", pady=(0, 12))
+            # 笔记预览
+            preview_frame = ctk.CTkFrame(content, fg_color=ThemeConfig.BG_TERTIARY, corner_radius=10)
+            preview_frame.grid(row=1, column=0, sticky="ew", pady=(0, 16))
 
-        # 初始化目标任务ID变量（必须在使用前定义）
-        copy_target_task_id = ctk.StringVar(value="")
+            preview_label = ctk.CTkLabel(
+                preview_frame,
+                font=_font(family="Microsoft YaHei", size=12),
+                text_color=ThemeConfig.TEXT_MUTED,
+                wraplength=460,
+                justify="left"
+            )
+            preview_label.pack(padx=16, pady=12)
 
-        # 任务列表（排除当前任务）
-        tasks = [t for t in self.db.get_all_tasks() if t.id != current_task.id]
+            # 目标选择
+            target_frame = ctk.CTkFrame(content, fg_color="transparent")
+            target_frame.grid(row=2, column=0, sticky="nsew")
 
-        # 任务列表滚动容器
-        scrollable = ctk.CTkScrollableFrame(
-            target_frame,
-            fg_color=ThemeConfig.BG_TERTIARY,
-            corner_radius=10,
-            height=140,
-            width=460
-        )
-        scrollable.pack(fill="both", expand=True, pady=(0, 8))
+            target_label = ctk.CTkLabel(
+                target_frame,
+                text="选择目标任务",
+                font=_font(family="Microsoft YaHei", size=13),
+                text_color=ThemeConfig.TEXT_SECONDARY
+            )
+            target_label.pack(anchor="w", pady=(0, 12))
 
-        # 选择状态标签（放在scrollable之后）
-        selected_label = ctk.CTkLabel(
-            content,
-            text="已选择：无",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=12),
-            text_color=ThemeConfig.TEXT_MUTED
-        )
-        selected_label.grid(row=3, column=0, sticky="w", pady=(4, 0))
+            # 任务列表滚动容器
+            scrollable = ctk.CTkScrollableFrame(
+                target_frame,
+                fg_color=ThemeConfig.BG_TERTIARY,
+                corner_radius=10,
+                height=140,
+                width=460
+            )
+            scrollable.pack(fill="both", expand=True, pady=(0, 8))
 
-        def select_target(task: Task):
-            copy_target_task_id.set(task.id)
-            selected_label.configure(text=f"已选择：{task.title}")
+            empty_label = ctk.CTkLabel(
+                scrollable,
+                text="暂无可复制的目标任务",
+                font=_font(family="Microsoft YaHei", size=14),
+                text_color=ThemeConfig.TEXT_MUTED
+            )
 
-        if tasks:
-            for task in tasks:
-                btn = ctk.CTkButton(
+            # 选择状态标签（放在scrollable之后）
+            selected_label = ctk.CTkLabel(
+                content,
+                font=_font(family="Microsoft YaHei", size=12),
+                text_color=ThemeConfig.TEXT_MUTED
+            )
+            selected_label.grid(row=3, column=0, sticky="w", pady=(4, 0))
+
+            # 按钮
+            btn_frame = ctk.CTkFrame(content, fg_color="transparent")
+            btn_frame.grid(row=4, column=0, sticky="ew", pady=(20, 0))
+
+            cancel_btn = ctk.CTkButton(
+                btn_frame,
+                text="取消",
+                font=_font(family="Microsoft YaHei", size=13),
+                height=38,
+                command=lambda: self._close_pooled_dialog(dialog),
+                **_BTN_CANCEL_KW
+            )
+            cancel_btn.pack(side="left", fill="x", expand=True, padx=(0, 8))
+
+            copy_btn = ctk.CTkButton(
+                btn_frame,
+                text="复制",
+                font=_font(family="Microsoft YaHei", size=13, weight="bold"),
+                height=38,
+                **_BTN_PRIMARY_KW
+            )
+            copy_btn.pack(side="right", fill="x", expand=True)
+            return {
+                "preview": preview_label,
+                "scrollable": scrollable,
+                "empty": empty_label,
+                "selected": selected_label,
+                "target_buttons": [],
+                "copy": copy_btn,
+            }
+
+        dialog, widgets = self._get_or_build_dialog("copy_note", "复制探索笔记", 520, 480, build)
+        widgets["preview"].configure(
+            text=note.preview
+        )
+        selected_label = widgets["selected"]
+        selected_label.configure(text="已选择：无")
+        copy_target_task_id = ""
+
+        def select_target(task_id: str, title: str):
+            nonlocal copy_target_task_id
+            copy_target_task_id = task_id
+            selected_label.configure(text=f"已选择：{title}")
+
+        # 任务列表（排除当前任务）；目标按钮复用上次打开时创建的控件，只在数量不够时新建
+        tasks = self.db.get_other_tasks(current_task.id)
+        buttons = widgets["target_buttons"]
+        scrollable = widgets["scrollable"]
+        for button in buttons[len(tasks):]:
+            button.pack_forget()
+        for index, (task_id, title) in enumerate(tasks):
+            command = functools.partial(select_target, task_id, title)
+            if index < len(buttons):
+                buttons[index].configure(text=f"📝 {title}", command=command)
+            else:
+                buttons.append(ctk.CTkButton(
                     scrollable,
-                    text=f"📝 {task.title}",
-                    font=ctk.CTkFont(family="Microsoft YaHei", size=12),
+                    text=f"📝 {title}",
+                    font=_font(family="Microsoft YaHei", size=12),
                     text_color=ThemeConfig.TEXT_PRIMARY,
                     fg_color=ThemeConfig.BG_HOVER,
                     hover_color=ThemeConfig.ACCENT_PLANNING,
                     height=32,
                     corner_radius=8,
-                    command=lambda t=task: select_target(t)
-                )
-                btn.pack(fill="x", padx=12, pady=6)
+                    command=command
+                ))
+            if not buttons[index].winfo_manager():
+                buttons[index].pack(fill="x", padx=12, pady=6)
+        if tasks:
+            widgets["empty"].pack_forget()
         else:
-            empty_label = ctk.CTkLabel(
-                scrollable,
-                text="暂无可复制的目标任务",
-                font=ctk.CTkFont(family="Microsoft YaHei", size=14),
-                text_color=ThemeConfig.TEXT_MUTED
-            )
-            empty_label.pack(pady=30)
-
-        # 按钮
-        btn_frame = ctk.CTkFrame(content, fg_color="transparent")
-        btn_frame.grid(row=4, column=0, sticky="ew", pady=(20, 0))
-
-        cancel_btn = ctk.CTkButton(
-            btn_frame,
-            text="取消",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
-            hover_color=ThemeConfig.BG_HOVER,
-            text_color=ThemeConfig.TEXT_SECONDARY,
-            height=38,
-            corner_radius=10,
-            command=dialog.destroy
-        )
-        cancel_btn.pack(side="left", fill="x", expand=True, padx=(0, 8))
+            widgets["empty"].pack(pady=30)
+        scrollable._parent_canvas.yview_moveto(0)
 
         def copy():
-            if not copy_target_task_id.get():
-                from tkinter import messagebox
+            if not copy_target_task_id:
                 messagebox.showwarning("提示", "请选择目标任务")
                 return
 
-            new_note = self.db.copy_exploration_note(current_task.id, copy_target_task_id.get(), note.id)
-
-            if new_note:
-                dialog.destroy()
-                self._refresh_task_list()
+            result = self.db.copy_exploration_note(current_task.id, copy_target_task_id, note.id)
 
-                # 仍然留在当前任务，只是刷新
-                updated_task = self.db.get_task(current_task.id)
-                if updated_task:
-                    self._select_task(updated_task)
+            if result:
+                _, source_task = result
+                self._close_pooled_dialog(dialog)
+                # 仍然留在当前任务，刷新列表并重新显示
+                self._select_task(source_task, refresh=True)
 
-        copy_btn = ctk.CTkButton(
-            btn_frame,
-            text="复制",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13, weight="bold"),
-            fg_color=ThemeConfig.ACCENT_PLANNING,
-            hover_color="#4A90D9",
-            height=38,
-            corner_radius=10,
-            command=copy
-        )
-        copy_btn.pack(side="right", fill="x", expand=True)
+        widgets["copy"].configure(command=copy)
     
     # ==================== 操作方法 ====================
     
     def _toggle_task_mode(self, task: Task):
         """切换任务模式"""
-        to_exploring = task.mode == TaskMode.PLANNING
-        self.db.switch_task_mode(task.id, to_exploring)
-        updated_task = self.db.get_task(task.id)
+        to_exploring = task.mode is TaskMode.PLANNING
+        updated_task = self.db.switch_task_mode(task.id, to_exploring)
         if updated_task:
-            self._refresh_task_list()
-            self._select_task(updated_task)
+            self._select_task(updated_task, refresh=True)
         self._refresh_tracker_if_visible()
     
     def _toggle_subtask(self, task: Task, subtask: SubTask, completed: bool):
         """切换子任务状态"""
+        old_status = task.status
         if completed:
             self.db.complete_subtask(task.id, subtask.id)
         else:
             self.db.update_subtask(task.id, subtask.id, status=TaskStatus.PENDING, completed_at=None)
-        
-        updated_task = self.db.get_task(task.id)
-        if updated_task:
-            self._refresh_task_list()
-            self._show_task_detail(updated_task)
-        self._refresh_tracker_if_visible()
+        self._after_subtask_status_change(task, subtask, old_status)
 
     def _quick_complete_subtask(self, task: Task, subtask: SubTask):
         """快速完成子任务"""
+        old_status = task.status
         self.db.complete_subtask(task.id, subtask.id)
+        self._after_subtask_status_change(task, subtask, old_status)
+
+    def _after_subtask_status_change(self, task: Task, subtask: SubTask, old_status: TaskStatus):
+        """子任务完成状态变化后更新界面
+
+        优先就地修补子任务行、进度信息和任务卡片；任务在列表中的位置或可见性
+        可能变化（按修改时间排序、按状态筛选）时重建任务列表，详情无法修补时重建详情。
+        """
         updated_task = self.db.get_task(task.id)
         if updated_task:
-            self._refresh_task_list()
-            self._show_task_detail(updated_task)
+            list_changed = (
+                (updated_task.status is not old_status and self.filter_var.get() != "all")
+                or (not self._is_manual_sort_mode() and self._task_sort_field_var.get() == "updated_at")
+            )
+            card = self._selected_card_widget
+            if (list_changed or card is None or not card.winfo_exists()
+                    or card._task.id != updated_task.id or card._progress_bar is None):
+                self._refresh_task_list()
+            else:
+                self._patch_task_card_progress(card, updated_task)
+
+            entry = next((e for e in self._subtask_items if e["subtask"].id == subtask.id), None)
+            if entry is not None and entry["widget"].winfo_exists() and self._patch_subtask_header(updated_task):
+                self._patch_subtask_row(entry, subtask)
+            else:
+                self._show_task_detail(updated_task)
         self._refresh_tracker_if_visible()
+
+    def _patch_subtask_row(self, entry: dict, subtask: SubTask):
+        """按子任务的完成状态就地更新子任务行的边框、复选框和标题样式"""
+        is_completed = subtask.status is TaskStatus.COMPLETED
+        entry["widget"].configure(
+            border_color=ThemeConfig.ACCENT_SUCCESS if is_completed else ThemeConfig.BORDER_DEFAULT
+        )
+        if is_completed:
+            entry["checkbox"].select()
+        else:
+            entry["checkbox"].deselect()
+        entry["title"].configure(
+            font=_font(family="Microsoft YaHei", size=14, overstrike=is_completed),
+            text_color=ThemeConfig.TEXT_MUTED if is_completed else ThemeConfig.TEXT_PRIMARY
+        )
+
+    def _patch_subtask_header(self, task: Task) -> bool:
+        """就地更新子任务区标题栏的完成进度和"完成此步骤"按钮，按钮需要出现或消失时返回 False"""
+        header = self._subtask_header
+        if (header is None or header["task_id"] != task.id or header["progress"] is None
+                or not header["progress"].winfo_exists()):
+            return False
+        next_subtask = task.get_next_subtask()
+        quick_btn = header["quick"]
+        if (next_subtask is None) != (quick_btn is None):
+            return False
+        if quick_btn is not None:
+            quick_btn.configure(command=functools.partial(self._quick_complete_subtask, task, next_subtask))
+        completed = task.get_completed_count()
+        header["progress"].configure(text=f"已完成 {completed}/{len(task.subtasks)}")
+        return True
+
+    def _patch_task_card_progress(self, card, task: Task):
+        """就地更新任务卡片的状态文字和进度条"""
+        card._status_label.configure(
+            text=task.status.value,
+            text_color=TASK_STATUS_COLORS.get(task.status, ThemeConfig.TEXT_SECONDARY)
+        )
+        card._progress_bar.set(task.get_progress())
     
     def _delete_task(self, task: Task):
         """删除任务"""
         if messagebox.askyesno("确认删除", f"确定要删除任务 \"{task.title}\" 吗？"):
             self.db.delete_task(task.id)
             self.selected_task = None
-            self._refresh_task_list()
+            self._remove_task_card(task.id)
             self._show_welcome_screen()
             self._refresh_tracker_if_visible()
     
@@ -3611,7 +3929,7 @@ class ResearchTerminal(ctk.CTk):
         """删除笔记"""
         confirm = messagebox.askyesno(
             "确认删除",
-            f"确定要删除这条笔记吗?\n\n'{note.content[:100]}{'...' if len(note.content) > 100 else ''}'"
+            f"确定要删除这条笔记吗?\n\n{note.preview}"
         )
         if not confirm:
             return
@@ -3622,10 +3940,12 @@ class ResearchTerminal(ctk.CTk):
 
     # ==================== 任务拖拽排序 ====================
 
-    def _on_task_drag_start(self, event, card, task, index):
+    def _on_task_drag_start(self, event, card, task):
         """开始拖拽任务"""
-        if not self._is_manual_sort_mode() or self._drag_data.get("animating"):
+        if not self._is_manual_sort_mode():
             return
+        # 卡片顺序可能已被拖拽原地调整过，以卡片当前记录的位置为准
+        index = card._index
 
         self._drag_data["dragging"] = True
         self._drag_data["widget"] = card
@@ -3637,18 +3957,57 @@ class ResearchTerminal(ctk.CTk):
         self._drag_data["moved"] = False
         self._drag_data["drag_threshold"] = 3
 
+        # 拖拽开始时一次性换算其余卡片中心的屏幕坐标（自上而下递增），移动过程中不再调用 winfo_*
+        origin_y = card.master.winfo_rooty()
         self._drag_data["card_positions"] = []
+        centers = []
         for i, c in enumerate(self._task_cards):
+            original_y = c.winfo_y()
+            height = c.winfo_height()
             self._drag_data["card_positions"].append({
                 "card": c,
-                "original_y": c.winfo_y(),
-                "height": c.winfo_height(),
+                "original_y": original_y,
+                "height": height,
                 "index": i
             })
+            if i != index:
+                centers.append(origin_y + original_y + height / 2)
+        self._drag_data["centers"] = centers
+
+    def _defer_drag_motion(self, handler, event, *args) -> bool:
+        """拖拽移动事件节流：距上次处理不足 DRAG_MOTION_INTERVAL 时记下最新事件并返回 True
+
+        被推迟的事件在间隔到期后由 _flush_drag_motion 处理，期间更新的事件会覆盖它，
+        因此每帧最多处理一次移动，且最后一个位置不会丢失。
+        """
+        now = time.perf_counter()
+        wait = self._last_motion_ts + DRAG_MOTION_INTERVAL - now
+        if wait > 0:
+            self._pending_motion = (handler, event, args)
+            if self._motion_after_id is None:
+                self._motion_after_id = self.after(max(1, int(wait * 1000)), self._flush_drag_motion)
+            return True
+        self._last_motion_ts = now
+        self._pending_motion = None
+        return False
+
+    def _flush_drag_motion(self):
+        """立即处理被推迟的拖拽移动事件（定时器到期或拖拽结束时调用）"""
+        if self._motion_after_id is not None:
+            self.after_cancel(self._motion_after_id)
+            self._motion_after_id = None
+        pending = self._pending_motion
+        if pending is None:
+            return
+        handler, event, args = pending
+        self._last_motion_ts = 0.0
+        handler(event, *args)
 
     def _on_task_drag_motion(self, event, card):
         """拖拽任务移动中"""
-        if not self._drag_data["dragging"] or self._drag_data.get("animating"):
+        if not self._drag_data["dragging"]:
+            return
+        if self._defer_drag_motion(self._on_task_drag_motion, event, card):
             return
 
         dy = abs(event.y_root - self._drag_data["start_y"])
@@ -3662,32 +4021,15 @@ class ResearchTerminal(ctk.CTk):
                 fg_color="#2d333b"
             )
             card.lift()
-            for other_card in self._task_cards:
-                if other_card != card:
-                    other_card.configure(fg_color="#14181e")
 
         if not self._drag_data["moved"]:
             return
 
         try:
-            mouse_y = event.y_root
             current_index = self._drag_data["current_index"]
             original_index = self._drag_data["original_index"]
-            new_index = current_index
-
-            for i, pos_data in enumerate(self._drag_data["card_positions"]):
-                if i == original_index:
-                    continue
-                other_card = pos_data["card"]
-                card_top = other_card.winfo_rooty()
-                card_height = pos_data["height"]
-                card_center = card_top + card_height / 2
-
-                if mouse_y < card_center and i < current_index:
-                    new_index = i
-                    break
-                if mouse_y > card_center and i > current_index:
-                    new_index = i
+            # 落点 = 中心位于鼠标上方的其余卡片数
+            new_index = bisect.bisect_left(self._drag_data["centers"], event.y_root)
 
             if new_index != current_index:
                 self._animate_card_swap(current_index, new_index, original_index)
@@ -3700,59 +4042,84 @@ class ResearchTerminal(ctk.CTk):
         if from_index == to_index:
             return
 
-        dragged_card = self._task_cards[dragged_index]
-        dragged_height = dragged_card.winfo_height() + 12
+        dragged_height = self._drag_data["card_positions"][dragged_index]["height"] + 12
 
-        for i, card in enumerate(self._task_cards):
+        # 只有 from/to 之间的卡片让位状态会变化，其余卡片保持当前动画目标不动
+        for i in range(min(from_index, to_index), max(from_index, to_index) + 1):
             if i == dragged_index:
                 continue
-            original_pos = i
-            visual_pos = i
-            if to_index <= i < from_index and i < dragged_index:
-                visual_pos = i + 1
-            elif from_index < i <= to_index and i > dragged_index:
-                visual_pos = i - 1
-            elif to_index < dragged_index and i >= to_index and i < dragged_index:
-                visual_pos = i + 1
-            elif to_index > dragged_index and i > dragged_index and i <= to_index:
-                visual_pos = i - 1
-
-            offset = (visual_pos - original_pos) * dragged_height
-            self._smooth_move_card(card, offset)
+            shift = _drag_shift(i, to_index, dragged_index)
+            if shift != _drag_shift(i, from_index, dragged_index):
+                self._smooth_move_card(self._task_cards[i], shift * dragged_height)
 
     def _smooth_move_card(self, card, offset):
         """平滑移动卡片"""
-        try:
-            if not hasattr(card, '_original_pady'):
-                card._original_pady = 6
-
-            target_top_pady = card._original_pady + offset * 0.15
-            target_bottom_pady = card._original_pady - offset * 0.05
-            target_top_pady = max(-20, min(40, target_top_pady))
-            target_bottom_pady = max(2, min(20, target_bottom_pady))
-
-            def ease_animation(step=0, total_steps=4):
-                if step <= total_steps:
-                    progress = step / total_steps
-                    eased = 1 - (1 - progress) ** 2
-
-                    current_top = card._original_pady + (target_top_pady - card._original_pady) * eased
-                    current_bottom = card._original_pady + (target_bottom_pady - card._original_pady) * eased
-                    try:
-                        card.pack_configure(pady=(current_top, current_bottom))
-                    except Exception:
-                        pass
-                    if step < total_steps:
-                        self.after(12, lambda: ease_animation(step + 1, total_steps))
-
-            ease_animation()
-        except Exception:
-            pass
+        if not hasattr(card, '_original_pady'):
+            card._original_pady = 6
+
+        target_top_pady = card._original_pady + offset * 0.15
+        target_bottom_pady = card._original_pady - offset * 0.05
+        target_top_pady = max(-20, min(40, target_top_pady))
+        target_bottom_pady = max(2, min(20, target_bottom_pady))
+        self._start_pady_animation(card, target_top_pady, target_bottom_pady)
+
+    def _start_pady_animation(self, widget, target_top, target_bottom):
+        """登记一个 pady 缓动动画；同一控件的新动画覆盖旧动画，所有动画由 _anim_tick 统一推进"""
+        self._anim_touched.add(widget)
+        self._anim_jobs[widget] = {
+            "base": widget._original_pady,
+            "top": target_top,
+            "bottom": target_bottom,
+            "step": 0,
+        }
+        if self._anim_after_id is None:
+            self._anim_tick()
+
+    def _anim_tick(self):
+        """推进所有进行中的动画一帧：一次回调内完成全部 pack_configure，仍有动画时再排下一帧"""
+        self._anim_after_id = None
+        finished = []
+        for widget, job in self._anim_jobs.items():
+            eased = 1 - (1 - job["step"] / DRAG_ANIM_STEPS) ** 2
+            base = job["base"]
+            try:
+                widget.pack_configure(pady=(
+                    base + (job["top"] - base) * eased,
+                    base + (job["bottom"] - base) * eased
+                ))
+            except tk.TclError:
+                finished.append(widget)
+                continue
+            job["step"] += 1
+            if job["step"] > DRAG_ANIM_STEPS:
+                finished.append(widget)
+        for widget in finished:
+            del self._anim_jobs[widget]
+        if self._anim_jobs:
+            self._anim_after_id = self.after(DRAG_ANIM_INTERVAL, self._anim_tick)
+
+    def _stop_drag_animations(self):
+        """停止所有进行中的拖拽动画（拖拽结束复位前调用，避免残留帧覆盖复位结果）"""
+        self._anim_jobs.clear()
+        if self._anim_after_id is not None:
+            self.after_cancel(self._anim_after_id)
+            self._anim_after_id = None
+
+    def _reset_drag_pady(self):
+        """停止拖拽动画，并只把做过让位动画的控件复位到原始 pady"""
+        self._stop_drag_animations()
+        for widget in self._anim_touched:
+            try:
+                widget.pack_configure(pady=widget._original_pady)
+            except tk.TclError:
+                pass
+        self._anim_touched.clear()
 
     def _on_task_drag_end(self, event, task):
         """结束拖拽任务"""
         if not self._drag_data["dragging"]:
             return
+        self._flush_drag_motion()
 
         card = self._drag_data["widget"]
         original_index = self._drag_data["original_index"]
@@ -3765,46 +4132,51 @@ class ResearchTerminal(ctk.CTk):
         self._drag_data["moved"] = False
         self._drag_data["card_positions"] = []
 
-        for other_card in self._task_cards:
-            if hasattr(other_card, '_task'):
-                other_card.configure(fg_color=ThemeConfig.BG_TERTIARY)
-                accent = other_card._accent_color
-                is_selected = other_card._is_selected
-                other_card.configure(
-                    border_color=accent if is_selected else ThemeConfig.BORDER_DEFAULT,
-                    border_width=2
-                )
-                other_card.pack_configure(pady=6)
+        # 拖拽中只改动了被拖卡片的外观（一次 configure 复位），其余卡片只复位做过让位动画的 pady
+        if moved and hasattr(card, '_task'):
+            card.configure(
+                fg_color=ThemeConfig.BG_TERTIARY,
+                border_color=card._accent_color if card._is_selected else ThemeConfig.BORDER_DEFAULT,
+                border_width=2
+            )
+        self._reset_drag_pady()
 
         if not moved:
             self._select_task(task)
             return
 
         if current_index != original_index:
-            self._drag_data["animating"] = True
-            if current_index < original_index:
-                for _ in range(original_index - current_index):
-                    self.db.move_task(task.id, -1)
-            else:
-                for _ in range(current_index - original_index):
-                    self.db.move_task(task.id, 1)
-            self.after(50, lambda: self._finish_task_drag(task))
+            self.db.reorder_task(task.id, current_index - original_index)
+            self._finish_task_drag(original_index, current_index)
+
+    def _move_packed(self, items: list, from_index: int, to_index: int, widget_of: Callable = lambda x: x):
+        """把 items 中 from_index 处的条目原地移到 to_index，并同步调整控件的 pack 顺序与 _index
+
+        只移动一个控件，其余控件不销毁也不重建。
+        """
+        item = items.pop(from_index)
+        items.insert(to_index, item)
+        widget = widget_of(item)
+        if to_index + 1 < len(items):
+            widget.pack_configure(before=widget_of(items[to_index + 1]))
         else:
+            widget.pack_configure(after=widget_of(items[to_index - 1]))
+        for i in range(min(from_index, to_index), max(from_index, to_index) + 1):
+            widget_of(items[i])._index = i
+
+    def _finish_task_drag(self, from_index, to_index):
+        """完成拖拽后的刷新：列表未经筛选时原地调整卡片顺序，详情页与顺序无关无需重建"""
+        filtered = self.filter_var.get() != "all" or self.search_entry.get().strip()
+        if filtered or len(self._task_cards) <= max(from_index, to_index):
             self._refresh_task_list()
-
-    def _finish_task_drag(self, task):
-        """完成拖拽后的刷新"""
-        self._drag_data["animating"] = False
-        self._refresh_task_list()
-        if self.selected_task and self.selected_task.id == task.id:
-            self._show_task_detail(task)
+            return
+        self._move_packed(self._task_cards, from_index, to_index)
 
     # ==================== 子任务拖拽排序 ====================
 
-    def _on_subtask_drag_start(self, event, item, task, subtask, index):
+    def _on_subtask_drag_start(self, event, item, task, subtask):
         """开始拖拽子任务"""
-        if self._drag_data.get("animating"):
-            return
+        index = item._index
 
         self._drag_data["dragging"] = True
         self._drag_data["widget"] = item
@@ -3818,21 +4190,29 @@ class ResearchTerminal(ctk.CTk):
         self._drag_data["drag_threshold"] = 3
         self._drag_data["is_subtask"] = True
 
+        # 拖拽开始时一次性换算其余子任务中心的屏幕坐标（自上而下递增），移动过程中不再调用 winfo_*
+        origin_y = item.master.winfo_rooty()
         self._drag_data["subtask_positions"] = []
+        centers = []
         for i, item_data in enumerate(self._subtask_items):
             widget = item_data["widget"]
+            original_y = widget.winfo_y()
+            height = widget.winfo_height()
             self._drag_data["subtask_positions"].append({
                 "widget": widget,
-                "original_y": widget.winfo_y(),
-                "height": widget.winfo_height(),
+                "original_y": original_y,
+                "height": height,
                 "index": i
             })
+            if i != index:
+                centers.append(origin_y + original_y + height / 2)
+        self._drag_data["centers"] = centers
 
     def _on_subtask_drag_motion(self, event, item, parent_frame):
         """拖拽子任务移动中"""
         if not self._drag_data["dragging"] or not self._drag_data.get("is_subtask"):
             return
-        if self._drag_data.get("animating"):
+        if self._defer_drag_motion(self._on_subtask_drag_motion, event, item, parent_frame):
             return
 
         dy = abs(event.y_root - self._drag_data["start_y"])
@@ -3846,32 +4226,15 @@ class ResearchTerminal(ctk.CTk):
                 fg_color="#2d333b"
             )
             item.lift()
-            for other_item in self._subtask_items:
-                if other_item["widget"] != item:
-                    other_item["widget"].configure(fg_color="#14181e")
 
         if not self._drag_data["moved"]:
             return
 
         try:
-            mouse_y = event.y_root
             current_index = self._drag_data["current_index"]
             original_index = self._drag_data["original_index"]
-            new_index = current_index
-
-            for i, pos_data in enumerate(self._drag_data.get("subtask_positions", [])):
-                if i == original_index:
-                    continue
-                widget = pos_data["widget"]
-                widget_top = widget.winfo_rooty()
-                widget_height = pos_data["height"]
-                widget_center = widget_top + widget_height / 2
-
-                if mouse_y < widget_center and i < current_index:
-                    new_index = i
-                    break
-                if mouse_y > widget_center and i > current_index:
-                    new_index = i
+            # 落点 = 中心位于鼠标上方的其余子任务数
+            new_index = bisect.bisect_left(self._drag_data["centers"], event.y_root)
 
             if new_index != current_index:
                 self._animate_subtask_swap(current_index, new_index, original_index)
@@ -3884,55 +4247,34 @@ class ResearchTerminal(ctk.CTk):
         if from_index == to_index or not self._subtask_items:
             return
 
-        dragged_widget = self._subtask_items[dragged_index]["widget"]
-        dragged_height = dragged_widget.winfo_height() + 8
+        dragged_height = self._drag_data["subtask_positions"][dragged_index]["height"] + 8
 
-        for i, item_data in enumerate(self._subtask_items):
+        # 只有 from/to 之间的子任务让位状态会变化，其余子任务保持当前动画目标不动
+        for i in range(min(from_index, to_index), max(from_index, to_index) + 1):
             if i == dragged_index:
                 continue
-            widget = item_data["widget"]
-            original_pos = i
-            visual_pos = i
-            if to_index < dragged_index and i >= to_index and i < dragged_index:
-                visual_pos = i + 1
-            elif to_index > dragged_index and i > dragged_index and i <= to_index:
-                visual_pos = i - 1
-            offset = (visual_pos - original_pos) * dragged_height
-            self._smooth_move_subtask(widget, offset)
+            shift = _drag_shift(i, to_index, dragged_index)
+            if shift != _drag_shift(i, from_index, dragged_index):
+                self._smooth_move_subtask(self._subtask_items[i]["widget"], shift * dragged_height)
 
     def _smooth_move_subtask(self, widget, offset):
         """平滑移动子任务项"""
-        try:
-            if not hasattr(widget, '_original_pady'):
-                widget._original_pady = 4
-
-            target_top = widget._original_pady + offset * 0.12
-            target_bottom = widget._original_pady - offset * 0.04
-            target_top = max(-15, min(30, target_top))
-            target_bottom = max(2, min(15, target_bottom))
-
-            def ease_animation(step=0, total_steps=4):
-                if step <= total_steps:
-                    progress = step / total_steps
-                    eased = 1 - (1 - progress) ** 2
-                    current_top = widget._original_pady + (target_top - widget._original_pady) * eased
-                    current_bottom = widget._original_pady + (target_bottom - widget._original_pady) * eased
-                    try:
-                        widget.pack_configure(pady=(current_top, current_bottom))
-                    except Exception:
-                        pass
-                    if step < total_steps:
-                        self.after(12, lambda: ease_animation(step + 1, total_steps))
-
-            ease_animation()
-        except Exception:
-            pass
+        if not hasattr(widget, '_original_pady'):
+            widget._original_pady = 4
+
+        target_top = widget._original_pady + offset * 0.12
+        target_bottom = widget._original_pady - offset * 0.04
+        target_top = max(-15, min(30, target_top))
+        target_bottom = max(2, min(15, target_bottom))
+        self._start_pady_animation(widget, target_top, target_bottom)
 
     def _on_subtask_drag_end(self, event, subtask):
         """结束拖拽子任务"""
         if not self._drag_data["dragging"] or not self._drag_data.get("is_subtask"):
             return
+        self._flush_drag_motion()
 
+        item = self._drag_data["widget"]
         task = self._drag_data["task"]
         original_index = self._drag_data["original_index"]
         current_index = self._drag_data.get("current_index", original_index)
@@ -3946,125 +4288,124 @@ class ResearchTerminal(ctk.CTk):
         self._drag_data["moved"] = False
         self._drag_data["subtask_positions"] = []
 
-        for other_item in self._subtask_items:
-            is_completed = other_item["subtask"].status == TaskStatus.COMPLETED
-            other_item["widget"].configure(
+        # 拖拽中只改动了被拖子任务的外观（一次 configure 复位），其余子任务只复位做过让位动画的 pady
+        if moved:
+            is_completed = subtask.status is TaskStatus.COMPLETED
+            item.configure(
                 fg_color=ThemeConfig.BG_TERTIARY,
                 border_color=ThemeConfig.ACCENT_SUCCESS if is_completed else ThemeConfig.BORDER_DEFAULT,
                 border_width=1
             )
-            other_item["widget"].pack_configure(pady=4)
+        self._reset_drag_pady()
 
         if not moved:
             return
 
         if current_index != original_index:
-            self._drag_data["animating"] = True
-            if current_index < original_index:
-                for _ in range(original_index - current_index):
-                    self.db.move_subtask(task.id, subtask.id, -1)
-            else:
-                for _ in range(current_index - original_index):
-                    self.db.move_subtask(task.id, subtask.id, 1)
-            self.after(50, lambda: self._finish_subtask_drag(task))
+            self.db.reorder_subtask(task.id, subtask.id, current_index - original_index)
+            self._finish_subtask_drag(task, original_index, current_index)
 
-    def _finish_subtask_drag(self, task):
-        """完成子任务拖拽后的刷新"""
-        self._drag_data["animating"] = False
+    def _finish_subtask_drag(self, task, from_index, to_index):
+        """完成子任务拖拽后的刷新：原地调整子任务项顺序，不重建详情页
+
+        顺序变化后下一个待完成子任务可能改变，需同步修补"完成此步骤"按钮和追踪窗口。
+        """
         updated_task = self.db.get_task(task.id)
-        if updated_task:
+        if updated_task is None:
+            return
+        if len(self._subtask_items) > max(from_index, to_index):
+            self._move_packed(self._subtask_items, from_index, to_index, itemgetter("widget"))
+            if not self._patch_subtask_header(updated_task):
+                self._show_task_detail(updated_task)
+        else:
             self._show_task_detail(updated_task)
+        self._refresh_tracker_if_visible()
 
     def _edit_note_dialog(self, task: Task, note: ExplorationNote):
         """编辑探索笔记对话框"""
+        bg_tertiary = ThemeConfig.BG_TERTIARY
+        text_secondary = ThemeConfig.TEXT_SECONDARY
+        accent_warning = ThemeConfig.ACCENT_WARNING
+
         dialog = ctk.CTkToplevel(self)
         dialog.title("编辑探索笔记")
-        dialog.geometry("520x420")
+        dialog.geometry(self._center_geometry(520, 420))
         dialog.transient(self)
         dialog.grab_set()
         dialog.configure(fg_color=ThemeConfig.BG_SECONDARY)
 
-        # 居中
-        dialog.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() - 520) // 2
-        y = self.winfo_y() + (self.winfo_height() - 420) // 2
-        dialog.geometry(f"+{x}+{y}")
-
-        content = ctk.CTkFrame(dialog, fg_color="transparent")
-        content.pack(fill="both", expand=True, padx=24, pady=24)
-
         title_label = ctk.CTkLabel(
-            content,
+            dialog,
             text="✏️ 编辑探索笔记",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=18, weight="bold"),
+            font=_font(family="Microsoft YaHei", size=18, weight="bold"),
             text_color=ThemeConfig.TEXT_PRIMARY
         )
-        title_label.pack(anchor="w", pady=(0, 16))
+        title_label.pack(anchor="w", padx=24, pady=(24, 16))
 
         # 探索内容
         content_label = ctk.CTkLabel(
-            content,
+            dialog,
             text="你尝试了什么？发现了什么？",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            text_color=ThemeConfig.TEXT_SECONDARY
+            font=_font(family="Microsoft YaHei", size=13),
+            text_color=text_secondary
         )
-        content_label.pack(anchor="w", pady=(0, 6))
+        content_label.pack(anchor="w", padx=24, pady=(0, 6))
 
         content_entry = ctk.CTkTextbox(
-            content,
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
+            dialog,
+            font=_font(family="Microsoft YaHei", size=13),
+            fg_color=bg_tertiary,
             height=100,
             corner_radius=10
         )
-        content_entry.pack(fill="x", pady=(0, 16))
+        content_entry.pack(fill="x", padx=24, pady=(0, 16))
         content_entry.insert("1.0", note.content)
         content_entry.focus()
 
         # 洞察
         insight_label = ctk.CTkLabel(
-            content,
+            dialog,
             text="获得的洞察/启发（可选）",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            text_color=ThemeConfig.TEXT_SECONDARY
+            font=_font(family="Microsoft YaHei", size=13),
+            text_color=text_secondary
         )
-        insight_label.pack(anchor="w", pady=(0, 6))
+        insight_label.pack(anchor="w", padx=24, pady=(0, 6))
 
         insight_entry = ctk.CTkEntry(
-            content,
+            dialog,
             placeholder_text="这次尝试给你带来了什么启发？",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
+            font=_font(family="Microsoft YaHei", size=13),
+            fg_color=bg_tertiary,
             border_color=ThemeConfig.BORDER_DEFAULT,
             height=40,
             corner_radius=10
         )
-        insight_entry.pack(fill="x", pady=(0, 12))
+        insight_entry.pack(fill="x", padx=24, pady=(0, 12))
         insight_entry.insert(0, note.insight)
 
         # 突破性发现
         breakthrough_var = ctk.BooleanVar(value=note.is_breakthrough)
         breakthrough_cb = ctk.CTkCheckBox(
-            content,
+            dialog,
             text="⭐ 这是一个突破性发现！",
             variable=breakthrough_var,
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            text_color=ThemeConfig.ACCENT_WARNING,
-            fg_color=ThemeConfig.ACCENT_WARNING,
-            hover_color=ThemeConfig.ACCENT_WARNING
+            font=_font(family="Microsoft YaHei", size=13),
+            text_color=accent_warning,
+            fg_color=accent_warning,
+            hover_color=accent_warning
         )
-        breakthrough_cb.pack(anchor="w", pady=(0, 20))
+        breakthrough_cb.pack(anchor="w", padx=24, pady=(0, 20))
 
-        btn_frame = ctk.CTkFrame(content, fg_color="transparent")
-        btn_frame.pack(fill="x")
+        btn_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        btn_frame.pack(fill="x", padx=24, pady=(0, 24))
 
         cancel_btn = ctk.CTkButton(
             btn_frame,
             text="取消",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13),
-            fg_color=ThemeConfig.BG_TERTIARY,
+            font=_font(family="Microsoft YaHei", size=13),
+            fg_color=bg_tertiary,
             hover_color=ThemeConfig.BG_HOVER,
-            text_color=ThemeConfig.TEXT_SECONDARY,
+            text_color=text_secondary,
             height=38,
             corner_radius=10,
             command=dialog.destroy
@@ -4074,7 +4415,7 @@ class ResearchTerminal(ctk.CTk):
         def save():
             content_text = content_entry.get("1.0", "end-1c").strip()
             if content_text:
-                self.db.update_exploration_note(
+                updated_note = self.db.update_exploration_note(
                     task.id,
                     note.id,
                     content=content_text,
@@ -4082,6 +4423,10 @@ class ResearchTerminal(ctk.CTk):
                     is_breakthrough=breakthrough_var.get()
                 )
                 dialog.destroy()
+                if updated_note is None:
+                    return
+                if self._replace_note_item(task, updated_note):
+                    return
                 updated_task = self.db.get_task(task.id)
                 if updated_task:
                     self._show_task_detail(updated_task)
@@ -4089,7 +4434,7 @@ class ResearchTerminal(ctk.CTk):
         save_btn = ctk.CTkButton(
             btn_frame,
             text="保存",
-            font=ctk.CTkFont(family="Microsoft YaHei", size=13, weight="bold"),
+            font=_font(family="Microsoft YaHei", size=13, weight="bold"),
             fg_color=ThemeConfig.ACCENT_PLANNING,
             hover_color="#4A90D9",
             height=38,
@@ -4100,9 +4445,44 @@ class ResearchTerminal(ctk.CTk):
 
     # ==================== 探索笔记拖拽排序 ====================
 
+    def _tag_note_draggable(self, widget):
+        """给控件加上笔记拖拽绑定标签
+
+        CustomTkinter 控件实际接收事件的是内部的 canvas / label，标签需要加在它们身上。
+        """
+        for target in (widget, getattr(widget, "_canvas", None), getattr(widget, "_label", None)):
+            if target is not None:
+                target.bindtags((NOTE_DRAG_TAG,) + target.bindtags())
+
+    def _note_drag_target(self, event):
+        """从事件控件向上查找所属的笔记项，返回 (task, note, item)"""
+        widget = event.widget
+        while widget is not None and not isinstance(widget, str):
+            entry = self._widget_to_note.get(str(widget))
+            if entry is not None:
+                return entry
+            widget = widget.master
+        return None
+
+    def _on_note_drag_start_dispatch(self, event):
+        entry = self._note_drag_target(event)
+        if entry is not None:
+            task, note, item = entry
+            self._on_note_drag_start(event, item, task, note, item._index)
+
+    def _on_note_drag_motion_dispatch(self, event):
+        entry = self._note_drag_target(event)
+        if entry is not None:
+            self._on_note_drag_motion(event, entry[2])
+
+    def _on_note_drag_end_dispatch(self, event):
+        entry = self._note_drag_target(event)
+        if entry is not None:
+            self._on_note_drag_end(event, entry[1])
+
     def _on_note_drag_start(self, event, item, task, note, index):
         """开始拖拽探索笔记"""
-        if not self._is_note_manual_sort_mode() or self._drag_data.get("animating"):
+        if not self._is_note_manual_sort_mode():
             return
         self._drag_data["dragging"] = True
         self._drag_data["widget"] = item
@@ -4114,18 +4494,20 @@ class ResearchTerminal(ctk.CTk):
         self._drag_data["current_index"] = index
         self._drag_data["moved"] = False
         self._drag_data["drag_threshold"] = 3
-        self._drag_data["note_positions"] = []
+        # 拖拽开始时一次性换算其余笔记中心的屏幕坐标（自上而下递增），移动过程中不再调用 winfo_*
+        origin_y = item.master.winfo_rooty()
+        centers = []
         for i, item_data in enumerate(self._note_items):
-            widget = item_data["widget"]
-            self._drag_data["note_positions"].append({
-                "widget": widget,
-                "height": widget.winfo_height(),
-                "index": i
-            })
+            if i != index:
+                widget = item_data["widget"]
+                centers.append(origin_y + widget.winfo_y() + widget.winfo_height() / 2)
+        self._drag_data["centers"] = centers
 
     def _on_note_drag_motion(self, event, item):
         """拖拽探索笔记移动中"""
-        if not self._drag_data["dragging"] or self._drag_data.get("animating"):
+        if not self._drag_data["dragging"]:
+            return
+        if self._defer_drag_motion(self._on_note_drag_motion, event, item):
             return
         dy = abs(event.y_root - self._drag_data["start_y"])
         dx = abs(event.x_root - self._drag_data["start_x"])
@@ -4133,27 +4515,12 @@ class ResearchTerminal(ctk.CTk):
             self._drag_data["moved"] = True
             item.configure(border_color=ThemeConfig.ACCENT_WARNING, border_width=2, fg_color="#2d333b")
             item.lift()
-            for other_item in self._note_items:
-                if other_item["widget"] != item:
-                    other_item["widget"].configure(fg_color="#14181e")
         if not self._drag_data["moved"]:
             return
         try:
-            mouse_y = event.y_root
             current_index = self._drag_data["current_index"]
-            original_index = self._drag_data["original_index"]
-            new_index = current_index
-            for i, pos_data in enumerate(self._drag_data.get("note_positions", [])):
-                if i == original_index:
-                    continue
-                widget = pos_data["widget"]
-                widget_top = widget.winfo_rooty()
-                widget_center = widget_top + pos_data["height"] / 2
-                if mouse_y < widget_center and i < current_index:
-                    new_index = i
-                    break
-                if mouse_y > widget_center and i > current_index:
-                    new_index = i
+            # 落点 = 中心位于鼠标上方的其余笔记数
+            new_index = bisect.bisect_left(self._drag_data["centers"], event.y_root)
             if new_index != current_index:
                 self._drag_data["current_index"] = new_index
         except Exception:
@@ -4163,6 +4530,8 @@ class ResearchTerminal(ctk.CTk):
         """结束拖拽探索笔记"""
         if not self._drag_data["dragging"]:
             return
+        self._flush_drag_motion()
+        item = self._drag_data["widget"]
         task = self._drag_data["task"]
         original_index = self._drag_data["original_index"]
         current_index = self._drag_data.get("current_index", original_index)
@@ -4172,28 +4541,29 @@ class ResearchTerminal(ctk.CTk):
         self._drag_data["task"] = None
         self._drag_data["note"] = None
         self._drag_data["moved"] = False
-        self._drag_data["note_positions"] = []
-        for other_item in self._note_items:
-            other_item["widget"].configure(
-                fg_color=ThemeConfig.BG_TERTIARY,
-                border_color=ThemeConfig.BORDER_DEFAULT if not other_item["note"].is_breakthrough else ThemeConfig.ACCENT_WARNING,
-                border_width=2 if other_item["note"].is_breakthrough else 1
-            )
+        self._drag_data["centers"] = []
         if not moved:
             return
+        # 拖拽中只改动了被拖笔记的外观，一次 configure 复位它即可
+        if note.is_breakthrough:
+            reset = {"fg_color": ThemeConfig.BG_TERTIARY, "border_color": ThemeConfig.ACCENT_WARNING, "border_width": 2}
+        else:
+            reset = {"fg_color": ThemeConfig.BG_TERTIARY, "border_color": ThemeConfig.BORDER_DEFAULT, "border_width": 1}
+        item.configure(**reset)
         if current_index != original_index:
-            self._drag_data["animating"] = True
-            if current_index < original_index:
-                for _ in range(original_index - current_index):
-                    self.db.move_exploration_note_order(task.id, note.id, -1)
-            else:
-                for _ in range(current_index - original_index):
-                    self.db.move_exploration_note_order(task.id, note.id, 1)
-            self.after(50, lambda: self._finish_note_drag(task))
+            self._finish_note_drag(task, note, original_index, current_index)
 
-    def _finish_note_drag(self, task):
-        """完成探索笔记拖拽后的刷新"""
-        self._drag_data["animating"] = False
+    def _finish_note_drag(self, task, note, from_index, to_index):
+        """完成探索笔记拖拽：先原地调整笔记控件顺序，写库推迟到空闲时执行
+
+        界面不等待保存（包括生成写盘快照）即可看到新顺序；
+        无法原地调整时先写库再重建详情页。
+        """
+        if self._note_items_task_id == task.id and len(self._note_items) > max(from_index, to_index):
+            self._move_packed(self._note_items, from_index, to_index, itemgetter("widget"))
+            self.after_idle(functools.partial(self.db.set_exploration_note_order, task.id, note.id, to_index))
+            return
+        self.db.set_exploration_note_order(task.id, note.id, to_index)
         updated_task = self.db.get_task(task.id)
         if updated_task:
             self._show_task_detail(updated_task)
@@ -4201,7 +4571,11 @@ class ResearchTerminal(ctk.CTk):
 def main():
     """程序入口"""
     app = ResearchTerminal()
-    app.mainloop()
+    try:
+        app.mainloop()
+    finally:
+        # 退出前等待后台写盘完成
+        app.db.close()
 
 
 if __name__ == "__main__":
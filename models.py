@@ -49,7 +49,7 @@ class TaskKnowledge(Enum):
     UNKNOWN_WHAT = "待明确目标"
 
 
-@dataclass
+@dataclass(slots=True)
 class ExplorationNote:
     """探索笔记 - 记录探索过程中的发现和思路"""
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -58,9 +58,21 @@ class ExplorationNote:
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)  # 最后修改时间
     is_breakthrough: bool = False  # 是否是突破性发现
+    # 预览缓存 (原文, 预览)，内容变化时自动失效；原文初始为 None，保证首次访问必定生成
+    _preview_cache: tuple[Optional[str], str] = field(default=(None, ""), init=False, repr=False, compare=False)
 
+    @property
+    def preview(self) -> str:
+        """截断到100字的内容预览（带引号），用于对话框展示"""
+        source, text = self._preview_cache
+        if source is not self.content:
+            content = self.content
+            text = f"'{content[:100]}{'...' if len(content) > 100 else ''}'"
+            self._preview_cache = (content, text)
+        return text
 
-@dataclass
+
+@dataclass(slots=True)
 class ExplorationNoteSearchResult:
     """探索笔记搜索结果"""
     task_id: str
@@ -70,7 +82,7 @@ class ExplorationNoteSearchResult:
     is_history: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SubTask:
     """子任务"""
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -83,7 +95,7 @@ class SubTask:
     notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """主任务"""
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -109,49 +121,123 @@ class Task:
     priority: int = 0  # 0-低, 1-中, 2-高
     tags: list[str] = field(default_factory=list)
     conclusion: str = ""  # 探索模式的最终结论/解决方案
+
+    # 子任务索引：ID -> 子任务，以及已完成子任务数；
+    # 经由本类方法的增删改会同步维护，直接改动 subtasks 后需调用 reindex_subtasks()
+    _subtask_by_id: dict[str, SubTask] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _completed_subtask_count: int = field(default=0, init=False, repr=False, compare=False)
+    # 探索笔记索引：ID -> 笔记；直接改动 exploration_notes 后需调用 reindex_notes()
+    _note_by_id: dict[str, ExplorationNote] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.reindex_subtasks()
+        self.reindex_notes()
+
+    def reindex_subtasks(self) -> None:
+        """根据 subtasks 重建子任务索引和已完成计数"""
+        self._subtask_by_id = {st.id: st for st in self.subtasks}
+        self._completed_subtask_count = sum(1 for st in self.subtasks if st.status is TaskStatus.COMPLETED)
+
+    def get_subtask(self, subtask_id: str) -> Optional[SubTask]:
+        """根据ID获取子任务"""
+        return self._subtask_by_id.get(subtask_id)
     
     def add_subtask(self, title: str, description: str = "") -> SubTask:
         """添加子任务"""
+        now = datetime.now()
         subtask = SubTask(
             title=title,
             description=description,
-            order=len(self.subtasks)
+            order=len(self.subtasks),
+            created_at=now
         )
         self.subtasks.append(subtask)
-        self.updated_at = datetime.now()
+        self._subtask_by_id[subtask.id] = subtask
+        self.updated_at = now
         return subtask
+
+    def remove_subtask(self, subtask_id: str) -> bool:
+        """删除子任务，并重新编号剩余子任务的顺序"""
+        subtask = self._subtask_by_id.pop(subtask_id, None)
+        if subtask is None:
+            return False
+        self.subtasks.remove(subtask)
+        if subtask.status is TaskStatus.COMPLETED:
+            self._completed_subtask_count -= 1
+        for i, remaining in enumerate(self.subtasks):
+            remaining.order = i
+        self.updated_at = datetime.now()
+        return True
     
+    def reindex_notes(self) -> None:
+        """根据 exploration_notes 重建探索笔记索引"""
+        self._note_by_id = {note.id: note for note in self.exploration_notes}
+
+    def get_exploration_note(self, note_id: str) -> Optional[ExplorationNote]:
+        """根据ID获取探索笔记"""
+        return self._note_by_id.get(note_id)
+
     def add_exploration_note(self, content: str, insight: str = "", is_breakthrough: bool = False) -> ExplorationNote:
         """添加探索笔记"""
+        now = datetime.now()
         note = ExplorationNote(
             content=content,
             insight=insight,
+            created_at=now,
+            updated_at=now,
             is_breakthrough=is_breakthrough
         )
+        self.append_exploration_note(note)
+        self.updated_at = now
+        return note
+
+    def append_exploration_note(self, note: ExplorationNote) -> None:
+        """将已有笔记追加到末尾（移动、复制、合并笔记时使用），不修改时间戳"""
         self.exploration_notes.append(note)
+        self._note_by_id[note.id] = note
+
+    def remove_exploration_note(self, note_id: str) -> Optional[ExplorationNote]:
+        """移除探索笔记并返回它；不存在时返回 None"""
+        note = self._note_by_id.pop(note_id, None)
+        if note is None:
+            return None
+        self.exploration_notes.remove(note)
         self.updated_at = datetime.now()
         return note
     
+    def get_completed_count(self) -> int:
+        """获取已完成的子任务数"""
+        return self._completed_subtask_count
+
+    def get_next_subtask(self) -> Optional[SubTask]:
+        """获取顺序最靠前的未完成子任务；全部完成时直接返回 None，无需扫描"""
+        if self._completed_subtask_count == len(self.subtasks):
+            return None
+        done = TaskStatus.COMPLETED
+        return min((st for st in self.subtasks if st.status is not done), key=lambda st: st.order)
+
     def get_progress(self) -> float:
         """获取任务进度 (0.0 - 1.0)"""
         if not self.subtasks:
-            return 1.0 if self.status == TaskStatus.COMPLETED else 0.0
-        completed = sum(1 for st in self.subtasks if st.status == TaskStatus.COMPLETED)
-        return completed / len(self.subtasks)
+            return 1.0 if self.status is TaskStatus.COMPLETED else 0.0
+        return self._completed_subtask_count / len(self.subtasks)
     
     def complete_subtask(self, subtask_id: str) -> bool:
         """完成子任务"""
-        for st in self.subtasks:
-            if st.id == subtask_id:
-                st.status = TaskStatus.COMPLETED
-                st.completed_at = datetime.now()
-                self.updated_at = datetime.now()
-                # 检查是否所有子任务都完成
-                if all(s.status == TaskStatus.COMPLETED for s in self.subtasks):
-                    self.status = TaskStatus.COMPLETED
-                    self.completed_at = datetime.now()
-                return True
-        return False
+        st = self._subtask_by_id.get(subtask_id)
+        if st is None:
+            return False
+        if st.status is not TaskStatus.COMPLETED:
+            self._completed_subtask_count += 1
+        now = datetime.now()
+        st.status = TaskStatus.COMPLETED
+        st.completed_at = now
+        self.updated_at = now
+        # 检查是否所有子任务都完成
+        if self._completed_subtask_count == len(self.subtasks):
+            self.status = TaskStatus.COMPLETED
+            self.completed_at = now
+        return True
     
     def switch_to_exploring(self) -> None:
         """切换到探索模式"""